@@ -12,6 +12,7 @@ import copy
 from logging.handlers import RotatingFileHandler, BaseRotatingHandler
 from rtac.ac_functionalities.rtac_data import (
     Configuration,
+    ConfigPool,
     RTACData,
     RTACDatapp,
     TournamentStats,
@@ -202,7 +203,7 @@ class AbstractLogs(ABC):
         -------
         None
         """
-        self.winner_trajectory.info(f'{rtac_data.winner.value}' + '\n')
+        self.winner_trajectory.info(f'{rtac_data.winner_id}' + '\n')
         self.tourn_stats_log.info(str(tourn_stats) + '\n')
         self.tourn_nr_log.info(str(tourn_stats.tourn_nr) + '\n')
         if not self.objective_min:
@@ -422,6 +423,7 @@ class RTACLogs(AbstractLogs):
             pool = eval(line)
             for conf in pool.values():
                 conf.gen = Generator[conf.gen]
+            pool = ConfigPool(pool)
 
         if self.ranking in (ACMethod.ReACTR, ACMethod.ReACTRpp):
             with open(
@@ -0,0 +1,267 @@
+"""In this module the messages exchanged between the target algorithm runners
+and the tournament over a duplex pipe per core are implemented."""
+
+from typing import Any
+from enum import Enum
+from dataclasses import dataclass
+from collections import deque
+import multiprocessing as mp
+import multiprocessing.connection
+import time
+
+
+class MessageType(Enum):
+    """
+    Enumeration for the types of messages between runner and tournament.
+
+    Members
+    -------
+    started : int
+        Runner started the target algorithm, data is its PID.
+    interim : int
+        New interim output, data is the interim output.
+    runtime_features : int
+        New runtime features, data is the list of features.
+    solved : int
+        Target algorithm reported a result, data is (result, time).
+    capped : int
+        Runner killed the target algorithm, data is the TARunStatus value.
+    exited : int
+        Runner finished the run, data is the return code of the target
+        algorithm.
+    cap : int
+        Sent by the tournament: Cap the run, data is the tournament ID.
+    """
+    started = 1
+    interim = 2
+    runtime_features = 3
+    solved = 4
+    capped = 5
+    exited = 6
+    cap = 7
+
+
+@dataclass
+class Message:
+    """
+    Message between runner and tournament.
+
+    Parameters
+    ----------
+    type : MessageType
+        Type of the message.
+    core : int
+        Core of the runner.
+    sent : float
+        `time.monotonic()` when the message was sent. The monotonic clock is
+        shared by all processes of the machine.
+    data : Any
+        Payload depending on the type.
+    received : float
+        `time.monotonic()` when the message was received, 0 until then.
+    """
+    type: MessageType
+    core: int
+    sent: float
+    data: Any = None
+    received: float = 0.0
+
+    @property
+    def latency(self) -> float:
+        """Seconds from sending to receiving the message."""
+        return self.received - self.sent
+
+
+class RunnerChannel:
+    """
+    Runner end of the message pipe of a core.
+
+    Parameters
+    ----------
+    conn : mp.connection.Connection
+        Runner end of the duplex pipe.
+    core : int
+        Core of the runner.
+    tourn_id : str
+        ID of the tournament of the run. Cap messages of other tournaments
+        are ignored.
+    """
+
+    def __init__(self, conn: mp.connection.Connection, core: int,
+                 tourn_id: str) -> None:
+        """Initialize runner end of the pipe."""
+        self.conn = conn
+        self.core = core
+        self.tourn_id = tourn_id
+        self.cap_received = False
+
+    def send(self, type: MessageType, data: Any = None) -> None:
+        """
+        Sends a message to the tournament. A tournament that stopped
+        listening is ignored.
+
+        Parameters
+        ----------
+        type : MessageType
+            Type of the message.
+        data : Any
+            Payload depending on the type. Defaults to None.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            self.conn.send(Message(type, self.core, time.monotonic(), data))
+        except (BrokenPipeError, OSError):
+            pass
+
+    def capped(self) -> bool:
+        """
+        Reads the messages from the tournament without blocking.
+
+        Returns
+        -------
+        bool
+            True if the tournament capped the run.
+        """
+        try:
+            while not self.cap_received and self.conn.poll():
+                message = self.conn.recv()
+                if isinstance(message, Message) \
+                        and message.type is MessageType.cap \
+                        and message.data == self.tourn_id:
+                    self.cap_received = True
+        except (EOFError, OSError):
+            pass
+
+        return self.cap_received
+
+    def fileno(self) -> int:
+        """File descriptor of the pipe, readable when a message arrived."""
+        return self.conn.fileno()
+
+
+class TournamentChannel:
+    """
+    Tournament end of the message pipe of a core. Received messages are
+    buffered until the tournament handles them.
+
+    Parameters
+    ----------
+    conn : mp.connection.Connection
+        Tournament end of the duplex pipe.
+    core : int
+        Core of the runner.
+    """
+
+    def __init__(self, conn: mp.connection.Connection, core: int) -> None:
+        """Initialize tournament end of the pipe."""
+        self.conn = conn
+        self.core = core
+        self.inbox = deque()
+        self.exited = False
+
+    def poll(self, timeout: float | None = 0) -> bool:
+        """
+        Receives all available messages into the inbox.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum time to wait for the first message in seconds. Defaults
+            to 0.
+
+        Returns
+        -------
+        bool
+            True if the runner reported the run as exited or is gone.
+        """
+        try:
+            while not self.exited and self.conn.poll(timeout):
+                timeout = 0
+                message = self.conn.recv()
+                if not isinstance(message, Message):
+                    continue
+                message.received = time.monotonic()
+                self.inbox.append(message)
+                if message.type is MessageType.exited:
+                    self.exited = True
+        except (EOFError, OSError):
+            self.exited = True
+
+        return self.exited
+
+    def messages(self) -> list[Message]:
+        """
+        Removes and returns the buffered messages, oldest first.
+
+        Returns
+        -------
+        list[Message]
+            Buffered messages.
+        """
+        messages = list(self.inbox)
+        self.inbox.clear()
+
+        return messages
+
+    def cap(self, tourn_id: str) -> None:
+        """
+        Sends the cap message to the runner.
+
+        Parameters
+        ----------
+        tourn_id : str
+            ID of the tournament to cap.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            self.conn.send(Message(MessageType.cap, self.core,
+                                   time.monotonic(), tourn_id))
+        except (BrokenPipeError, OSError):
+            pass
+
+    def fileno(self) -> int:
+        """File descriptor of the pipe, readable when a message arrived."""
+        return self.conn.fileno()
+
+    def close(self) -> None:
+        """
+        Closes the tournament end of the pipe.
+
+        Returns
+        -------
+        None
+        """
+        self.conn.close()
+
+
+def open_channel(core: int, tourn_id: str) \
+        -> tuple[TournamentChannel, RunnerChannel]:
+    """
+    Creates the duplex message pipe of a core.
+
+    Parameters
+    ----------
+    core : int
+        Core of the runner.
+    tourn_id : str
+        ID of the tournament of the run.
+
+    Returns
+    -------
+    tuple[TournamentChannel, RunnerChannel]
+        Tournament end and runner end of the pipe.
+    """
+    tournament_conn, runner_conn = mp.Pipe()
+
+    return (TournamentChannel(tournament_conn, core),
+            RunnerChannel(runner_conn, core, tourn_id))
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,95 @@
+"""Implements the encoding of Configurations into the numerical values the
+CPPL bandit is computed on, compiled once from the parameter space so
+batches of Configurations are encoded without fitting scalers or encoders
+per Configuration."""
+
+from typing import Any
+import numpy as np
+from rtac.ac_functionalities.rtac_data import Configuration
+
+
+class ConfigEncoder:
+    """
+    Encodes Configurations as `MinMaxScaler` on the non-categorical and
+    `OneHotEncoder` on the categorical parameters, with the one-hot columns
+    of each parameter divided by its number of categories. Non-categorical
+    values come first, followed by the one-hot columns in the order of the
+    categorical parameters. Unknown categories leave their columns zero.
+
+    Parameters
+    ----------
+    non_cat_param_names : list[str]
+        Names of the non-categorical parameters.
+    lower_bounds : list[float]
+        Lower bounds of the non-categorical parameters.
+    upper_bounds : list[float]
+        Upper bounds of the non-categorical parameters.
+    cat_param_names : list[str]
+        Names of the categorical parameters.
+    cat_values : list[list[Any]]
+        Categories of each categorical parameter.
+    """
+
+    def __init__(self, non_cat_param_names: list[str],
+                 lower_bounds: list[float], upper_bounds: list[float],
+                 cat_param_names: list[str],
+                 cat_values: list[list[Any]]) -> None:
+        """Precompute offsets, scales and category columns."""
+        self.non_cat_param_names = list(non_cat_param_names)
+        self.cat_param_names = list(cat_param_names)
+
+        # MinMaxScaler fit on the bounds, ranges of zero are not scaled
+        self.offsets = np.asarray(lower_bounds, dtype=np.float64)
+        span = np.asarray(upper_bounds, dtype=np.float64) - self.offsets
+        self.scales = 1.0 / np.where(span == 0, 1.0, span)
+
+        # Column of each category and weight of the one-hot columns of each
+        # categorical parameter
+        column = len(self.non_cat_param_names)
+        self.cat_columns = []
+        self.cat_weights = np.zeros(len(cat_values), dtype=np.float32)
+        for i, categories in enumerate(cat_values):
+            self.cat_columns.append(
+                {value: column + j for j, value in enumerate(categories)})
+            self.cat_weights[i] = 1.0 / len(categories)
+            column += len(categories)
+        self.width = column
+
+    def encode(self, configs: list[Configuration]) -> np.ndarray:
+        """
+        Encodes a batch of Configurations.
+
+        Parameters
+        ----------
+        configs : list[Configuration]
+            Configurations to be encoded.
+
+        Returns
+        -------
+        np.ndarray
+            Encoded Configurations, one float32 row per Configuration.
+        """
+        encoded = np.zeros((len(configs), self.width), dtype=np.float32)
+        if not configs:
+            return encoded
+
+        if self.non_cat_param_names:
+            values = np.array([[conf.conf[name]
+                                for name in self.non_cat_param_names]
+                               for conf in configs], dtype=np.float64)
+            encoded[:, :len(self.non_cat_param_names)] = \
+                (values - self.offsets) * self.scales
+
+        if self.cat_param_names:
+            columns = np.array([[lookup.get(conf.conf[name], -1)
+                                 for name, lookup in zip(self.cat_param_names,
+                                                         self.cat_columns)]
+                                for conf in configs], dtype=np.intp)
+            rows, params = np.nonzero(columns >= 0)
+            encoded[rows, columns[rows, params]] = self.cat_weights[params]
+
+        return encoded
+
+
+if __name__ == "__main__":
+    pass
@@ -5,18 +5,18 @@ import uuid
 import copy
 import argparse
 import importlib
-from collections import Counter
 from itertools import islice
 from ConfigSpace.configuration_space import ConfigurationSpace
 from ConfigSpace.hyperparameters.categorical import CategoricalHyperparameter
 from rtac.ac_functionalities.rtac_data import (
     Configuration,
+    ConfigPool,
     ParamType,
     Generator,
     ValType
 )
+from rtac.ac_functionalities.ranking.config_encoder import ConfigEncoder
 import numpy as np
-import scipy as sp
 from sklearn.decomposition import PCA
 from sklearn.decomposition import IncrementalPCA
 from sklearn.preprocessing import (
@@ -28,6 +28,92 @@ from sklearn.preprocessing import (
 )
 from threadpoolctl import threadpool_limits
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
+import time
+
+
+def softmax(scores: np.ndarray) -> np.ndarray:
+    """
+    Softmax of scores, computed relative to the largest score so it cannot
+    overflow.
+
+    Parameters
+    ----------
+    scores : np.ndarray
+        Scores.
+
+    Returns
+    -------
+    np.ndarray
+        exp(scores) divided by their sum.
+    """
+    w = np.exp(scores - scores.max())
+
+    return w / w.sum()
+
+
+@cache
+def interaction_pairs(m: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Column index pairs (i < j) of the degree 2 interaction terms of m
+    features, in the order of sklearn's PolynomialFeatures.
+
+    Parameters
+    ----------
+    m : int
+        Number of features.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        First and second column indices of the pairs.
+    """
+    return np.triu_indices(m, 1)
+
+
+def joint_feature_map(x: np.ndarray, y: np.ndarray, mode: str,
+                      out: np.ndarray) -> np.ndarray:
+    """
+    Joins the values of a batch of Configurations with the problem instance
+    features, as `CPPL.joinFeatureMap` does for one Configuration, and
+    normalizes every row by its maximum absolute value.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Configuration values, one row per Configuration.
+    y : np.ndarray
+        Problem instance features.
+    mode : str
+        Mode of combining Configuration values and instance features:
+        'concatenation', 'kronecker' or 'polynomial' (bias, features and
+        degree 2 interactions).
+    out : np.ndarray
+        Buffer of shape (len(x), dimension) the rows are written to.
+
+    Returns
+    -------
+    np.ndarray
+        `out`, the normalized joint feature matrix.
+    """
+    n, p = x.shape
+    if mode == 'concatenation':
+        out[:, :p] = x
+        out[:, p:] = y
+    elif mode == 'kronecker':
+        out.reshape(n, p, len(y))[...] = x[:, :, None] * y[None, None, :]
+    elif mode == 'polynomial':
+        z = np.empty((n, p + len(y)))
+        z[:, :p] = x
+        z[:, p:] = y
+        first, second = interaction_pairs(z.shape[1])
+        out[:, 0] = 1
+        out[:, 1:1 + z.shape[1]] = z
+        np.multiply(z[:, first], z[:, second], out=out[:, 1 + z.shape[1]:])
+
+    normalize(out, norm='max', copy=False)
+
+    return out
 
 
 class CPPL():
@@ -57,10 +143,9 @@ class CPPL():
         self.keeptop = self.scenario.keeptop
         config_space = scenario.config_space
         del self.scenario.config_space
-        self.pool = copy.deepcopy(pool)
+        self.pool = ConfigPool(copy.deepcopy(pool))
         self.pool_size = len(self.pool)
         self.random_config_gen = None
-        self.transformed_pool = {}
         if contender_dict is None:
             self.contender_dict = {}
         else:
@@ -89,21 +174,26 @@ class CPPL():
         # Initialize One-Hot-Encoder
         self.init_onehot_encoder()
 
-        pool_items = copy.deepcopy(self.pool).items()
-
-        for conf_id, conf in pool_items:
-            self.transformed_pool[conf_id] = self.transform_conf(conf)
-
         self.pca_obj_params = PCA(n_components=self.scenario.nc_pca_p)
-        self.transformed_pool_array = \
-            np.asarray(list(self.transformed_pool.values()))
-        self.pca_obj_params.fit(self.transformed_pool_array)
-        self.transformed_pool_array = \
-            self.pca_obj_params.transform(self.transformed_pool_array)
+        self.pca_obj_params.fit(self.encoder.encode(list(self.pool.values())))
+
+        # PCA projected Configuration values of the pool and of the
+        # generated Configurations of the last pool maintenance by
+        # Configuration ID, so replacing Configurations only adds their rows
+        self.pool_rows = {}
+        self.pool_row_ids = []
+        self.children_rows = {}
+        self.sync_pool_rows()
          
         self.dim = self.compute_array_dimension(self.scenario.nc_pca_f,
                                                 self.scenario.nc_pca_p)
 
+        # Joint feature matrices of the pool and of generated children,
+        # reused across tournaments
+        self.X_t_buffer = np.zeros((self.pool_size, self.dim),
+                                   dtype=np.float32)
+        self.children_buffer = np.zeros((0, self.dim), dtype=np.float32)
+
         self.theta_hat = np.zeros(self.dim, dtype=np.float32)
         self.theta_bar = self.theta_hat
         self.len_theta_bar = len(self.theta_bar)
@@ -125,6 +215,9 @@ class CPPL():
         self.win_decay = np.zeros(self.pool_size)
 
         self.Sigma_bar = np.identity(len(self.theta_bar)) * 1.0
+        # (t, covariance estimate of theta_hat) shared by the skill and
+        # confidence assessments until the next result
+        self.Sigma_hat = None
 
         self.record_bandit()
 
@@ -144,8 +237,10 @@ class CPPL():
         int
             Dimension of np.ndarrays used in bandit.
         """
-        if self.scenario.jfm in ('concatenation', 'kronecker'):
+        if self.scenario.jfm == 'concatenation':
             d = nc_pca_f + nc_pca_p
+        elif self.scenario.jfm == 'kronecker':
+            d = nc_pca_f * nc_pca_p
         elif self.scenario.jfm == 'polynomial':
             d = 4
             for i in range((
@@ -210,25 +305,28 @@ class CPPL():
                     self.gamma_1 * self.t ** (-self.alpha) * self.grad
                 )
             # Forgetting factor update block
-            x = self.X_t[self.Y_t, :]
-
-            # Compute theta_bar with forgetting factor
-            Sigma_inv = np.linalg.inv(self.Sigma_bar)
-            Sigma_inv = \
-                self.scenario.forgetting_factor * Sigma_inv + (
-                    (1.0 / self.scenario.obs_noise) * np.outer(x, x)
-                )
-            self.Sigma_bar = np.linalg.inv(Sigma_inv)
-            self.theta_bar = self.Sigma_bar @ (
-                self.scenario.forgetting_factor * Sigma_inv @
-                self.theta_bar + (
-                    1.0 / self.scenario.obs_noise
-                ) * x * self.scenario.cppl_reward
-            )
+            x = self.X_t[self.Y_t, :].astype(np.float64)
+            ff = self.scenario.forgetting_factor
+            noise_inv = 1.0 / self.scenario.obs_noise
+
+            # The precision matrix is scaled by the forgetting factor and
+            # the observation adds a rank one term, so its inverse follows
+            # by Sherman-Morrison
+            u = (self.Sigma_bar @ x) / ff
+            self.Sigma_bar = self.Sigma_bar / ff - np.outer(u, u) * (
+                noise_inv / (1.0 + noise_inv * (x @ u)))
+            self.Sigma_bar = 0.5 * (self.Sigma_bar + self.Sigma_bar.T)
+
+            # Sigma_bar @ (ff * Sigma_bar^-1 @ theta_bar + noise_inv * x *
+            # reward), without multiplying by the precision matrix
+            self.theta_bar = ff * self.theta_bar + (
+                noise_inv * self.scenario.cppl_reward) * (self.Sigma_bar @ x)
 
             self.hess = self.hessian()
             self.hess_sum = self.hess_sum + self.hess
-            
+            # grad_op_sum and hess_sum changed
+            self.Sigma_hat = None
+
             self.skill_and_confidence()
 
             self.record_bandit()
@@ -247,14 +345,7 @@ class CPPL():
             self.t += 1
 
             # Get features from new configurations in pool, if pool changed
-            if self.pool_replacement:
-                self.transformed_pool = {}
-                for conf_id, conf in copy.deepcopy(self.pool).items():
-                    self.transformed_pool[conf_id] = self.transform_conf(conf)
-                self.transformed_pool_array = \
-                    np.asarray(list(self.transformed_pool.values()))
-                self.transformed_pool_array = \
-                    self.pca_obj_params.transform(self.transformed_pool_array)
+            self.sync_pool_rows()
 
             # Get instance features
             new_inst_features = self.feature_gen.get_features(self.instance)
@@ -275,13 +366,67 @@ class CPPL():
 
             # Get pool index of winner
             self.Y_t = min(range(len(results)), key=results.__getitem__)
-            contender_ids = list(copy.deepcopy(self.pool).keys())
+            contender_ids = list(self.pool)
             self.S_t = \
                 [contender_ids.index(k) for k in self.contender_dict.keys()]
             self.Y_t = self.S_t[self.Y_t]
 
         self.context_specific_feature_matrix()
 
+    def project_configs(self, configs: list[Configuration]) -> np.ndarray:
+        """
+        Transforms Configurations and projects them with the PCA of the
+        Configuration values.
+
+        Parameters
+        ----------
+        configs : list[Configuration]
+            Configurations to be transformed.
+
+        Returns
+        -------
+        np.ndarray
+            PCA projected Configuration values, one row per Configuration.
+        """
+        with threadpool_limits(limits=1):
+            return self.pca_obj_params.transform(self.encoder.encode(configs))
+
+    def sync_pool_rows(self) -> None:
+        """
+        Updates the PCA projected Configuration values of the pool after
+        Configurations were replaced. Rows of Configurations that stayed in
+        the pool are kept, rows of inserted Configurations are taken from
+        the assessment of the generated Configurations and only
+        Configurations without a row are transformed.
+
+        Returns
+        -------
+        None
+        """
+        pool_ids = list(self.pool)
+        if pool_ids == self.pool_row_ids:
+            return
+
+        rows = {}
+        missing = []
+        for conf_id in pool_ids:
+            row = self.pool_rows.get(conf_id)
+            if row is None:
+                row = self.children_rows.get(conf_id)
+            if row is None:
+                missing.append(conf_id)
+            else:
+                rows[conf_id] = row
+        if missing:
+            rows.update(zip(missing, self.project_configs(
+                [self.pool[conf_id] for conf_id in missing])))
+
+        self.pool_rows = rows
+        self.pool_row_ids = pool_ids
+        self.children_rows = {}
+        self.transformed_pool_array = \
+            np.asarray([rows[conf_id] for conf_id in pool_ids])
+
     def context_specific_feature_matrix(self) -> None:
         """
         Compute the context-specific feature matrix.
@@ -291,16 +436,12 @@ class CPPL():
         None
         """
         with threadpool_limits(limits=1):
-            self.X_t = np.zeros((self.pool_size, len(self.theta_bar)),
-                                dtype=np.float32)
-            for i in range(self.pool_size):
-                self.X_t[i, :] = self.joinFeatureMap(
-                    self.transformed_pool_array[i,], 
-                    self.scaled_features[0],
-                    self.scenario.jfm
-                )
-
-            normalize(self.X_t, norm='max', copy=False)
+            if len(self.X_t_buffer) != self.pool_size:
+                self.X_t_buffer = np.zeros((self.pool_size, self.dim),
+                                           dtype=np.float32)
+            self.X_t = joint_feature_map(self.transformed_pool_array,
+                                         self.scaled_features[0],
+                                         self.scenario.jfm, self.X_t_buffer)
 
     def gradient(self) -> np.ndarray:
         """
@@ -312,14 +453,10 @@ class CPPL():
             Gradient learnt from all previous results.
         """
         with threadpool_limits(limits=1):
-            d = 0
-            n = np.zeros(self.len_theta_bar)
-            for ll in self.S_t:
-                d = d + np.exp(np.dot(self.theta_hat, self.X_t[ll, :]))
-                n = n + (self.X_t[ll, :] * np.exp(
-                    np.dot(self.theta_hat, self.X_t[ll, :])))
+            X = self.X_t[self.S_t].astype(np.float64)
+            w = softmax(X @ self.theta_hat)
 
-            return self.X_t[self.Y_t, :] - (n / d)
+            return self.X_t[self.Y_t, :] - w @ X
 
     def hessian(self) -> np.ndarray:
         """
@@ -331,25 +468,91 @@ class CPPL():
             Hessian matrix expressing confidence in skills.
         """
         with threadpool_limits(limits=1):
+            X = self.X_t[self.S_t].astype(np.float64)
+            w = softmax(X @ self.theta_bar)
+            mean = w @ X
+
+            return np.outer(mean, mean) - (X.T * w) @ X
+
+    def skills(self, X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the estimated skills exp(theta_bar x) of Configurations,
+        relative to the best one so they cannot overflow.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Context-specific feature matrix of the Configurations.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Skills divided by the largest skill, and their logarithms
+            theta_bar x.
+        """
+        log_v = X @ self.theta_bar.astype(np.float64)
 
-            t_1 = np.zeros((self.len_theta_bar))
-            for ll in self.S_t:
-                t_1 = t_1 + (self.X_t[ll, :] * np.exp(
-                    np.dot(self.theta_bar, self.X_t[ll, :])))
-            n_1 = np.outer(t_1, t_1)
+        return np.exp(log_v - log_v.max()), log_v
 
-            n_2 = 0
-            for j in self.S_t:
-                n_2 = n_2 + (np.exp(
-                    np.dot(self.theta_bar, self.X_t[j, :])) * np.outer(
-                    self.X_t[j, :], self.X_t[j, :]))
+    def covariance(self) -> np.ndarray:
+        """
+        Computes the sandwich estimate Sigma_hat of the covariance of
+        theta_hat. It only changes with the results and t, so it is computed
+        once and shared by the assessments of the pool and of the generated
+        Configurations.
+
+        Returns
+        -------
+        np.ndarray
+            Covariance estimate Sigma_hat.
+        """
+        if self.Sigma_hat is not None and self.Sigma_hat[0] == self.t:
+            return self.Sigma_hat[1]
+
+        V_hat = (1 / self.t) * self.grad_op_sum.astype(np.float64)
+        S_hat = (1 / self.t) * self.hess_sum.astype(np.float64)
+        try:
+            S_hat_inv = np.linalg.inv(S_hat)
+        except Exception as e:
+            print(e)
+            S_hat_inv = np.linalg.pinv(S_hat)
+        Sigma_hat = (1 / self.t) * S_hat_inv @ V_hat @ S_hat_inv
+        self.Sigma_hat = (self.t, Sigma_hat)
+
+        return Sigma_hat
+
+    def confidences(self, X: np.ndarray, log_v: np.ndarray) -> np.ndarray:
+        """
+        Computes the confidence widths of Configurations, relative to the
+        largest one. M_i = exp(2 theta_bar x) x x^T is rank one, so the norm
+        of Sigma_hat_sqrt M_i Sigma_hat_sqrt is exp(2 theta_bar x) x^T
+        Sigma_hat x and the widths of all Configurations are one matrix
+        product.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Context-specific feature matrix of the Configurations.
+        log_v : np.ndarray
+            theta_bar x of the Configurations.
+
+        Returns
+        -------
+        np.ndarray
+            Confidence widths divided by the largest width, zero if all are
+            zero.
+        """
+        Sigma_hat = self.covariance()
 
-            d = 0
-            for ll in self.S_t:
-                d = d + np.exp(
-                    np.dot(self.theta_bar, self.X_t[ll, :]))
+        quad = np.einsum('ij,ij->i', X @ Sigma_hat, X)
+        scale = 2 * np.log(self.t) + self.len_theta_bar + 2 * np.sqrt(
+            self.len_theta_bar * np.log(self.t))
+        with np.errstate(divide='ignore'):
+            log_c = log_v + 0.5 * np.log(scale * np.maximum(quad, 0))
+        if np.all(np.isneginf(log_c)):
+            return np.zeros(len(X))
 
-            return (n_1 / (d ** 2)) - (n_2 / d)
+        return np.exp(log_c - log_c.max())
 
     def joinFeatureMap(self, x, y, mode) -> np.ndarray:
         """
@@ -498,49 +701,22 @@ class CPPL():
 
             configs = [item for sublist in configs for item in sublist]
 
-            pool_conf_settings = \
-                [conf.conf for conf in copy.deepcopy(self.pool).values()]
-
-            unique_configs = []
+            # Omit configurations already in the pool or generated twice
+            unique_configs = set()
             new_list = []
-            for idx, conf in enumerate(configs):
-                if (conf.conf in 
-                        pool_conf_settings or conf.conf in unique_configs):
-                    break
-                else:
-                    unique_configs.append(conf.conf)
+            for conf in configs:
+                fingerprint = conf.fingerprint
+                if not (self.pool.has_config(conf)
+                        or fingerprint in unique_configs):
+                    unique_configs.add(fingerprint)
                     new_list.append(conf)
             configs = new_list
 
-            existing_confs = \
-                set(tuple(sorted(obj.conf.items())) for obj in
-                    copy.deepcopy(self.pool).values())
-            best_cand_confs_counter = \
-                Counter(tuple(sorted(obj.conf.items())) for obj in configs)
-            configs = [
-                obj for obj in configs if best_cand_confs_counter[
-                    tuple(sorted(obj.conf.items()))
-                ] == 1
-            ]
-
-            new_list = []
-
-            for obj in configs:
-                conf_tuple = tuple(sorted(obj.conf.items()))
-                if conf_tuple not in existing_confs:
-                    new_list.append(obj)
-
-            configs = new_list
-
             if configs:
-                ctt = copy.deepcopy(configs)
-                transformed_configs = \
-                    [self.transform_conf(conf) for conf in ctt]
-                transformed_configs = \
-                    self.pca_obj_params.transform(transformed_configs)
-                S_t = self.assess_children(
-                    np.asarray(transformed_configs), nr_discarded
-                )
+                transformed_configs = self.project_configs(configs)
+                self.children_rows = dict(
+                    zip([conf.id for conf in configs], transformed_configs))
+                S_t = self.assess_children(transformed_configs, nr_discarded)
 
                 self.keeptop_gen = int(nr_discarded * (
                     self.scenario.keeptop / self.scenario.number_cores))
@@ -552,8 +728,8 @@ class CPPL():
                     }
 
                     best_candids_confs = \
-                        [conf.conf for conf in best_candids.values()]
-                    unique_configs = []
+                        {conf.fingerprint for conf in best_candids.values()}
+                    unique_configs = set()
                     maxidx = len(configs) - 1
                     used_idx = [i for i in range(maxidx + 1)]
                     for s in S_t[:self.keeptop_gen]:
@@ -562,8 +738,9 @@ class CPPL():
                     if used_idx:
                         for i in range(nr_discarded - self.keeptop_gen):
                             ridx = random.choice(used_idx)
-                            while (configs[ridx].conf in
-                                   best_candids_confs and configs[ridx].conf in
+                            while (configs[ridx].fingerprint in
+                                   best_candids_confs and
+                                   configs[ridx].fingerprint in
                                    unique_configs):
                                 used_idx.remove(ridx)
                                 if not used_idx:
@@ -571,7 +748,7 @@ class CPPL():
                                 ridx = random.choice(used_idx)
                                 
                             best_candids[configs[ridx].id] = configs[ridx]
-                            unique_configs.append(configs[ridx].conf)
+                            unique_configs.add(configs[ridx].fingerprint)
                             if not used_idx:
                                 break
                     else:
@@ -601,14 +778,16 @@ class CPPL():
 
     def insert_in_pool(self, configs):
         if configs is not None:
-            pool_list = list(copy.deepcopy(self.pool).values())
+            pool_ids = list(self.pool)
 
             for d in self.discard:
-                del self.pool[pool_list[d].id]
+                del self.pool[pool_ids[d]]
 
             for conf_id, conf in configs.items():
                 self.pool[conf_id] = conf
 
+            self.sync_pool_rows()
+
             print('\n')
 
             for c, d in zip(configs.values(), self.discard):
@@ -632,58 +811,17 @@ class CPPL():
             self.S_t_prior = copy.deepcopy(self.S_t)
 
             # Estimated skill parameters
-            self.v_hat = np.zeros(self.pool_size)
-            for i in range(self.pool_size):
-                self.v_hat[i] = \
-                    np.exp(np.inner(self.theta_bar, self.X_t[i, :]))
-            
+            self.v_hat, log_v = self.skills(self.X_t)
+
             # Configuration quality estimation
             self.c_t = np.zeros(self.pool_size)
             try:
-                V_hat = (1 / self.t) * self.grad_op_sum
-                V_hat = V_hat.astype('float64')
-                S_hat = (1 / self.t) * self.hess_sum
-                S_hat = S_hat.astype('float64')
-                try:
-                    S_hat_inv = np.linalg.inv(S_hat)
-                except Exception as e:
-                    print(e)
-                    S_hat_inv = np.linalg.pinv(S_hat)
-
-                S_hat_inv = S_hat_inv.astype('float64')
-                Sigma_hat = (1 / self.t) * np.dot(
-                    np.dot(S_hat_inv, V_hat),
-                    S_hat_inv)
-                Sigma_hat_sqrt = sp.linalg.sqrtm(Sigma_hat)
-
-                for i in range(self.pool_size):
-                    M_i = np.exp(2 * np.dot(
-                        self.X_t[i], self.theta_bar)
-                    ) * np.outer(self.X_t[i], self.X_t[i])
-
-                    self.c_t[i] = np.sqrt((
-                        2 * np.log(self.t) + self.len_theta_bar + 2 * np.sqrt(
-                            self.len_theta_bar * np.log(self.t))
-                    ) * np.linalg.norm(
-                        np.dot(np.dot(Sigma_hat_sqrt, M_i), Sigma_hat_sqrt)))
-
-                if np.any(np.isinf(self.c_t)):
-                    self.c_t = np.ones_like(self.c_t)
-
-                elif max(self.c_t) != 0:
-                    mc = max(self.c_t)
-                    for i, c in enumerate(self.c_t):
-                        if self.c_t[i] != 0:
-                            self.c_t[i] = self.c_t[i] / mc
-
-                self.v_hat = self.v_hat / max(self.v_hat)
+                self.c_t = self.confidences(self.X_t, log_v)
 
                 # Boost v_hat for recent winners
                 self.win_decay *= self.scenario.win_decay
                 self.win_decay[self.Y_t] += self.scenario.recent_winner_boost
-                for i in range(self.pool_size):
-                    self.v_hat[i] *= \
-                        (1 + self.scenario.win_bonus * self.win_decay[i])
+                self.v_hat *= 1 + self.scenario.win_bonus * self.win_decay
 
                 self.S_t = (
                     -(self.v_hat + self.omega * self.c_t)).argsort()[
@@ -736,63 +874,23 @@ class CPPL():
         with threadpool_limits(limits=1):
             # self.t = self.scenario.cpplt
             ltc = len(transformed_configs)
-            X_t = np.zeros((ltc, len(self.theta_bar)), dtype=np.float32)
-            for i in range(len(transformed_configs)):
-                X_t[i, :] = self.joinFeatureMap(
-                    transformed_configs[i,], 
-                    self.scaled_features[0],
-                    self.scenario.jfm
-                )
-
-            normalize(X_t, norm='max', copy=False)
+            if len(self.children_buffer) < ltc:
+                self.children_buffer = np.zeros((ltc, self.dim),
+                                                dtype=np.float32)
+            X_t = joint_feature_map(transformed_configs,
+                                    self.scaled_features[0],
+                                    self.scenario.jfm,
+                                    self.children_buffer[:ltc])
 
             # Estimated skill parameters
-            v_hat = np.zeros(ltc).astype('float64')
-            for i in range(ltc):
-                v_hat[i] = np.exp(np.inner(self.theta_bar, X_t[i, :]))
+            v_hat, log_v = self.skills(X_t)
 
             # Confidences
-            c_t = np.zeros(ltc).astype('float64')
+            c_t = np.zeros(ltc)
 
             # Configuration quality estimation
             try:
-                V_hat = (1 / self.t) * self.grad_op_sum
-                V_hat = V_hat.astype('float64')
-                S_hat = (1 / self.t) * self.hess_sum
-                S_hat = S_hat.astype('float64')
-                try:
-                    S_hat_inv = np.linalg.inv(S_hat)
-                except Exception as e:
-                    print(e)
-                    S_hat_inv = np.linalg.pinv(S_hat)
-
-                S_hat_inv = S_hat_inv.astype('float64')
-                Sigma_hat = (1 / self.t) * np.dot(
-                    np.dot(S_hat_inv, V_hat),
-                    S_hat_inv)
-                Sigma_hat_sqrt = sp.linalg.sqrtm(Sigma_hat)
-
-                for i in range(ltc):
-                    M_i = np.exp(2 * np.dot(
-                        X_t[i], self.theta_bar.copy())
-                    ) * np.outer(X_t[i], X_t[i])
-
-                    c_t[i] = np.sqrt((
-                        2 * np.log(self.t) + self.len_theta_bar + 2 * np.sqrt(
-                            self.len_theta_bar * np.log(self.t))
-                    ) * np.linalg.norm(
-                        np.dot(np.dot(Sigma_hat_sqrt, M_i), Sigma_hat_sqrt)))
-
-                if np.any(np.isinf(c_t)):
-                    self.c_t = np.ones_like(c_t)
-
-                elif max(c_t) != 0:
-                    mc = max(c_t)
-                    for i, c in enumerate(c_t):
-                        if c != 0:
-                            c_t[i] = c_t[i] / mc
-
-                v_hat = v_hat / max(v_hat)
+                c_t = self.confidences(X_t, log_v)
 
                 S_t = (
                     -(v_hat + self.omega * c_t)).argsort()
@@ -877,7 +975,8 @@ class CPPL():
 
     def init_param_scaler(self, config_space: argparse.Namespace) -> None:
         """
-        Initialize MinMaxScaler to be used on Configuration values.
+        Initialize MinMaxScaler to be used on Configuration values and the
+        ConfigEncoder that encodes Configurations the same way.
 
         Parameters
         ----------
@@ -891,6 +990,9 @@ class CPPL():
         self.split_param_types(config_space)
         self.min_max_scaler = MinMaxScaler()
         self.min_max_scaler.fit([self.lower_bounds, self.upper_bounds])
+        self.encoder = ConfigEncoder(self.non_cat_param_names,
+                                     self.lower_bounds, self.upper_bounds,
+                                     self.cat_param_names, self.cat_values)
 
     def split_param_types(self, config_space: argparse.Namespace) -> None:
         """
@@ -953,10 +1055,15 @@ class CPPL():
             OneHotEncoder(categories=self.cat_values,
                           sparse_output=False,
                           handle_unknown='ignore')
+        # Configurations are encoded by the ConfigEncoder, the fitted
+        # OneHotEncoder is only logged with the bandit models
+        if self.cat_values:
+            self.one_hot_enc.fit([[cat[0] for cat in self.cat_values]])
 
     def transform_conf(self, conf: Configuration) -> np.ndarray:
         """
-        Transorm Configuration values with MinMaxScaler and OneHotEncoder.
+        Transorm Configuration values with MinMaxScaler and OneHotEncoder,
+        as encoded by the ConfigEncoder.
 
         Parameters
         ----------
@@ -968,26 +1075,7 @@ class CPPL():
         np.ndarray
             Transformed Configuration values.
         """
-        with threadpool_limits(limits=1):
-            ncvt = self.min_max_scaler.transform([[conf.conf[k]
-                                                 for k in
-                                                 self.non_cat_param_names]])
-            cvt = self.one_hot_enc.fit_transform([[conf.conf[k]
-                                                 for k in
-                                                 self.cat_param_names]])
-            # One-hot encoding increases impact of the feature in the model
-            # so we reduce the impact by the number of binary features created
-            normalized = []
-            start = 0
-            for cat in self.cat_values:
-                num_cats = len(cat)
-                segment = cvt[0, start:start + num_cats]
-                normalized.extend(segment / num_cats)
-                start += num_cats
-
-            cvt = np.array(normalized).reshape(1, -1)
-
-        return np.concatenate((ncvt, cvt), axis=None)
+        return self.encoder.encode([conf])[0]
 
     def pre_train(self, feature_path: str) -> None:
         """
@@ -1013,3 +1101,56 @@ class CPPL():
         self.features = np.array(features)
         self.standard_scaler.fit(self.features)
         self.pca_obj_inst.fit(self.standard_scaler.transform(self.features))
+
+
+def benchmark_feature_map(sizes: tuple[int, ...] = (30, 1000, 10000),
+                          nc_pca_f: int = 3, nc_pca_p: int = 5) -> None:
+    """
+    Compares the runtime of `joint_feature_map` with calling
+    `CPPL.joinFeatureMap` per Configuration on random pools and prints the
+    speedup and the largest deviation of the feature matrices.
+
+    Parameters
+    ----------
+    sizes : tuple[int, ...]
+        Pool sizes. Defaults to (30, 1000, 10000).
+    nc_pca_f : int
+        Dimension of the problem instance features. Defaults to 3.
+    nc_pca_p : int
+        Dimension of the Configuration values. Defaults to 5.
+
+    Returns
+    -------
+    None
+    """
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=nc_pca_f)
+    m = nc_pca_f + nc_pca_p
+    dims = {'concatenation': m, 'kronecker': nc_pca_f * nc_pca_p,
+            'polynomial': 1 + m + m * (m - 1) // 2}
+    print(f'{"mode":>13} {"pool":>6} {"per row [ms]":>13} '
+          f'{"batched [ms]":>13} {"speedup":>8} {"max deviation":>14}')
+    for mode, dim in dims.items():
+        for n in sizes:
+            x = rng.normal(size=(n, nc_pca_p))
+
+            start = time.perf_counter()
+            rows = np.zeros((n, dim), dtype=np.float32)
+            for i in range(n):
+                rows[i, :] = CPPL.joinFeatureMap(None, x[i], y, mode)
+            normalize(rows, norm='max', copy=False)
+            row_time = time.perf_counter() - start
+
+            out = np.zeros((n, dim), dtype=np.float32)
+            start = time.perf_counter()
+            joint_feature_map(x, y, mode, out)
+            batch_time = time.perf_counter() - start
+
+            print(f'{mode:>13} {n:>6} {row_time * 1e3:>13.2f} '
+                  f'{batch_time * 1e3:>13.3f} '
+                  f'{row_time / batch_time:>8.0f} '
+                  f'{np.max(np.abs(rows - out)):>14.2e}')
+
+
+if __name__ == "__main__":
+    benchmark_feature_map()
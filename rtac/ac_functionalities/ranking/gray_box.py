@@ -103,6 +103,7 @@ BaseBagging.__init__ = _patched_init
 
 from costcla.models import CostSensitiveRandomPatchesClassifier
 from threadpoolctl import threadpool_limits
+from rtac.ac_functionalities.rtac_data import GBRecord
 
 
 class Gray_Box():
@@ -112,7 +113,7 @@ class Gray_Box():
         self.gb_cla = CostSensitiveRandomPatchesClassifier
  
     def prepare_predict_data(
-        self, rec_data: dict[int, list], instances: list,
+        self, rec_data: dict[int, np.ndarray], instances: list,
             gb_pw_inst_archive: list, mtp: dict[int, int], 
             pair_cores: list[list[int]]
     ) -> tuple[list, list, list, list, int, list]:
@@ -128,9 +129,9 @@ class Gray_Box():
 
         Parameters
         ----------
-        rec_data : dict[int, list]
-            All runtime output data recorded so far in the tournament sorted by 
-            core the target algorithm runs on
+        rec_data : dict[int, np.ndarray]
+            Latest runtime output record of the target algorithm run on each
+            core that recorded any so far, with columns as in GBRecord.
         instances : list[list]
             Unique instances of recorded runtime output.
         gb_pw_inst_archive : list[list]
@@ -162,11 +163,8 @@ class Gray_Box():
         """
 
         # Get last timepoint of recording for configs, if there were any
-        max_time_points = {}
-        for core, rd in rec_data.items():
-            rk = rd.keys()
-            if rk:
-                max_time_points[core] = max(rk)
+        max_time_points = {core: int(rd[GBRecord.wall_time])
+                           for core, rd in rec_data.items()}
 
         # Do not waste time computing with unchanged records
         if mtp != max_time_points:
@@ -182,26 +180,29 @@ class Gray_Box():
                 for core_i in recorded_cores:
                     for core_j in recorded_cores:
                         if core_i != core_j:
-                            conf_i = rec_data[core_i][max_time_points[core_i]]
-                            conf_j = rec_data[core_j][max_time_points[core_j]]
+                            conf_i = rec_data[core_i]
+                            conf_j = rec_data[core_j]
+                            cpu_i = conf_i[GBRecord.cpu_time]
+                            cpu_j = conf_j[GBRecord.cpu_time]
+                            feats_i = conf_i[GBRecord.features:][
+                                :int(conf_i[GBRecord.nr_features])]
+                            feats_j = conf_j[GBRecord.features:][
+                                :int(conf_j[GBRecord.nr_features])]
+                            nr_feats = min(len(feats_i), len(feats_j))
 
                             pw_inst = [
-                                conf_i['CPUTimeExpended'],
-                                *conf_i['rt_feats'],
-                                conf_j['CPUTimeExpended'],
-                                *conf_j['rt_feats'],
-                                conf_i['CPUTimeExpended'] 
-                                - conf_j['CPUTimeExpended'],
-                                *[a - b for a, b 
-                                  in zip(conf_i['rt_feats'],
-                                         conf_j['rt_feats'])]
+                                cpu_i,
+                                *feats_i,
+                                cpu_j,
+                                *feats_j,
+                                cpu_i - cpu_j,
+                                *(feats_i[:nr_feats] - feats_j[:nr_feats])
                             ]
 
                             # if pw_inst:  # not in gb_pw_inst_archive:
                             pw_instances.append(pw_inst)
                             gb_pw_inst_archive.append(pw_inst)
-                            pair_cores.append(
-                                [conf_i['core'], conf_j['core']])
+                            pair_cores.append([core_i, core_j])
                             instances.append([conf_i, conf_j])
                             cores.append([core_i, core_j])
 
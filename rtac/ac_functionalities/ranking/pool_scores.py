@@ -0,0 +1,158 @@
+"""Implements the TrueSkill scores of the ReACTR configuration pool as
+parallel numpy arrays, so the pool can be ranked in one pass."""
+
+from typing import Iterator
+from collections.abc import MutableMapping
+import numpy as np
+
+
+class PoolScores(MutableMapping):
+    """
+    TrueSkill scores (mu, sigma) of the configurations in the pool, stored
+    in parallel numpy arrays with one row per configuration. The mapping of
+    configuration IDs to rows is stable, new configurations are appended and
+    removed ones leave a gap until the arrays are compacted, so the rows
+    keep the insertion order of the pool dictionary. It offers the interface
+    of a dictionary of configuration ID to (mu, sigma), which is also how it
+    is logged.
+
+    Parameters
+    ----------
+    scores : dict[str, tuple[float, float]] | None
+        Initial scores by configuration ID. Defaults to None.
+    """
+
+    def __init__(self, scores: dict[str, tuple[float, float]] | None = None) \
+            -> None:
+        """Initialize the score arrays."""
+        scores = {} if scores is None else scores
+        capacity = max(len(scores), 16)
+        self.mu = np.zeros(capacity)
+        self.sigma = np.zeros(capacity)
+        # Row of each configuration ID and configuration ID of each row,
+        # None where a configuration was removed
+        self.rows = {}
+        self.ids = []
+        self.alive = np.zeros(capacity, dtype=bool)
+        for conf_id, skill in scores.items():
+            self[conf_id] = skill
+
+    def __getitem__(self, conf_id: str) -> tuple[float, float]:
+        """(mu, sigma) of a configuration."""
+        row = self.rows[conf_id]
+        return self.mu[row].item(), self.sigma[row].item()
+
+    def __setitem__(self, conf_id: str, skill: tuple[float, float]) -> None:
+        """Sets the (mu, sigma) of a configuration, appending new ones."""
+        row = self.rows.get(conf_id)
+        if row is None:
+            row = len(self.ids)
+            if row == len(self.mu):
+                self.resize(2 * row)
+            self.rows[conf_id] = row
+            self.ids.append(conf_id)
+            self.alive[row] = True
+        self.mu[row], self.sigma[row] = skill
+
+    def __delitem__(self, conf_id: str) -> None:
+        """Removes a configuration."""
+        row = self.rows.pop(conf_id)
+        self.ids[row] = None
+        self.alive[row] = False
+        if len(self.ids) > 2 * len(self.rows) + 16:
+            self.compact()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the configuration IDs in insertion order."""
+        return (conf_id for conf_id in self.ids if conf_id is not None)
+
+    def __len__(self) -> int:
+        """Number of configurations."""
+        return len(self.rows)
+
+    def __repr__(self) -> str:
+        """Representation as dictionary."""
+        return repr(dict(self.items()))
+
+    def resize(self, capacity: int) -> None:
+        """
+        Changes the number of rows the arrays can hold.
+
+        Parameters
+        ----------
+        capacity : int
+            New number of rows, at least the number of used rows.
+
+        Returns
+        -------
+        None
+        """
+        used = len(self.ids)
+        for name in ('mu', 'sigma', 'alive'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:used] = old[:used]
+            setattr(self, name, new)
+
+    def compact(self) -> None:
+        """
+        Removes the gaps left by removed configurations, keeping the order.
+
+        Returns
+        -------
+        None
+        """
+        live = self.live_rows()
+        count = len(live)
+        self.mu[:count] = self.mu[live]
+        self.sigma[:count] = self.sigma[live]
+        self.alive[:count] = True
+        self.alive[count:] = False
+        self.ids = [self.ids[row] for row in live.tolist()]
+        self.rows = {conf_id: row for row, conf_id in enumerate(self.ids)}
+
+    def live_rows(self) -> np.ndarray:
+        """
+        Rows of the configurations in the pool, in insertion order.
+
+        Returns
+        -------
+        np.ndarray
+            Row indices.
+        """
+        return np.flatnonzero(self.alive[:len(self.ids)])
+
+    def rows_of(self, conf_ids: list[str]) -> np.ndarray:
+        """
+        Rows of the given configurations.
+
+        Parameters
+        ----------
+        conf_ids : list[str]
+            Configuration IDs.
+
+        Returns
+        -------
+        np.ndarray
+            Row indices in the order of `conf_ids`.
+        """
+        return np.array([self.rows[conf_id] for conf_id in conf_ids],
+                        dtype=np.intp)
+
+    def ranking(self) -> np.ndarray:
+        """
+        Rows of the configurations sorted by mu, ascending. Ties keep the
+        insertion order.
+
+        Returns
+        -------
+        np.ndarray
+            Row indices, the best configuration last.
+        """
+        live = self.live_rows()
+
+        return live[np.argsort(self.mu[live], kind='stable')]
+
+
+if __name__ == "__main__":
+    pass
@@ -29,13 +29,22 @@ if sys.hexversion < 0x02060000:
   sys.exit(1)
 
 from scipy.stats.distributions import norm as scipy_norm
-from math import sqrt
+from math import sqrt, exp, erfc, pi
 
 norm = scipy_norm()
-pdf = norm.pdf
-cdf = norm.cdf
 icdf = norm.ppf    # inverse CDF
 
+# The update rules are evaluated for scalars many times per game, the
+# math module avoids the per-call overhead of scipy.stats.
+
+SQRT2 = sqrt(2)
+SQRT2PI = sqrt(2 * pi)
+
+def pdf(x):
+  return exp(-0.5 * x * x) / SQRT2PI
+def cdf(x):
+  return 0.5 * erfc(-x / SQRT2)
+
 # Update rules for approximate marginals for the win and draw cases,
 # respectively.
 
@@ -0,0 +1,221 @@
+"""Implements the multi-team TrueSkill update of `trueskill.AdjustPlayers` on
+numpy arrays. The factor graph of single player teams is a chain, so the
+messages of all players and of all adjacent team differences are kept in
+arrays and updated together in the same schedule as the factor graph."""
+
+import math
+import time
+import numpy as np
+from scipy.special import ndtr
+from rtac.ac_functionalities.ranking import trueskill
+
+
+def _pdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal density."""
+    return np.exp(-0.5 * x * x) / math.sqrt(2 * math.pi)
+
+
+def v_w(t: np.ndarray, e: np.ndarray, draw: np.ndarray) \
+        -> tuple[np.ndarray, np.ndarray]:
+    """
+    Array version of the update rules Vwin/Wwin and Vdraw/Wdraw of
+    `trueskill`.
+
+    Parameters
+    ----------
+    t : np.ndarray
+        Normalized means of the team differences.
+    e : np.ndarray
+        Normalized draw margins.
+    draw : np.ndarray
+        True where the two adjacent teams drew.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        V and W of each team difference.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Win
+        x = t - e
+        v_win = _pdf(x) / ndtr(x)
+        w_win = v_win * (v_win + x)
+
+        # Draw
+        em, ep = e - t, e + t
+        denom = ndtr(em) - ndtr(-ep)
+        pdf_em, pdf_ep = _pdf(em), _pdf(ep)
+        v_draw = (pdf_ep - pdf_em) / denom
+        w_draw = v_draw ** 2 + (em * pdf_em + ep * pdf_ep) / denom
+
+    return np.where(draw, v_draw, v_win), np.where(draw, w_draw, w_win)
+
+
+def adjust_skills(mu: np.ndarray, sigma: np.ndarray, rank: np.ndarray,
+                  iterations: int = 5) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Adjusts the skills of the players of a single game as
+    `trueskill.AdjustPlayers` does, using the parameters set by
+    `trueskill.SetParameters`.
+
+    Messages are kept in natural parameters (precision pi, precision
+    adjusted mean tau). Per player arrays hold the message of the
+    performance (perf), of the team difference to the left (up) and of the
+    team difference to the right (down) to the team performance variable.
+    The up messages depend on each other along the chain and are computed
+    in a loop over the team differences.
+
+    Parameters
+    ----------
+    mu : np.ndarray
+        Skill means of the players.
+    sigma : np.ndarray
+        Skill standard deviations of the players.
+    rank : np.ndarray
+        Ranks of the players, lower is better, equal ranks are draws.
+    iterations : int
+        Number of message passing iterations over the team differences.
+        Defaults to 5, as `trueskill.AdjustPlayers`.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        New skill means and standard deviations in the order of the input.
+    """
+    mu = np.asarray(mu, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    rank = np.asarray(rank)
+    if len(mu) < 2:
+        # No opponents, no evidence
+        return mu.copy(), sigma.copy()
+
+    order = np.argsort(rank, kind='stable')
+    rank = rank[order]
+    beta2 = trueskill.BETA ** 2
+
+    # Priors, widened by the dynamics factor GAMMA
+    prior_pi = 1.0 / (sigma[order] ** 2 + trueskill.GAMMA ** 2)
+    prior_tau = prior_pi * mu[order]
+
+    # Skill to performance to team performance
+    a = 1.0 / (1.0 + beta2 * prior_pi)
+    perf_pi, perf_tau = a * prior_pi, a * prior_tau
+
+    n = len(mu)
+    up_pi, up_tau = np.zeros(n), np.zeros(n)
+    down_pi, down_tau = np.zeros(n), np.zeros(n)
+    draw = rank[:-1] == rank[1:]
+
+    for _ in range(iterations):
+        # Team differences from the teams (arrows (1) and (4))
+        left_pi = perf_pi[:-1] + up_pi[:-1]
+        left_tau = perf_tau[:-1] + up_tau[:-1]
+        right_pi = perf_pi[1:] + down_pi[1:]
+        right_tau = perf_tau[1:] + down_tau[1:]
+        diff_pi = 1.0 / (1.0 / left_pi + 1.0 / right_pi)
+        diff_tau = diff_pi * (left_tau / left_pi - right_tau / right_pi)
+
+        # Truncation (arrows (2) and (5))
+        sqrt_c = np.sqrt(diff_pi)
+        v, w = v_w(diff_tau / sqrt_c, trueskill.EPSILON * sqrt_c, draw)
+        trunc_pi = diff_pi / (1.0 - w) - diff_pi
+        trunc_tau = (diff_tau + sqrt_c * v) / (1.0 - w) - diff_tau
+
+        # Team differences back to the teams (arrows (3) and (6)). The
+        # down messages only use the previous up messages of their right
+        # neighbour, the up messages are passed along the chain.
+        down_pi[:-1] = 1.0 / (1.0 / trunc_pi + 1.0 / right_pi)
+        down_tau[:-1] = \
+            down_pi[:-1] * (trunc_tau / trunc_pi + right_tau / right_pi)
+        p_pi, p_tau = perf_pi.tolist(), perf_tau.tolist()
+        t_pi, t_tau = trunc_pi.tolist(), trunc_tau.tolist()
+        u_pi, u_tau = 0.0, 0.0
+        for k in range(n - 1):
+            c_pi, c_tau = p_pi[k] + u_pi, p_tau[k] + u_tau
+            u_pi = 1.0 / (1.0 / c_pi + 1.0 / t_pi[k])
+            u_tau = u_pi * (c_tau / c_pi - t_tau[k] / t_pi[k])
+            up_pi[k + 1], up_tau[k + 1] = u_pi, u_tau
+
+    # Team performance back to the skills
+    team_pi, team_tau = up_pi + down_pi, up_tau + down_tau
+    a = 1.0 / (1.0 + beta2 * team_pi)
+    skill_pi = prior_pi + a * team_pi
+    skill_tau = prior_tau + a * team_tau
+
+    new_mu, new_sigma = np.empty(n), np.empty(n)
+    new_mu[order] = skill_tau / skill_pi
+    new_sigma[order] = np.sqrt(1.0 / skill_pi)
+
+    return new_mu, new_sigma
+
+
+def benchmark(sizes: tuple[int, ...] = (8, 64, 256), repeats: int = 5) \
+        -> None:
+    """
+    Compares the runtime of `adjust_skills` with `trueskill.AdjustPlayers`
+    on random games with one winner, as in the ReACTR tournaments, and
+    prints the speedup and the largest deviation of the skills. The factor
+    graph is timed with the normal distribution of `scipy.stats`, as
+    `trueskill` used before, and with the `math` based `trueskill.pdf` and
+    `trueskill.cdf`.
+
+    Parameters
+    ----------
+    sizes : tuple[int, ...]
+        Numbers of contenders. Defaults to (8, 64, 256).
+    repeats : int
+        Number of timed games per size. Defaults to 5.
+
+    Returns
+    -------
+    None
+    """
+    class Player:
+        pass
+
+    def factor_graph(mu, sigma, rank):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            players = []
+            for m, s, r in zip(mu.tolist(), sigma.tolist(), rank.tolist()):
+                player = Player()
+                player.skill = (m, s)
+                player.rank = r
+                players.append(player)
+            trueskill.AdjustPlayers(players)
+
+        return players, (time.perf_counter() - start) / repeats
+
+    rng = np.random.default_rng(0)
+    print(f'{"contenders":>10} {"scipy factor graph [ms]":>24} '
+          f'{"factor graph [ms]":>18} {"vectorized [ms]":>16} '
+          f'{"speedup":>8} {"max deviation":>14}')
+    for n in sizes:
+        mu = rng.uniform(15, 35, n)
+        sigma = rng.uniform(1, trueskill.INITIAL_SIGMA, n)
+        rank = np.full(n, 2)
+        rank[rng.integers(n)] = 1
+
+        pdf, cdf = trueskill.pdf, trueskill.cdf
+        trueskill.pdf, trueskill.cdf = trueskill.norm.pdf, trueskill.norm.cdf
+        try:
+            _, scipy_time = factor_graph(mu, sigma, rank)
+        finally:
+            trueskill.pdf, trueskill.cdf = pdf, cdf
+        players, graph_time = factor_graph(mu, sigma, rank)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            new_mu, new_sigma = adjust_skills(mu, sigma, rank)
+        vec_time = (time.perf_counter() - start) / repeats
+
+        deviation = max(
+            np.max(np.abs(new_mu - [p.skill[0] for p in players])),
+            np.max(np.abs(new_sigma - [p.skill[1] for p in players])))
+        print(f'{n:>10} {scipy_time * 1e3:>24.3f} {graph_time * 1e3:>18.3f} '
+              f'{vec_time * 1e3:>16.3f} {graph_time / vec_time:>8.1f} '
+              f'{deviation:>14.2e}')
+
+
+if __name__ == "__main__":
+    benchmark()
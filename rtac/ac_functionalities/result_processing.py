@@ -6,11 +6,13 @@ from rtac.ac_functionalities.config_gens import (
     DefaultConfigGen,
     RandomConfigGen
 )
-from rtac.ac_functionalities.ranking import trueskill
+from rtac.ac_functionalities.ranking import trueskill, vectorized_trueskill
+from rtac.ac_functionalities.ranking.pool_scores import PoolScores
 from rtac.ac_functionalities.rtac_data import (
     RTACData,
     RTACDatapp,
     Configuration,
+    ConfigPool,
     ACMethod,
     InterimMeaning,
     Generator
@@ -21,18 +23,12 @@ import random
 import sys
 import numpy as np
 import uuid
-import copy
 import multiprocessing
 import pickle
 import time
 from scipy.stats import rankdata
 
 
-class Contender(object):
-    """Helper object for setting trueskill ranks."""
-    pass
-
-
 class AbstractResultProcessing(ABC):
     """
     Abstract class with functions to process tournament results.
@@ -56,7 +52,7 @@ class AbstractResultProcessing(ABC):
         self.tourn_nr = 0
         self.contender_dict = {}
         self.huge_float = sys.float_info.max * 1e-100
-        self.pool = {}
+        self.pool = ConfigPool()
         self.time_sum = 0
         self.init_data()
 
@@ -78,7 +74,7 @@ class AbstractResultProcessing(ABC):
             default_config = self.default_config_gen.generate(0)
             self.pool[default_config.id] = default_config
             for _ in range(self.scenario.contenders - 1):
-                random_config = self.random_config_gen.generate(0)
+                random_config = self.unique_random_config()
                 self.pool[random_config.id] = random_config
 
             # Randomly initialize contender dict of first tournament
@@ -89,7 +85,7 @@ class AbstractResultProcessing(ABC):
         else:
             # Initialize pool of contender configurations
             for _ in range(self.scenario.contenders):
-                random_config = self.random_config_gen.generate(0)
+                random_config = self.unique_random_config()
                 self.pool[random_config.id] = random_config
 
             # Randomly initialize contender dict of first tournament
@@ -99,6 +95,34 @@ class AbstractResultProcessing(ABC):
         for rp in random_pick:
             self.contender_dict[rp.id] = rp
 
+    def unique_random_config(self, config: Configuration | None = None,
+                             attempts: int = 10) -> Configuration:
+        """
+        Random configuration that is not in the pool yet. In small
+        configuration spaces the last one generated is returned after
+        `attempts` tries.
+
+        Parameters
+        ----------
+        config : Configuration | None
+            Configuration to try first. Defaults to None.
+        attempts : int
+            Number of configurations to try. Defaults to 10.
+
+        Returns
+        -------
+        Configuration
+            New configuration.
+        """
+        if config is None:
+            config = self.random_config_gen.generate(self.tourn_nr)
+        for _ in range(attempts - 1):
+            if not self.pool.has_config(config):
+                break
+            config = self.random_config_gen.generate(self.tourn_nr)
+
+        return config
+
     @abstractmethod
     def process_results(self, rtac_data: RTACData | RTACDatapp,
                         instance: str = None, tourn_nr: int = None) -> None:
@@ -165,17 +189,17 @@ class AbstractResultProcessing(ABC):
 
         if not self.scenario.baselineperf:
             self.process_results(rtac_data, instance, tourn_nr)
-            if self.rtac_data.winner.value != 0:
+            if self.rtac_data.winner_id != 0:
                 self.manage_pool()
             self.select_contenders()
         else:
             self.rtac_data = rtac_data
             self.rtac_data.newtime = self.rtac_data.ta_res_time[0]
 
-        if self.rtac_data.winner.value == 0:
+        if self.rtac_data.winner_id == 0:
             winner = None
         else:
-            winner = self.rtac_data.winner.value
+            winner = self.rtac_data.winner_id
 
         return winner
 
@@ -264,7 +288,7 @@ class ResultProcessing(AbstractResultProcessing):
 
     def init_scores(self) -> None:
         """
-        Initialize scores dict for trueskill.
+        Initialize scores for trueskill.
 
         Returns
         -------
@@ -274,26 +298,17 @@ class ResultProcessing(AbstractResultProcessing):
                                         (trueskill.INITIAL_MU,
                                          trueskill.INITIAL_SIGMA))
 
-    def find_best(self, current_dict: list, number: int) -> list:
-        """
-        Find the configurations scored as best by trueskill.
+    @property
+    def scores(self) -> PoolScores:
+        """Trueskill scores (mu, sigma) of the pool by configuration id."""
+        return self.pool_scores
 
-        Parameters
-        ----------
-        current_dict : list
-            Dictionary with configuration ids as key and
-            trueskill scores (mu, sigma) as value.
-        n_best : int
-            Number of best configurations to draw.
-
-        Returns
-        -------
-        list
-            List of best configurations.
-        """
-        best_list = sorted(current_dict.items(), key=lambda kv: kv[1][1])
-
-        return best_list[:number]
+    @scores.setter
+    def scores(self, scores: dict[str, tuple[float, float]]) -> None:
+        # Scores loaded from the logs are a dict
+        if not isinstance(scores, PoolScores):
+            scores = PoolScores(scores)
+        self.pool_scores = scores
 
     def get_winner(self, times: list[float], res: list[float]) \
             -> tuple[int, list[int]]:
@@ -393,128 +408,114 @@ class ResultProcessing(AbstractResultProcessing):
             self.logs.general_log(f'Results of this tournament: {tr_str}')
 
         # Set the results of the tournament
-        individuals = [None] * self.scenario.number_cores
         contender_ids = list(self.contender_dict.keys())
-        for core in range(self.scenario.number_cores):
-            skill = (self.scores[contender_ids[core]][0], 
-                     self.scores[contender_ids[core]][1])
-            individuals[core] = Contender()
-            individuals[core].skill = skill
-            individuals[core].rank = ranks[core]
-
-            if self.scenario.verbosity == 2:
-                print('Contender', contender_ids[core], 'has the rank',
-                      individuals[core].rank)
+        rows = self.scores.rows_of(contender_ids)
+        mu, sigma = self.scores.mu[rows], self.scores.sigma[rows]
+        if self.scenario.verbosity == 2:
+            for contender_id, rank in zip(contender_ids, ranks):
+                print('Contender', contender_id, 'has the rank', rank)
         print('\n')
 
         # Process the results of the tournament
-        trueskill.AdjustPlayers(individuals)
+        mu, sigma = vectorized_trueskill.adjust_skills(mu, sigma, ranks)
 
         if self.scenario.verbosity in (1, 2):
             print('\nSkills of the contenders from tournament:\n \nContender',
                   ' ' * 31, '   (Mu', ' ' * 14, ', Sigma', ' ' * 10, ')')
 
         # Update Scores
-        for core in range(self.scenario.number_cores):
-            self.scores[contender_ids[core]] = individuals[core].skill
-            if self.scenario.verbosity in (1, 2):
-                print(contender_ids[core], 'skills are:',
-                      individuals[core].skill)
+        self.scores.mu[rows], self.scores.sigma[rows] = mu, sigma
+        if self.scenario.verbosity in (1, 2):
+            for contender_id in contender_ids:
+                print(contender_id, 'skills are:', self.scores[contender_id])
 
     def manage_pool(self) -> None:
         """
         Replace contenders in pool according to Mu and Sigma (TrueSKill).
+        The pool is ranked once, before any contender is replaced.
 
         Returns
         -------
         None
         """
-        # Replace contenders in self.pool, if performance below average
-        contender_ids = list(self.pool.keys())
-        for core in range(self.scenario.contenders):
-            # Contenders with a performance variance (sigma) <=
-            # self.scenario.kill are eligible to be replaced
-            if self.scores[contender_ids[core]][1] <= self.scenario.kill: 
-                tournament_list = {}
-                names = list(self.scores)
-                for c in range(self.scenario.contenders):
-                    tournament_list[c] = [names[c], self.scores[names[c]][0]]
-
-                # Sort according to mean performance (Mu)
-                best_list = \
-                    self.find_best(tournament_list, self.scenario.contenders)
-
-                # Get 5 best performing contenders for breeding
-                best_five = best_list[len(best_list) - 5:]
-
-                # Contenders which also have mean performance lower
-                # than median performane are replaced by new contenders
-                if self.scores[contender_ids[core]][0] \
-                        < self.scores[best_list[
-                            int(self.scenario.contenders / 2)][1][0]][0]:       
-
-                    # Replace by randomly generated contender if chance
-                    # is lower than self.scenario.chance
-                    chance = np.random.uniform(1, 100, 1)
-                    mutated_individual = \
-                        self.random_config_gen.generate(self.tourn_nr)
-                    if chance <= self.scenario.chance:
-                        del self.pool[contender_ids[core]]
-                        new_contender_id = mutated_individual.id
-                        self.pool[new_contender_id]\
-                            = mutated_individual
-                        if self.scenario.verbosity in (1, 2):
-                            print('\nReplaced contender',
-                                  f'{contender_ids[core]} by randomly',
-                                  'generated contender.')
-
-                    # Else generate new contender by genetic crossover
-                    elif chance > self.scenario.chance:
-                        mutated = 0
-                        parent_one, parent_two = \
-                            random.sample([0, 1, 2, 3, 4], 2)
-                        self.scenario.config_space
-                        del self.pool[contender_ids[core]]
-                        new_contender_id = uuid.uuid4().hex
-                        self.pool[new_contender_id] = {}
-
-                        for param in self.scenario.config_space:
-                            which = np.random.uniform(0, 1, 1)
-
-                            if 0.5 < which:
-                                self.pool[new_contender_id][param] \
-                                    = self.pool[
-                                    best_five[parent_one][1][0]].conf[param]
-
-                            elif 0.5 >= which:
-                                self.pool[new_contender_id][param] \
-                                    = self.pool[
-                                    best_five[parent_two][1][0]].conf[param]
-
-                            mutation = int(np.random.uniform(0, 100, 1))
-                            if mutation <= self.scenario.mutate:
-                                self.pool[new_contender_id][param]\
-                                    = mutated_individual.conf[param]
-                                mutated = mutated + 1
-
-                        self.pool[new_contender_id] = \
-                            Configuration(
-                                new_contender_id,
-                                self.pool[new_contender_id], [],
-                                Generator.crossover, self.tourn_nr)
-                        if self.scenario.verbosity in (1, 2):
-                            print('\nReplaced contender',
-                                  f'{contender_ids[core]} by contender',
-                                  'generated via crossover.')
-                        if self.scenario.verbosity == 2:
-                            print(f'Mutation of {mutated} genes happened for',
-                                  f'the new contender {new_contender_id}!\n')
-
-                    # Delete scores of replaced contender and insert initial
-                    # scores for new contender
-                    del self.scores[contender_ids[core]]
-                    self.scores[new_contender_id] = \
-                        (trueskill.INITIAL_MU, trueskill.INITIAL_SIGMA)
+        # Sort according to mean performance (Mu)
+        ranking = self.scores.ranking()
+
+        # Get 5 best performing contenders for breeding
+        best_five = [self.pool[self.scores.ids[row]]
+                     for row in ranking[-5:].tolist()]
+
+        # Contenders with a performance variance (sigma) <=
+        # self.scenario.kill are eligible to be replaced. Contenders which
+        # also have mean performance lower than median performance are
+        # replaced by new contenders
+        median = self.scores.mu[ranking[int(len(ranking) / 2)]]
+        live = self.scores.live_rows()
+        replace = live[(self.scores.sigma[live] <= self.scenario.kill)
+                       & (self.scores.mu[live] < median)]
+
+        for contender_id in [self.scores.ids[row] for row in replace]:
+            # Replace by randomly generated contender if chance
+            # is lower than self.scenario.chance
+            chance = np.random.uniform(1, 100, 1)
+            mutated_individual = \
+                self.random_config_gen.generate(self.tourn_nr)
+            if chance <= self.scenario.chance:
+                del self.pool[contender_id]
+                mutated_individual = \
+                    self.unique_random_config(mutated_individual)
+                new_contender_id = mutated_individual.id
+                self.pool[new_contender_id] = mutated_individual
+                if self.scenario.verbosity in (1, 2):
+                    print('\nReplaced contender',
+                          f'{contender_id} by randomly',
+                          'generated contender.')
+
+            # Else generate new contender by genetic crossover
+            elif chance > self.scenario.chance:
+                mutated = 0
+                parent_one, parent_two = \
+                    random.sample([0, 1, 2, 3, 4], 2)
+                del self.pool[contender_id]
+                new_contender_id = uuid.uuid4().hex
+                conf = {}
+
+                for param in self.scenario.config_space:
+                    which = np.random.uniform(0, 1, 1)
+
+                    if 0.5 < which:
+                        conf[param] = best_five[parent_one].conf[param]
+
+                    elif 0.5 >= which:
+                        conf[param] = best_five[parent_two].conf[param]
+
+                    mutation = int(np.random.uniform(0, 100, 1))
+                    if mutation <= self.scenario.mutate:
+                        conf[param] = mutated_individual.conf[param]
+                        mutated = mutated + 1
+
+                if self.pool.has_config(conf):
+                    # Racing a duplicate wastes a core
+                    new_contender = self.unique_random_config()
+                    new_contender_id = new_contender.id
+                else:
+                    new_contender = \
+                        Configuration(new_contender_id, conf, [],
+                                      Generator.crossover, self.tourn_nr)
+                self.pool[new_contender_id] = new_contender
+                if self.scenario.verbosity in (1, 2):
+                    print('\nReplaced contender',
+                          f'{contender_id} by contender',
+                          f'generated via {new_contender.gen.name}.')
+                if self.scenario.verbosity == 2:
+                    print(f'Mutation of {mutated} genes happened for',
+                          f'the new contender {new_contender_id}!\n')
+
+            # Delete scores of replaced contender and insert initial
+            # scores for new contender
+            del self.scores[contender_id]
+            self.scores[new_contender_id] = \
+                (trueskill.INITIAL_MU, trueskill.INITIAL_SIGMA)
 
     def select_contenders(self) -> None:
         """
@@ -526,28 +527,24 @@ class ResultProcessing(AbstractResultProcessing):
         -------
         None
         """
-        tournament_list = {}
-
-        # Choose the two best contenders
-        names = list(self.scores)
-        for c in range(self.scenario.contenders):
-            tournament_list[c] = [names[c], self.scores[names[c]][0]]
-        best_list = self.find_best(tournament_list, self.scenario.contenders)
+        # Choose the best contenders
+        ranking = self.scores.ranking()
+        keep = ranking[len(ranking) - self.scenario.keeptop:][::-1]
         self.contender_dict = {}
-        for keep in range(self.scenario.keeptop):
-            contender_id = best_list[self.scenario.contenders - 1 - keep][1][0]
+        for row in keep.tolist():
+            contender_id = self.scores.ids[row]
             self.contender_dict[contender_id] = self.pool[contender_id]
 
         # Fill in the rest with randomly chosen contenders from pool
-        temp_pool = copy.copy(self.pool)
-        for contender in self.contender_dict:
-            del temp_pool[contender]
+        live = self.scores.live_rows()
+        rest = live[~np.isin(live, keep)]
         random_pick = \
             random.sample(
-                list(temp_pool.keys()),
+                range(len(rest)),
                 self.scenario.number_cores - self.scenario.keeptop)
-        for rp in random_pick:
-            self.contender_dict[rp] = temp_pool[rp]
+        for rp in rest[random_pick].tolist():
+            contender_id = self.scores.ids[rp]
+            self.contender_dict[contender_id] = self.pool[contender_id]
 
         if self.scenario.verbosity == 2:
             print('\nNew contender list is:',
@@ -557,26 +554,8 @@ class ResultProcessing(AbstractResultProcessing):
 class ResultProcessingpp(ResultProcessing):
     """Process results of prvious tournament."""
 
-    def duplicates(self, ranks: list[int], rank: float) -> list[int]:
-        """
-        List the indices of the result in the results list.
-
-        Parameters
-        ----------
-        ranks : list[int]
-            List of objective results of previous tournament.
-        rank : float
-            A single result.
-
-        Returns
-        -------
-        list[int]
-            List of indices of this result in the results list.
-        """
-        return [i for i, x in enumerate(ranks) if x == rank]
-
     def get_winner(self, times: list[float], res: list[float]) \
-            -> tuple[int, list[int]]:
+            -> tuple[int, np.ndarray]:
         """
         Get index of the winning configuration including last known
         intermediate outputs to break ties. Additionally outputs complete
@@ -594,81 +573,69 @@ class ResultProcessingpp(ResultProcessing):
         tuple
             - **winner** : int,
               Index of the winner.
-            - **ranks** : list[int],
-              Ranks of the contenders..
+            - **ranks** : np.ndarray,
+              Ranks of the contenders.
         """
         if not self.scenario.objective_min:
             winner = times.index(min(times))
+            ranks = interim_ranks(self.rtac_data.interim.array().T,
+                                  self.rtac_data.interim_meaning)
 
         else:
             winner = res.index(min(res))
-
-        if not any(elem is None for sublist in self.rtac_data.interim
-                   for elem in sublist):
-
-            ranks = [0 for core in range(self.scenario.number_cores)]
-
-            interim_sorted = [[self.rtac_data.interim[j][i]
-                              for j in range(self.scenario.number_cores)]
-                              for i, _ in enumerate(self.rtac_data.interim[0])]
-
-            interim_sorted = np.array(interim_sorted)
-            interim_sorted = interim_sorted.astype(float)
-
-            for i, isort in enumerate(interim_sorted):
-                if self.rtac_data.interim_meaning[i] is \
-                        InterimMeaning.decrease:
-                    interim_sorted[i] = rankdata(isort,
-                                                 method='dense',
-                                                 nan_policy="propagate")
-                elif self.rtac_data.interim_meaning[i] is \
-                        InterimMeaning.increase:
-                    interim_sorted[i] = rankdata([-1 * i if i is not None
-                                                  else None for i in isort],
-                                                 method='dense',
-                                                 nan_policy="propagate")
-
-            for _, isort in enumerate(interim_sorted):
-                for r, _ in enumerate(ranks):
-                    ranks[r] += isort[r]
-
-            if self.scenario.objective_min:
-                res_ranks = rankdata(res, method='dense', nan_policy="propagate")
-
-                duplicates = []
-
-                for rank in sorted(set(res_ranks)):
-                    duplicates.append(self.duplicates(res_ranks, rank))
-                
-                for duplicate in duplicates:
-                    if len(duplicate) > 1:
-                        interim_ranks = [ranks[dup] for dup in duplicate]
-                        if not all(np.isnan(ir) for ir in interim_ranks):
-                            tie_winner = \
-                                duplicate[interim_ranks.index(min(interim_ranks))]
-                            interim_ranks = rankdata(interim_ranks, method='dense')
-                            interim_ranks -= min(interim_ranks)
-                            for d, ir in zip(duplicate, interim_ranks):
-                                for r, _ in enumerate(res_ranks):
-                                    if d == r and r != winner and r != tie_winner:
-                                        res_ranks[r] += interim_ranks[ir]
-                                    elif np.isnan(max(interim_ranks)):
-                                        res_ranks[r] += self.scenario.number_cores
-                                    else:
-                                        res_ranks[r] += max(interim_ranks)
-
-                ranks = res_ranks
-
-            ranks = rankdata(ranks, method='dense')
-
-        else:
-            ranks = [1 for core in range(self.scenario.number_cores)]
+            ranks = interim_ranks(self.rtac_data.interim.array().T,
+                                  self.rtac_data.interim_meaning, res)
 
         ranks[winner] = 0
 
         return winner, ranks
 
 
+def interim_ranks(interim: np.ndarray, interim_meaning: list[InterimMeaning],
+                  res: list[float] | None = None) -> np.ndarray:
+    """
+    Rank the contenders of a ReACTR++ tournament by their last interim
+    outputs. Each interim metric is ranked densely across the cores, with
+    increasing metrics sign-flipped, and the contenders are ranked by the
+    sum of their metric ranks. Missing interim values (NaN) rank behind all
+    reported values of their metric. If objective results are given, they
+    are ranked first and the interim ranks only break ties.
+
+    Parameters
+    ----------
+    interim : np.ndarray
+        Interim outputs of shape (metrics, cores), NaN where missing.
+    interim_meaning : list[InterimMeaning]
+        Whether increase or decrease signifies progress, per metric.
+    res : list[float] | None
+        Objective results of the tournament. Defaults to None.
+
+    Returns
+    -------
+    np.ndarray
+        Dense ranks of the contenders, starting at 1.
+    """
+    cores = interim.shape[1]
+    sign = np.array([-1.0 if meaning is InterimMeaning.increase else 1.0
+                     for meaning in interim_meaning])
+    interim = sign[:, None] * interim
+    interim[np.isnan(interim)] = np.inf
+    ranks = rankdata(interim, method='dense', axis=1).sum(axis=0)
+
+    if res is None:
+        return rankdata(ranks, method='dense')
+
+    # Objective results first, interim ranks break ties
+    res_ranks = rankdata(res, method='dense')
+    order = np.lexsort((ranks, res_ranks))
+    new = np.ones(cores, dtype=int)
+    new[1:] = (np.diff(res_ranks[order]) != 0) | (np.diff(ranks[order]) != 0)
+    dense = np.empty(cores, dtype=int)
+    dense[order] = np.cumsum(new)
+
+    return dense
+
+
 class ResultProcessingCPPL(AbstractResultProcessing):
     """
     Process results of previous tournament.
@@ -773,7 +740,7 @@ class ResultProcessingCPPL(AbstractResultProcessing):
 
         if not self.scenario.baselineperf:
             self.process_results(rtac_data, instance, tourn_nr)
-            if self.rtac_data.winner.value != 0:
+            if self.rtac_data.winner_id != 0:
                 self.manage_pool()
             if not self.scenario.resume:
                 self.select_contenders()
@@ -781,10 +748,10 @@ class ResultProcessingCPPL(AbstractResultProcessing):
             self.rtac_data = rtac_data
             self.rtac_data.newtime = self.rtac_data.ta_res_time[0]
 
-        if self.rtac_data.winner.value == 0:
+        if self.rtac_data.winner_id == 0:
             winner = None
         else:
-            winner = self.rtac_data.winner.value
+            winner = self.rtac_data.winner_id
 
         return winner
 
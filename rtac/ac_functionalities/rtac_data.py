@@ -2,18 +2,27 @@
 
 from abc import ABC, abstractmethod
 import time
-import copy
-from typing import Optional
-from enum import Enum
+from functools import cache
+from typing import Any, Optional
+from enum import Enum, IntEnum
 from dataclasses import dataclass, field
 from multiprocessing import (
     freeze_support,
-    Event, Manager,
-    Array, Value
+    Event, Lock,
+    Value
 )
 from uuid import UUID
 import argparse
+import hashlib
 import sys
+import numpy as np
+from rtac.ac_functionalities.shared_state import (
+    SharedState,
+    SharedArray,
+    SharedValue,
+    SharedRows,
+    SharedRing
+)
 
 
 class ACMethod(Enum):
@@ -307,6 +316,148 @@ class Configuration:
     gen: Generator
     gen_tourn: int
 
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the parameter values, see `fingerprint`."""
+        return fingerprint(self.conf)
+
+
+FINGERPRINT_DIGITS = 10
+"""Significant digits of continuous values considered by `fingerprint`."""
+
+
+def fingerprint(conf: dict) -> str:
+    """
+    Stable fingerprint of parameter values. Parameters are taken in sorted
+    order and continuous values are rounded to `FINGERPRINT_DIGITS`
+    significant digits, so configurations that only differ in key order or
+    float noise share a fingerprint. It is the same in every process and
+    run.
+
+    Parameters
+    ----------
+    conf : dict
+        Dictionary with parameter name as key and parameter value as value.
+
+    Returns
+    -------
+    str
+        Hex digest of the canonical parameter values.
+    """
+    canonical = []
+    for name in sorted(conf):
+        value = conf[name]
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, float):
+            value = float(f'{value:.{FINGERPRINT_DIGITS}g}')
+        canonical.append((name, value))
+
+    return hashlib.blake2b(repr(canonical).encode(),
+                           digest_size=16).hexdigest()
+
+
+class ConfigPool(dict):
+    """
+    Pool of configurations, a dict of configuration ID to Configuration with
+    a hash index of the configuration fingerprints that is maintained on
+    insert and delete. Checking if a configuration is already in the pool
+    takes constant time. It is logged and compared like a dict.
+
+    Parameters
+    ----------
+    *args
+        Initial configurations, as for dict.
+    **kwargs
+        Initial configurations, as for dict.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the pool and its fingerprint index."""
+        super().__init__()
+        # Fingerprint of each configuration ID when it was inserted, and IDs
+        # of each fingerprint
+        self.fingerprints = {}
+        self.ids = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, conf_id: str, conf: Configuration) -> None:
+        """Inserts or replaces a configuration, keeping its position."""
+        if conf_id in self:
+            self.unindex(conf_id)
+        super().__setitem__(conf_id, conf)
+        fp = conf.fingerprint
+        self.fingerprints[conf_id] = fp
+        self.ids.setdefault(fp, set()).add(conf_id)
+
+    def __delitem__(self, conf_id: str) -> None:
+        """Removes a configuration."""
+        super().__delitem__(conf_id)
+        self.unindex(conf_id)
+
+    def unindex(self, conf_id: str) -> None:
+        """
+        Removes a configuration ID from the fingerprint index.
+
+        Parameters
+        ----------
+        conf_id : str
+            ID of the configuration.
+
+        Returns
+        -------
+        None
+        """
+        fp = self.fingerprints.pop(conf_id)
+        ids = self.ids[fp]
+        ids.discard(conf_id)
+        if not ids:
+            del self.ids[fp]
+
+    def pop(self, conf_id: str, *default) -> Any:
+        """Removes a configuration and returns it."""
+        if conf_id not in self:
+            return super().pop(conf_id, *default)
+        conf = self[conf_id]
+        del self[conf_id]
+
+        return conf
+
+    def update(self, *args, **kwargs) -> None:
+        """Inserts configurations, as dict.update."""
+        for conf_id, conf in dict(*args, **kwargs).items():
+            self[conf_id] = conf
+
+    def clear(self) -> None:
+        """Removes all configurations."""
+        super().clear()
+        self.fingerprints.clear()
+        self.ids.clear()
+
+    def __reduce__(self) -> tuple:
+        """Copied and pickled as its configurations, the index is rebuilt."""
+        return type(self), (dict(self),)
+
+    def has_config(self, conf: Configuration | dict) -> bool:
+        """
+        Checks if a configuration with the same parameter values is in the
+        pool.
+
+        Parameters
+        ----------
+        conf : Configuration | dict
+            Configuration or its parameter values.
+
+        Returns
+        -------
+        bool
+            True if the pool holds a configuration with the same fingerprint.
+        """
+        if isinstance(conf, Configuration):
+            conf = conf.conf
+
+        return fingerprint(conf) in self.ids
+
 
 class TARunStatus(Enum):
     """
@@ -355,12 +506,32 @@ class TARun:
         configuration did not solve the problem instance.
     status : TARunStatus
         State of the configuration.
+    coalesced : int
+        Number of output lines of the run that were superseded by newer lines
+        when parsing interim output or runtime features.
+    cpu_user : float
+        User CPU time of the target algorithm process in seconds, NaN if it
+        is not available.
+    cpu_sys : float
+        System CPU time of the target algorithm process in seconds, NaN if it
+        is not available.
+    maxrss : int
+        Maximum resident set size of the target algorithm process in KiB, -1
+        if it is not available.
+    wall : float
+        Wall-clock time from the start of the target algorithm process until
+        it was reaped in seconds.
     """
     config_id: str
     config: dict
     res: int | float
     time: float
     status: TARunStatus
+    coalesced: int = 0
+    cpu_user: float = 0.0
+    cpu_sys: float = 0.0
+    maxrss: int = 0
+    wall: float = 0.0
 
 
 @dataclass
@@ -389,6 +560,15 @@ class TournamentStats:
         IDs of the contenders terminated by the gray box.
     TARuns : dict[str: TARun]
         List of TARun objects corresponding to 'configs'.
+    kill_latencies : list[float]
+        Seconds from the cap signal to the exit of the target algorithm run
+        for each core, 0 if the run was not killed.
+    survivors : list[int]
+        Number of processes of the target algorithm run still alive after
+        its termination for each core. A core with survivors is occupied.
+    message_latency : dict[str, float]
+        Largest seconds from sending to receiving a runner message by message
+        type.
     """
     id: UUID
     tourn_nr: int
@@ -399,6 +579,9 @@ class TournamentStats:
     rtac_times: list[float]
     kills: list[UUID]
     TARuns: dict[str: TARun]
+    kill_latencies: list[float] = field(default_factory=list)
+    survivors: list[int] = field(default_factory=list)
+    message_latency: dict[str, float] = field(default_factory=dict)
 
 
 class InterimMeaning(Enum):
@@ -417,6 +600,31 @@ class InterimMeaning(Enum):
     decrease = 2
 
 
+class GBRecord(IntEnum):
+    """
+    Column layout of the gray-box records in the shared ring buffer. The
+    runtime features follow from column `features` on.
+
+    Members
+    -------
+    timestamp : int
+        time.time() of the record.
+    cpu_time : int
+        CPU time expended by the run so far.
+    wall_time : int
+        Wall clock time expended by the run so far.
+    nr_features : int
+        Number of runtime features reported by the target algorithm.
+    features : int
+        First runtime feature.
+    """
+    timestamp = 0
+    cpu_time = 1
+    wall_time = 2
+    nr_features = 3
+    features = 4
+
+
 class AbstractRTACData(ABC):
     """
     Abstract class to handle picklable data structures needed to coordinate
@@ -436,7 +644,10 @@ class AbstractRTACData(ABC):
 class RTACData(AbstractRTACData):
     """
     Class to handle picklable data structures needed to coordinate
-    and process tournaments of the ReACTR implementation.
+    and process tournaments of the ReACTR implementation. The per core data
+    shared by the runners and the tournament lives in one shared memory
+    block (`SharedState`), its fields offer the interface of
+    `multiprocessing.Array` and `multiprocessing.Value`.
 
     Parameters
     ----------
@@ -451,35 +662,19 @@ class RTACData(AbstractRTACData):
         Initialize all data structures needed for ReACTR tournaments.
         """
         huge_res = sys.float_info.max * 1e-100
+        self.scenario = scenario
         self.ev = Event()
         freeze_support()
         # Using int as flags (event), since ctypes do not allow for
         # enum objects.
         self.tournID = 0
-        self.cores_start = Manager().list(
-            [core for core in range(scenario.number_cores)])
-        self.early_start_tournament = Value('b', False)  # False
+        self.cores_start = [core for core in range(scenario.number_cores)]
         self.event = Value('i', 0)
         self.newtime = Value('d', float(scenario.timeout))
         self.best_res = Value('d', huge_res)
-        self.winner = Manager().Value('c', 0)
-        self.status = \
-            Array('i', [0 for core in range(scenario.number_cores)])
-        self.pids = \
-            Array('i', [0 for core in range(scenario.number_cores)])
-        self.substart = \
-            Array('d', [0.0 for core in range(scenario.number_cores)])
-        self.substart_wall = \
-            Array('d', [0.0 for core in range(scenario.number_cores)])
-        self.ta_res = \
-            Array('d', [huge_res
-                        for core in range(scenario.number_cores)])
-        self.ta_res_time = \
-            Array('d', [scenario.timeout * scenario.runtimePAR
-                        for core in range(scenario.number_cores)])
-        self.ta_rtac_time = \
-            Array('d', [scenario.timeout * scenario.runtimePAR
-                        for core in range(scenario.number_cores)])
+        # Kept to be restored by reset(), since tournaments replace them
+        self.sync_values = (self.event, self.newtime, self.best_res)
+        self.bind_shared(SharedState(self.layout(scenario, **kwargs)))
 
         # Initialize parallel solving data
         self.process = ['process_{0}'.format(s) 
@@ -487,6 +682,165 @@ class RTACData(AbstractRTACData):
         self.start = time.time()
         self.winner_known = True
         self.skip = False
+        # Guards the winner core, the ID is resolved in the parent process
+        self.winner_lock = Lock()
+        self.winner_id = 0
+
+    def layout(self, scenario: argparse.Namespace,
+               **kwargs) -> dict[str, tuple[str, tuple[int, ...], Any]]:
+        """
+        Layout of the shared memory block: field name mapped to numpy
+        dtype, shape and initial value.
+
+        Parameters
+        ----------
+        scenario : argparse.Namespace
+            Namespace containing all settings for the RTAC.
+        **kwargs
+            Additional keyword arguments that vary by RTAC method.
+
+        Returns
+        -------
+        dict[str, tuple[str, tuple[int, ...], Any]]
+            Layout of the shared memory block.
+        """
+        cores = (scenario.number_cores,)
+        max_time = scenario.timeout * scenario.runtimePAR
+        layout = {
+            'early_start_tournament': ('?', (), False),
+            # Core of the winner, -1 until a contender wins
+            'winner': ('i4', (), -1),
+            'status': ('i4', cores, 0),
+            'pids': ('i4', cores, 0),
+            'substart': ('f8', cores, 0.0),
+            'substart_wall': ('f8', cores, 0.0),
+            'ta_res': ('f8', cores, sys.float_info.max * 1e-100),
+            'ta_res_time': ('f8', cores, max_time),
+            'ta_rtac_time': ('f8', cores, max_time),
+            'ta_coalesced': ('i4', cores, 0),
+            # time.monotonic() of the cap signal, 0 until the runs are capped
+            'cap_time': ('f8', (), 0.0),
+            'kill_latency': ('f8', cores, 0.0),
+            # Processes of the last target algorithm run left alive per core
+            'survivors': ('i4', cores, 0),
+            # Resource usage of the target algorithm processes, from os.wait4
+            'ta_cpu_user': ('f8', cores, 0.0),
+            'ta_cpu_sys': ('f8', cores, 0.0),
+            'ta_maxrss': ('i8', cores, 0),
+            'ta_wall': ('f8', cores, 0.0)
+        }
+        if scenario.gray_box:
+            layout['RuntimeFeatures'] = \
+                ('f8', (scenario.number_cores, scenario.nr_gb_feats), np.nan)
+            layout['RuntimeFeatures_len'] = ('i4', cores, 0)
+            # Ring buffer of gray-box records per core, see GBRecord
+            layout['rec_data'] = \
+                ('f8', (scenario.number_cores, scenario.gb_ring_size,
+                        GBRecord.features + scenario.nr_gb_feats), np.nan)
+            layout['rec_data_seq'] = ('i8', cores, 0)
+
+        return layout
+
+    def bind_shared(self, shared: SharedState) -> None:
+        """
+        Makes the fields of the shared memory block available as attributes.
+
+        Parameters
+        ----------
+        shared : SharedState
+            Shared memory block with the layout of this object.
+
+        Returns
+        -------
+        None
+        """
+        self.shared = shared
+        for name, (_, shape, _) in shared.layout.items():
+            if name.endswith(('_len', '_seq')):
+                continue
+            elif f'{name}_len' in shared.layout:
+                setattr(self, name, SharedRows(shared, name))
+            elif f'{name}_seq' in shared.layout:
+                setattr(self, name, SharedRing(shared, name))
+            elif shape == ():
+                setattr(self, name, SharedValue(shared, name))
+            else:
+                setattr(self, name, SharedArray(shared, name))
+
+    def reset(self) -> None:
+        """
+        Resets the data structures in place for the next tournament in
+        O(cores), without allocating shared memory, values or events. The
+        shared fields, the event and the values keep their identity, so that
+        processes that inherited them, like persistent runner workers,
+        observe the next tournament.
+
+        Returns
+        -------
+        None
+        """
+        scenario = self.scenario
+        cores = range(scenario.number_cores)
+        self.ev.clear()
+        self.tournID = 0
+        self.cores_start[:] = [core for core in cores]
+        # These are replaced by plain values during a tournament
+        self.event, self.newtime, self.best_res = self.sync_values
+        self.event.value = 0
+        self.newtime.value = float(scenario.timeout)
+        self.best_res.value = sys.float_info.max * 1e-100
+        self.shared.reset()
+
+        self.process = ['process_{0}'.format(s) for s in cores]
+        self.start = time.time()
+        self.winner_known = True
+        self.winner_id = 0
+        self.skip = False
+
+    def claim_winner(self, core: int) -> bool:
+        """
+        Compare-and-set of the winner core, called by the runner of a
+        contender that finished. In runtime mode the first finisher wins, in
+        objective mode the contender with the best result so far.
+
+        Parameters
+        ----------
+        core : int
+            Core of the finished contender.
+
+        Returns
+        -------
+        bool
+            True if the contender is the winner so far.
+        """
+        with self.winner_lock:
+            winner = self.winner.value
+            if winner == -1 or (
+                    self.scenario.objective_min
+                    and self.ta_res[core] <= self.ta_res[winner]):
+                self.winner.value = core
+                return True
+
+            return False
+
+    def resolve_winner(self, conf_id_list: list[str]) -> str | int:
+        """
+        Resolves the ID of the winning configuration after the tournament.
+
+        Parameters
+        ----------
+        conf_id_list : list[str]
+            IDs of the configurations in the tournament by core.
+
+        Returns
+        -------
+        str or int
+            ID of the winner or 0 if no contender won.
+        """
+        winner = self.winner.value
+        self.winner_id = conf_id_list[winner] if winner != -1 else 0
+
+        return self.winner_id
 
 
 class RTACDatapp(RTACData):
@@ -503,21 +857,56 @@ class RTACDatapp(RTACData):
     """
 
     def __init__(self, scenario: argparse.Namespace, **kwargs) -> None:
-        RTACData.__init__(self, scenario)
+        self.interim_meaning = kwargs.get('interim_meaning')
+        RTACData.__init__(self, scenario, **kwargs)
         """
         Initialize additional data structures needed for ReACTR++
         tournaments.
         """
-        self.interim_meaning = kwargs.get('interim_meaning')
         #self.interim_weights = interim_weights
-        self.interim = Manager().list(
-            [[None for _ in range(len(self.interim_meaning))]
-             for core in range(scenario.number_cores)])
 
         # Initialize parallel solving data
         self.interim_res = [[0 for s in range(3)]
                             for c in range(scenario.number_cores)]
 
+    def layout(self, scenario: argparse.Namespace,
+               **kwargs) -> dict[str, tuple[str, tuple[int, ...], Any]]:
+        """
+        Adds the interim output of the target algorithm runs to the layout
+        of the shared memory block. Interim values are None until reported.
+
+        Parameters
+        ----------
+        scenario : argparse.Namespace
+            Namespace containing all settings for the RTAC.
+        **kwargs
+            Additional keyword arguments that vary by RTAC method.
+
+        Returns
+        -------
+        dict[str, tuple[str, tuple[int, ...], Any]]
+            Layout of the shared memory block.
+        """
+        layout = RTACData.layout(self, scenario, **kwargs)
+        nr_interim = len(self.interim_meaning)
+        layout['interim'] = \
+            ('f8', (scenario.number_cores, nr_interim), np.nan)
+        layout['interim_len'] = ('i4', (scenario.number_cores,), nr_interim)
+
+        return layout
+
+    def reset(self) -> None:
+        """
+        Resets the data structures in place for the next tournament.
+
+        Returns
+        -------
+        None
+        """
+        RTACData.reset(self)
+        self.interim_res = [[0 for s in range(3)]
+                            for c in range(self.scenario.number_cores)]
+
 
 class GBData(RTACData):
     """
@@ -539,69 +928,92 @@ class GBData(RTACData):
         rtacdata_init(self, scenario, **kwargs)
         """
         Initialize additional data structures needed for Gray-Box
-        tournaments.
+        tournaments. The runtime features and records are part of the shared
+        memory block.
         """
         self.scenario = scenario
-        self.rec_data = {core: Manager().dict()
-                         for core in range(scenario.number_cores)}
+        # Second state slot for the early starting tournament, allocated up
+        # front so that starting it does not cost the time advantage
+        self.early_slot = self.state_slot()
 
-        self.RuntimeFeatures = Manager().list(
-            [[] for core in range(scenario.number_cores)])
+    def state_slot(self) -> AbstractRTACData:
+        """
+        Allocates a second set of shared state with the same settings.
+
+        Returns
+        -------
+        AbstractRTACData
+            Object of the same class with its own shared memory block, event
+            and values.
+        """
+        slot = self.__class__.__new__(self.__class__)
+        slot.__dict__.update(self.__dict__)
+        slot.ev = Event()
+        slot.cores_start = list(self.cores_start)
+        slot.sync_values = (Value('i', 0),
+                            Value('d', float(self.scenario.timeout)),
+                            Value('d', sys.float_info.max * 1e-100))
+        slot.bind_shared(self.shared.fresh())
+        slot.reset()
+
+        return slot
 
     def early_rtac_copy(self):
         """
-        Returns a modified copy of self to be used in an early starting 
-        tournament after terminations by gray box.
+        Returns the preallocated second state slot, reset in place, to be
+        used in an early starting tournament after terminations by gray box.
+        The early tournament of the previous instance has finished when the
+        next one starts, so the slot is reused.
 
         Returns
         -------
         AbstractRTACData
-            A modified copy of itself to be used in an early starting 
+            Reset second state slot to be used in an early starting
             tournament after terminations by gray box.
 
         """
-        early_rtac_data = self.__class__.__new__(self.__class__)
-
-        overrides = {
-            'ev': Event(),
-            'cores_start': self.cores_start,
-            'early_start_tournament': Value('b', False),
-            'event': Value('i', 0),
-            'newtime': Value('d', float(self.scenario.timeout)),
-            'best_res': Value('d', sys.float_info.max * 1e-100),
-            'winner': Manager().Value('c', 0),
-            'status': Array('i',
-                            [0 for core in range(self.scenario.number_cores)]),
-            'pids': Array('i',
-                          [0 for core in range(self.scenario.number_cores)]),
-            'substart':
-            Array('d', [0.0 for core in range(self.scenario.number_cores)]),
-            'substart_wall':
-            Array('d', [0.0 for core in range(self.scenario.number_cores)]),
-            'ta_res':
-            Array('d', [sys.float_info.max * 1e-100
-                        for core in range(self.scenario.number_cores)]),
-            'ta_res_time':
-            Array('d', [self.scenario.timeout * self.scenario.runtimePAR
-                        for core in range(self.scenario.number_cores)]),
-            'ta_rtac_time':
-            Array('d', [self.scenario.timeout * self.scenario.runtimePAR
-                        for core in range(self.scenario.number_cores)]),
-            'process':
-            ['process_{0}'.format(s)
-             for s in range(self.scenario.number_cores)],
-            'start': time.time()
-        }
+        self.early_slot.reset()
+
+        return self.early_slot
 
-        # Selectively deepcopy or shallow copy attributes
-        for key, value in self.__dict__.items():
-            if key in overrides:
-                setattr(early_rtac_data, key, overrides[key])
-            else:
-                # Safe to deepcopy
-                setattr(early_rtac_data, key, copy.deepcopy(value))
 
-        return early_rtac_data
+@cache
+def rtacdata_class(ac: ACMethod, gray_box: bool) -> type:
+    """
+    Returns the class with data structures appropriate to the RTAC method.
+    The class is built once per method and gray-box setting.
+
+    Parameters
+    ----------
+    ac : ACMethod
+        RTAC method.
+    gray_box : bool
+        True if the gray-box RTAC method is used.
+
+    Returns
+    -------
+    type
+        RTACData, RTACDatapp or their gray-box subclass.
+    """
+    if ac in (ACMethod.ReACTR, ACMethod.CPPL):
+        rtacdata = RTACData
+    elif ac == ACMethod.ReACTRpp:
+        rtacdata = RTACDatapp
+
+    if gray_box:
+
+        class rtacdata_gb(rtacdata):
+            """Gray-box variant of the rtacdata class."""
+
+            def __init__(self, scenario: argparse.Namespace, **kwargs):
+                GBData.__init__(self, scenario, rtacdata.__init__, **kwargs)
+
+            state_slot = GBData.state_slot
+            early_rtac_copy = GBData.early_rtac_copy
+
+        return rtacdata_gb
+
+    return rtacdata
 
 
 def rtacdata_factory(scenario: argparse.Namespace, **kwargs) \
@@ -623,25 +1035,7 @@ def rtacdata_factory(scenario: argparse.Namespace, **kwargs) \
         Initialized AbstractRTACData object matching the RTAC method
         of the scenario.
     """
-
-    if scenario.ac in (ACMethod.ReACTR, ACMethod.CPPL):
-        rtacdata = copy.deepcopy(RTACData)
-    elif scenario.ac == ACMethod.ReACTRpp:
-        rtacdata = copy.deepcopy(RTACDatapp)
-
-    if scenario.gray_box:
-
-        class rtacdata_copy(rtacdata):
-            """Copy of the rtacdata class."""
-
-        rtacdata_init = rtacdata.__init__
-        rtacdata_copy.__init__ = GBData.__init__
-        rtacdata_copy.early_rtac_copy = GBData.early_rtac_copy
-
-        return rtacdata_copy(scenario, rtacdata_init, **kwargs)
-
-    else:
-        return rtacdata(scenario, **kwargs)
+    return rtacdata_class(scenario.ac, scenario.gray_box)(scenario, **kwargs)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,397 @@
+"""In this module a pool of persistent, core-pinned target algorithm runner
+workers is implemented that is reused across tournaments."""
+
+from typing import Any, Callable
+import multiprocessing as mp
+import multiprocessing.connection
+import argparse
+import time
+from rtac.utils.core_map import CoreMap
+from rtac.ac_functionalities.rtac_data import (
+    Configuration,
+    RTACData,
+    RTACDatapp
+)
+from rtac.ac_functionalities.messages import (
+    RunnerChannel,
+    TournamentChannel
+)
+from rtac.ac_functionalities.logs import RTACLogs
+
+
+class RunnerJob:
+    """
+    Handle of a target algorithm run executed by a runner worker. Offers the
+    parts of the `multiprocessing.Process` interface used by the tournaments.
+
+    Parameters
+    ----------
+    worker : RunnerWorker
+        Worker executing the target algorithm run.
+    """
+
+    def __init__(self, worker: 'RunnerWorker') -> None:
+        """Initialize handle of a submitted target algorithm run."""
+        self.worker = worker
+        self.done = False
+        # Set once the worker was stopped, the job then follows the process
+        self.stopped = False
+
+    @property
+    def pid(self) -> int:
+        """PID of the worker process executing the run."""
+        return self.worker.process.pid
+
+    @property
+    def sentinel(self) -> mp.connection.Connection:
+        """Message pipe of the worker, ready when the runner reports."""
+        return self.worker.conn
+
+    def is_alive(self) -> bool:
+        """
+        Checks if the target algorithm run is still going.
+
+        Returns
+        -------
+        bool
+            True if the worker did not report the run as finished yet.
+        """
+        if self.stopped:
+            return self.worker.process.is_alive()
+        if not self.done:
+            self.done = self.worker.poll_done()
+
+        return not self.done
+
+    def terminate(self) -> None:
+        """
+        Stops the worker with SIGTERM if it did not report the run as
+        finished. The worker is restarted with the next submitted run.
+
+        Returns
+        -------
+        None
+        """
+        if not self.is_alive():
+            return
+        self.stopped = True
+        self.worker.process.terminate()
+
+    def kill(self) -> None:
+        """
+        Stops the worker with SIGKILL if it did not report the run as
+        finished. The worker is restarted with the next submitted run.
+
+        Returns
+        -------
+        None
+        """
+        if not self.is_alive():
+            return
+        self.stopped = True
+        self.worker.process.kill()
+
+    def join(self, timeout: float | None = None) -> None:
+        """
+        Waits until the worker reports the run as finished, or until the
+        worker exited if it was stopped.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum time to wait in seconds. Defaults to None.
+
+        Returns
+        -------
+        None
+        """
+        if self.stopped:
+            self.worker.process.join(timeout)
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.done:
+            # Other messages of the run may arrive before the exited message
+            wait = None if deadline is None \
+                else max(0.0, deadline - time.monotonic())
+            self.done = self.worker.poll_done(wait)
+            if wait == 0.0:
+                break
+
+
+class RunnerWorker:
+    """
+    Long-lived process that is pinned to a core and executes the target
+    algorithm runs of that core. The target algorithm runner, and with it the
+    wrapper, is created once in the worker.
+
+    Parameters
+    ----------
+    scenario : argparse.Namespace
+        Namespace containing all settings for the RTAC.
+    ta_runner : Callable
+        Factory of the target algorithm runner.
+    logs : RTACLogs
+        Object containing loggers and logging functions.
+    core : int
+        Logical core slot of the worker.
+    cpu : int
+        CPU the worker is pinned to.
+    rtac_data : RTACData | RTACDatapp
+        Object containing data and objects necessary throughout the RTAC
+        modules. It is inherited by the worker and has to be reset in place
+        between tournaments.
+    """
+
+    def __init__(self, scenario: argparse.Namespace, ta_runner: Callable,
+                 logs: RTACLogs, core: int, cpu: int,
+                 rtac_data: RTACData | RTACDatapp) -> None:
+        """Starts the worker process."""
+        self.scenario = scenario
+        self.ta_runner = ta_runner
+        self.logs = logs
+        self.core = core
+        self.cpu = cpu
+        self.rtac_data = rtac_data
+        self.start()
+
+    def start(self) -> None:
+        """
+        Starts the worker process. The worker pins itself to its core and
+        binds the target algorithm runs it starts before exec.
+
+        Returns
+        -------
+        None
+        """
+        self.conn, worker_conn = mp.Pipe()
+        # Jobs are sent over the same pipe as the runner messages
+        self.channel = TournamentChannel(self.conn, self.core)
+        self.process = mp.Process(target=self.serve, args=[worker_conn],
+                                  daemon=True)
+        self.process.start()
+        worker_conn.close()
+
+    def serve(self, conn: mp.connection.Connection) -> None:
+        """
+        Main loop of the worker process. Receives (instance, configuration,
+        configuration ID, tournament ID) jobs until None is received. The
+        runner reports the run over the same pipe, ending with the exited
+        message.
+
+        Parameters
+        ----------
+        conn : mp.connection.Connection
+            Worker end of the pipe to the pool.
+
+        Returns
+        -------
+        None
+        """
+        ta_runner = self.ta_runner(self.scenario, self.logs, self.core)
+        ta_runner.cpu = self.cpu
+        # The runner replaces these by plain values during a run
+        event, newtime = self.rtac_data.event, self.rtac_data.newtime
+        while True:
+            try:
+                job = conn.recv()
+            except EOFError:
+                break
+            if job is None:
+                break
+            if not isinstance(job, tuple):
+                # Cap message that arrived after the run ended
+                continue
+            instance, config, config_id, tourn_id = job
+            self.rtac_data.event = event
+            self.rtac_data.newtime = newtime
+            ta_runner.config_id = config_id
+            ta_runner.channel = RunnerChannel(conn, self.core, tourn_id)
+            try:
+                ta_runner.run(instance, config, self.rtac_data)
+            except Exception as e:
+                self.logs.general_log(
+                    f'Runner worker on core {self.core} failed on '
+                    f'{instance}: {e}')
+        conn.close()
+
+    def submit(self, instance: str, config: Any, config_id: str,
+               tourn_id: str) -> RunnerJob:
+        """
+        Sends a target algorithm run to the worker. A worker that died is
+        restarted first.
+
+        Parameters
+        ----------
+        instance : str
+            Path to the problem instance to solve.
+        config : Any
+            Configuration in the format of the wrapper.
+        config_id : str
+            ID of the configuration.
+        tourn_id : str
+            ID of the tournament of the run.
+
+        Returns
+        -------
+        RunnerJob
+            Handle of the submitted run.
+        """
+        if not self.process.is_alive():
+            self.logs.general_log(
+                f'Restarting runner worker on core {self.core}.')
+            self.conn.close()
+            self.start()
+        # Messages of the previous run are of no interest anymore
+        self.channel.poll(0)
+        self.channel.messages()
+        self.channel.exited = False
+        self.conn.send((instance, config, config_id, tourn_id))
+
+        return RunnerJob(self)
+
+    def poll_done(self, timeout: float | None = 0) -> bool:
+        """
+        Checks if the worker reported the current run as finished.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum time to wait in seconds. Defaults to 0.
+
+        Returns
+        -------
+        bool
+            True if the run is finished or the worker died.
+        """
+        if self.channel.poll(timeout):
+            return True
+
+        return not self.process.is_alive()
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker process.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+class RunnerPool:
+    """
+    Pool of one persistent runner worker per core, created once by the
+    tournament manager and reused by all tournaments.
+
+    Parameters
+    ----------
+    scenario : argparse.Namespace
+        Namespace containing all settings for the RTAC.
+    ta_runner : Callable
+        Factory of the target algorithm runner.
+    logs : RTACLogs
+        Object containing loggers and logging functions.
+    rtac_data : RTACData | RTACDatapp
+        Object containing data and objects necessary throughout the RTAC
+        modules. It is inherited by the workers and has to be reset in place
+        between tournaments.
+    core_map : CoreMap
+        Mapping of the logical core slots to CPUs.
+    """
+
+    def __init__(self, scenario: argparse.Namespace, ta_runner: Callable,
+                 logs: RTACLogs, rtac_data: RTACData | RTACDatapp,
+                 core_map: CoreMap) -> None:
+        """Starts the runner workers."""
+        self.rtac_data = rtac_data
+        self.workers = [RunnerWorker(scenario, ta_runner, logs, core,
+                                     core_map.cpu(core), rtac_data)
+                        for core in range(scenario.number_cores)]
+        # Runner in this process, only used to translate configurations
+        self.translator = ta_runner(scenario, logs, 0)
+        self.closed = False
+
+    def translate_config(self, config: Configuration) -> Any:
+        """
+        Convert dictionary representation of the configuration to the format
+        needed by the wrapper.
+
+        Parameters
+        ----------
+        config : Configuration
+            Configuration of parameter values to run the problem instance with.
+
+        Returns
+        -------
+        Any
+            New representation of the configuration.
+        """
+        return self.translator.translate_config(config)
+
+    def submit(self, core: int, instance: str, config: Any,
+               config_id: str, tourn_id: str) -> RunnerJob:
+        """
+        Sends a target algorithm run to the worker of the core.
+
+        Parameters
+        ----------
+        core : int
+            Core to run the target algorithm on.
+        instance : str
+            Path to the problem instance to solve.
+        config : Any
+            Configuration in the format of the wrapper.
+        config_id : str
+            ID of the configuration.
+        tourn_id : str
+            ID of the tournament of the run.
+
+        Returns
+        -------
+        RunnerJob
+            Handle of the submitted run.
+        """
+        return self.workers[core].submit(instance, config, config_id,
+                                         tourn_id)
+
+    def channel(self, core: int) -> TournamentChannel:
+        """
+        Returns the tournament end of the message pipe of a worker.
+
+        Parameters
+        ----------
+        core : int
+            Core of the worker.
+
+        Returns
+        -------
+        TournamentChannel
+            Tournament end of the message pipe.
+        """
+        return self.workers[core].channel
+
+    def shutdown(self) -> None:
+        """
+        Stops all runner workers.
+
+        Returns
+        -------
+        None
+        """
+        if not self.closed:
+            for worker in self.workers:
+                worker.shutdown()
+            self.closed = True
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,311 @@
+"""In this module the shared memory block holding the tournament state that
+runners and the tournament exchange is implemented, together with views on
+its fields offering the interface of `multiprocessing.Array` and
+`multiprocessing.Value`."""
+
+from typing import Any
+from multiprocessing import shared_memory
+import weakref
+import math
+import os
+import numpy as np
+
+
+def _unlink(shm: shared_memory.SharedMemory, owner: int) -> None:
+    """
+    Removes the shared memory block once the creating process drops it.
+    Mappings of other processes stay valid until they are closed.
+
+    Parameters
+    ----------
+    shm : shared_memory.SharedMemory
+        Shared memory block.
+    owner : int
+        PID of the process that created the block.
+
+    Returns
+    -------
+    None
+    """
+    if os.getpid() == owner:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedState:
+    """
+    One `multiprocessing.shared_memory` block with a fixed numpy struct
+    layout. Processes forked after its creation share the block, other
+    processes attach to it by name when it is unpickled.
+
+    Parameters
+    ----------
+    layout : dict[str, tuple[str, tuple[int, ...], Any]]
+        Field name mapped to numpy dtype, shape and initial value.
+    name : str | None
+        Name of an existing block to attach to. Defaults to None, which
+        creates a new block.
+    """
+
+    def __init__(self, layout: dict[str, tuple[str, tuple[int, ...], Any]],
+                 name: str | None = None) -> None:
+        """Creates or attaches to the shared memory block."""
+        self.layout = layout
+        # Released before the block on garbage collection
+        self.data = None
+        self.dtype = np.dtype([(field, dtype, shape)
+                               for field, (dtype, shape, _)
+                               in layout.items()])
+        self.template = np.zeros((), dtype=self.dtype)
+        for field, (_, _, initial) in layout.items():
+            self.template[field] = initial
+
+        if name is None:
+            self.shm = shared_memory.SharedMemory(
+                create=True, size=max(self.dtype.itemsize, 1))
+            self.data = np.ndarray((), dtype=self.dtype, buffer=self.shm.buf)
+            self.data[...] = self.template
+            weakref.finalize(self, _unlink, self.shm, os.getpid())
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.data = np.ndarray((), dtype=self.dtype, buffer=self.shm.buf)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        """numpy view of a field."""
+        return self.data[field]
+
+    def reset(self) -> None:
+        """
+        Sets all fields to their initial values with one copy.
+
+        Returns
+        -------
+        None
+        """
+        self.data[...] = self.template
+
+    def fresh(self) -> 'SharedState':
+        """
+        Creates a new block with the same layout and initial values.
+
+        Returns
+        -------
+        SharedState
+            New shared state.
+        """
+        return SharedState(self.layout)
+
+    def __getstate__(self) -> tuple[dict, str]:
+        """Pickled as layout and name of the block."""
+        return self.layout, self.shm.name
+
+    def __setstate__(self, state: tuple[dict, str]) -> None:
+        """Attaches to the block on unpickling."""
+        self.__init__(*state)
+
+
+class SharedField:
+    """
+    View on a field of a `SharedState`.
+
+    Parameters
+    ----------
+    state : SharedState
+        Shared memory block.
+    field : str
+        Name of the field.
+    """
+
+    def __init__(self, state: SharedState, field: str) -> None:
+        """Creates the numpy view on the field."""
+        self.state = state
+        self.field = field
+        self.view = state[field]
+
+    def __getstate__(self) -> tuple[SharedState, str]:
+        """Pickled as block and field name."""
+        return self.state, self.field
+
+    def __setstate__(self, state: tuple[SharedState, str]) -> None:
+        """Recreates the view on unpickling."""
+        self.__init__(*state)
+
+
+class SharedArray(SharedField):
+    """
+    One dimensional field with the interface of `multiprocessing.Array`.
+    Items and slices are returned as Python numbers and lists.
+    """
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Item as Python number or slice as list."""
+        if isinstance(index, slice):
+            return self.view[index].tolist()
+        return self.view[index].item()
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        """Sets an item or a slice."""
+        self.view[index] = value
+
+    def __len__(self) -> int:
+        """Number of items."""
+        return len(self.view)
+
+    def __iter__(self):
+        """Iterates over the items as Python numbers."""
+        return iter(self.view.tolist())
+
+    def __repr__(self) -> str:
+        """Representation as list."""
+        return repr(self.view.tolist())
+
+
+class SharedValue(SharedField):
+    """
+    Scalar field with the interface of `multiprocessing.Value`.
+    """
+
+    @property
+    def value(self) -> Any:
+        """Value as Python object."""
+        return self.view.item()
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self.view[...] = value
+
+
+class SharedRows(SharedField):
+    """
+    Per core rows of floats of varying length up to the width of the field,
+    e.g. interim output or runtime features. NaN entries read as None. The
+    length of each row is kept in the field '<field>_len'.
+    """
+
+    def __init__(self, state: SharedState, field: str) -> None:
+        """Creates the numpy views on the values and lengths."""
+        super().__init__(state, field)
+        self.lengths = state[f'{field}_len']
+
+    def __getitem__(self, core: int | slice) -> list | list[list]:
+        """Row of a core, or rows of a slice of cores, as lists."""
+        if isinstance(core, slice):
+            return [self[c] for c in range(len(self))[core]]
+        return [None if math.isnan(v) else v
+                for v in self.view[core, :self.lengths[core]].tolist()]
+
+    def __setitem__(self, core: int | slice, row: list | list[list]) -> None:
+        """Sets the row of a core, or the rows of a slice of cores."""
+        if isinstance(core, slice):
+            for c, r in zip(range(len(self))[core], row):
+                self[c] = r
+            return
+        if len(row) > self.view.shape[1]:
+            raise ValueError(f'Row of length {len(row)} does not fit the '
+                             f'width {self.view.shape[1]} of {self.field}.')
+        self.view[core, :len(row)] = [np.nan if v is None else v
+                                      for v in row]
+        self.lengths[core] = len(row)
+
+    def array(self) -> np.ndarray:
+        """
+        Copy of all rows as one float array of shape (rows, width), NaN
+        where a row has no value.
+
+        Returns
+        -------
+        np.ndarray
+            Rows padded with NaN.
+        """
+        return np.where(np.arange(self.view.shape[1]) < self.lengths[:, None],
+                        self.view, np.nan)
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self.view)
+
+    def __iter__(self):
+        """Iterates over the rows as lists."""
+        return (self[core] for core in range(len(self)))
+
+    def __repr__(self) -> str:
+        """Representation as list of lists."""
+        return repr(list(self))
+
+
+class SharedRing(SharedField):
+    """
+    Per core ring buffer of float rows, e.g. gray-box records, with one
+    writer and one reader per core. The number of rows written so far is
+    kept in the field '<field>_seq' and published after the row, so the
+    reader never sees a partially written row. No locks are taken. Rows
+    older than the capacity are overwritten.
+    """
+
+    def __init__(self, state: SharedState, field: str) -> None:
+        """Creates the numpy views on the rows and sequence counters."""
+        super().__init__(state, field)
+        self.seq = state[f'{field}_seq']
+        self.capacity = self.view.shape[1]
+
+    def append(self, core: int, row: list) -> None:
+        """
+        Writes a row to the ring of a core. Missing trailing values are NaN.
+
+        Parameters
+        ----------
+        core : int
+            Core the writer runs on.
+        row : list
+            Values of the row.
+
+        Returns
+        -------
+        None
+        """
+        if len(row) > self.view.shape[2]:
+            raise ValueError(f'Row of length {len(row)} does not fit the '
+                             f'width {self.view.shape[2]} of {self.field}.')
+        seq = int(self.seq[core])
+        slot = self.view[core, seq % self.capacity]
+        slot[:len(row)] = row
+        slot[len(row):] = np.nan
+        self.seq[core] = seq + 1
+
+    def since(self, core: int, seen: int) -> tuple[np.ndarray, int]:
+        """
+        Returns the rows of a core written after the first `seen` rows, as a
+        view on the ring unless they wrap around its end.
+
+        Parameters
+        ----------
+        core : int
+            Core to read from.
+        seen : int
+            Number of rows of the core read so far.
+
+        Returns
+        -------
+        tuple[np.ndarray, int]
+            New rows, oldest first, and the new number of rows read.
+        """
+        seq = int(self.seq[core])
+        first = max(seen, seq - self.capacity)
+        start, stop = first % self.capacity, seq % self.capacity
+        if first == seq:
+            return self.view[core, :0], seq
+        if start < stop:
+            return self.view[core, start:stop], seq
+
+        return np.concatenate((self.view[core, start:],
+                               self.view[core, :stop])), seq
+
+    def __len__(self) -> int:
+        """Number of cores."""
+        return len(self.view)
+
+
+if __name__ == "__main__":
+    pass
@@ -2,21 +2,35 @@
 through the wrapper are implemented."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 from multiprocessing import Event
+from collections import deque
+import asyncio
+import selectors
 import fcntl
 import os
 import sys
+import math
 import time
-import signal
 import importlib
+import signal
 import argparse
+import psutil
+from rtac.utils.process_affinity import placement_preexec
+from rtac.utils.process_tree import (
+    CgroupLeaf,
+    is_group_leader,
+    tree_members,
+    signal_tree,
+    survivors
+)
 from rtac.ac_functionalities.rtac_data import (
     ACMethod,
     Configuration,
     RTACData,
     RTACDatapp
 )
+from rtac.ac_functionalities.messages import MessageType, RunnerChannel
 from rtac.ac_functionalities.logs import RTACLogs
 
 
@@ -50,6 +64,294 @@ def non_block_read(ta_output: bytes, logs: RTACLogs = None) -> str:
         return ''
 
 
+class TAOutputReader:
+    """
+    Event-driven reader for the `subprocess.PIPE` output of a target algorithm
+    run. Instead of polling the pipe, the reader blocks in a selector (epoll on
+    Linux) until the pipe is readable, the target algorithm process exits or a
+    timeout expires. The pipe is set to non-blocking mode once and everything
+    available is read with `os.read` into a line buffer.
+
+    Parameters
+    ----------
+    proc : subprocess.Popen
+        Target algorithm process whose stdout is observed.
+    logs : RTACLogs
+        Object containing loggers and logging functions. Defaults to None.
+    """
+
+    def __init__(self, proc, logs: RTACLogs = None) -> None:
+        """Registers the output pipe and, if available, a process file
+        descriptor of the target algorithm run with a selector."""
+        self.proc = proc
+        self.logs = logs
+        self.fd = proc.stdout.fileno()
+        os.set_blocking(self.fd, False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.fd, selectors.EVENT_READ, 'output')
+        self.pidfd = None
+        if hasattr(os, 'pidfd_open'):
+            try:
+                self.pidfd = os.pidfd_open(proc.pid)
+                self.selector.register(self.pidfd, selectors.EVENT_READ,
+                                       'exit')
+            except OSError:
+                self.pidfd = None
+        self.lines = deque()
+        self.partial = b''
+        self.eof = False
+        self.exited = False
+
+    def watch(self, channel: RunnerChannel) -> None:
+        """
+        Additionally wakes `wait` when a message from the tournament arrives.
+
+        Parameters
+        ----------
+        channel : RunnerChannel
+            Runner end of the message pipe.
+
+        Returns
+        -------
+        None
+        """
+        self.selector.register(channel, selectors.EVENT_READ, 'control')
+
+    def wait(self, timeout: float | None) -> bool:
+        """
+        Blocks until output of the target algorithm is available, the target
+        algorithm process exits, a message from the tournament arrives or the
+        timeout expires.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum time in seconds to block. None blocks until an event.
+
+        Returns
+        -------
+        bool
+            True if complete output lines are buffered.
+        """
+        if self.lines:
+            return True
+        if self.finished():
+            # Nothing left to wait for, only honor the timeout
+            if timeout is not None:
+                time.sleep(max(timeout, 0))
+            return False
+        for key, _ in self.selector.select(timeout):
+            if key.data == 'exit':
+                self.exited = True
+                self.selector.unregister(self.pidfd)
+                os.close(self.pidfd)
+                self.pidfd = None
+        self.read_available()
+
+        return bool(self.lines)
+
+    def read_available(self) -> None:
+        """
+        Reads all output currently available in the pipe and splits it into
+        lines.
+
+        Returns
+        -------
+        None
+        """
+        if self.eof:
+            return
+        chunks = [self.partial]
+        while True:
+            try:
+                chunk = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError as e:  # Pipe closed by the wrapper
+                if self.logs is not None:
+                    self.logs.general_log(e)
+                chunk = b''
+            if not chunk:
+                self.eof = True
+                self.selector.unregister(self.fd)
+                break
+            chunks.append(chunk)
+        *complete, self.partial = b''.join(chunks).split(b'\n')
+        self.lines.extend(line + b'\n' for line in complete)
+        if self.eof and self.partial:
+            self.lines.append(self.partial)
+            self.partial = b''
+
+    def readline(self, ta_output: bytes = None, logs: RTACLogs = None) -> bytes:
+        """
+        Returns the next buffered output line. Has the signature of
+        `non_block_read`, so that it can be passed to the wrapper's
+        `check_if_solved`. If no line is buffered, it waits briefly for more
+        output.
+
+        Parameters
+        ----------
+        ta_output : bytes
+            Ignored, present for compatibility with `non_block_read`.
+        logs : RTACLogs
+            Ignored, present for compatibility with `non_block_read`.
+
+        Returns
+        -------
+        bytes
+            Next line of output or an empty bytestring if none is available.
+        """
+        if not self.lines:
+            self.wait(0.005)
+        if self.lines:
+            return self.lines.popleft()
+        return b''
+
+    def finished(self) -> bool:
+        """
+        Whether all output was read and no more output can arrive.
+
+        Returns
+        -------
+        bool
+            True if the pipe reached EOF and nothing is buffered.
+        """
+        return self.eof and not self.lines
+
+    def close(self) -> None:
+        """
+        Releases the selector and the process file descriptor.
+
+        Returns
+        -------
+        None
+        """
+        if self.pidfd is not None:
+            os.close(self.pidfd)
+            self.pidfd = None
+        self.selector.close()
+
+
+class PipeHandle:
+    """
+    Read end of a target algorithm output pipe owned by the asyncio tournament
+    engine. Closing it is left to the engine, so that wrappers calling
+    `proc.stdout.close()` do not close a descriptor the event loop watches.
+
+    Parameters
+    ----------
+    fd : int
+        File descriptor of the read end of the pipe.
+    """
+
+    def __init__(self, fd: int) -> None:
+        """Stores the file descriptor."""
+        self.fd = fd
+
+    def fileno(self) -> int:
+        """
+        Returns the file descriptor of the pipe.
+
+        Returns
+        -------
+        int
+            File descriptor.
+        """
+        return self.fd
+
+    def close(self) -> None:
+        """
+        Does nothing, the pipe is closed by the asyncio tournament engine.
+
+        Returns
+        -------
+        None
+        """
+
+
+class AsyncTAProcess:
+    """
+    Gives an `asyncio.subprocess.Process` the parts of the `subprocess.Popen`
+    interface used by the target algorithm runner and the wrappers.
+
+    Parameters
+    ----------
+    proc : asyncio.subprocess.Process
+        Target algorithm process started by the asyncio tournament engine.
+    stdout : int
+        File descriptor of the read end of the output pipe.
+    """
+
+    def __init__(self, proc: asyncio.subprocess.Process, stdout: int) -> None:
+        """Wraps the asyncio process and its output pipe."""
+        self.aproc = proc
+        self.pid = proc.pid
+        self.stdout = PipeHandle(stdout)
+
+    @property
+    def returncode(self) -> int | None:
+        """Exit code of the process or None if it was not reaped yet."""
+        return self.aproc.returncode
+
+    def poll(self) -> int | None:
+        """
+        Returns the exit code of the process or None if it is running.
+
+        Returns
+        -------
+        int | None
+            Exit code of the process.
+        """
+        return self.aproc.returncode
+
+    def send_signal(self, sig: int) -> None:
+        """
+        Sends a signal to the process if it was not reaped yet.
+
+        Parameters
+        ----------
+        sig : int
+            Signal to send.
+
+        Returns
+        -------
+        None
+        """
+        if self.aproc.returncode is None:
+            try:
+                self.aproc.send_signal(sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self) -> None:
+        """
+        Sends SIGTERM to the process if it was not reaped yet.
+
+        Returns
+        -------
+        None
+        """
+        if self.aproc.returncode is None:
+            try:
+                self.aproc.terminate()
+            except ProcessLookupError:
+                pass
+
+    def kill(self) -> None:
+        """
+        Sends SIGKILL to the process if it was not reaped yet.
+
+        Returns
+        -------
+        None
+        """
+        if self.aproc.returncode is None:
+            try:
+                self.aproc.kill()
+            except ProcessLookupError:
+                pass
+
+
 class AbstractTARunner(ABC):
     """
     Abstract TARunner.
@@ -202,6 +504,14 @@ class BaseTARunner(AbstractTARunner):
         self.logs = logs
         self.core = core
         self.max_float = sys.float_info.max * 1e-100
+        # Interval to check for cancellation while blocking on TA output
+        self.ev_check_interval = 0.05
+        self.nnr = non_block_read
+        # CPU of the core slot, set by the tournament or the runner worker
+        self.cpu = None
+        # Message pipe to the tournament, set by the tournament or the runner
+        # worker, without it runs are capped via rtac_data.ev only
+        self.channel = None
         module = importlib.import_module(scenario.wrapper)
         name = scenario.wrapper_name
         self.wrapper = getattr(module, name)()
@@ -255,14 +565,62 @@ class BaseTARunner(AbstractTARunner):
         if self.scenario.objective_min:
             self.om_start = time.time()
 
+        self.wrapper.preexec_fn = self.placement()
         self.proc, self.proc_cpu_time = \
             self.wrapper.start(self.config, self.scenario.timeout,
                                self.instance)
         
         self.pid = self.proc.pid
+        self.wall_start = time.monotonic()
+        self.reaped = False
         self.rtac_data.pids[self.core] = self.pid
+        self.track_tree()
         self.running = True
         self.rtac_data.status[self.core] = 1  # TARunStatus.running
+        self.send(MessageType.started, self.pid)
+
+    def send(self, type: MessageType, data: Any = None) -> None:
+        """
+        Sends a message to the tournament, if there is a message pipe.
+
+        Parameters
+        ----------
+        type : MessageType
+            Type of the message.
+        data : Any
+            Payload depending on the type. Defaults to None.
+
+        Returns
+        -------
+        None
+        """
+        if self.channel is not None:
+            self.channel.send(type, data)
+
+    def cap_received(self) -> bool:
+        """
+        Checks without blocking if the tournament sent the cap message.
+
+        Returns
+        -------
+        bool
+            True if the run was capped by the tournament.
+        """
+        return self.channel is not None and self.channel.capped()
+
+    def placement(self) -> Callable | None:
+        """
+        Creates the function that binds the target algorithm to the CPU of
+        this runner and sets its priority (`scenario.nice`,
+        `scenario.ionice`) in the child process before exec.
+
+        Returns
+        -------
+        Callable | None
+            Function to run before exec or None if there is nothing to set.
+        """
+        return placement_preexec(self.cpu, self.scenario.nice,
+                                 self.scenario.ionice)
 
     def check_output(self, ta_output: bytes) -> None:
         """
@@ -279,18 +637,105 @@ class BaseTARunner(AbstractTARunner):
         None
         """
         if ta_output != b'':
-            if_solved = \
-                self.wrapper.check_if_solved(ta_output, non_block_read,
-                                             self.proc)
+            self.check_solved(ta_output)
+            self.check_runtime_output([ta_output])
+
+    def check_outputs(self) -> None:
+        """
+        Drains all output lines buffered by the reader. Every line is checked
+        for the completion marker, but only the newest parseable line of the
+        batch is used for interim output and runtime features. The number of
+        lines superseded this way is counted in `rtac_data.ta_coalesced`.
+
+        Returns
+        -------
+        None
+        """
+        ta_outputs = []
+        while self.reader.lines and \
+                self.rtac_data.ta_res[self.core] == self.max_float:
+            ta_output = self.reader.lines.popleft()
+            if ta_output != b'':
+                ta_outputs.append(ta_output)
+                self.check_solved(ta_output)
+
+        if ta_outputs:
+            self.check_runtime_output(ta_outputs)
+            if self.parses_runtime_output():
+                self.rtac_data.ta_coalesced[self.core] += len(ta_outputs) - 1
+
+    def check_solved(self, ta_output: bytes) -> None:
+        """
+        Declares the instance as solved by the contender if the corresponding
+        marker is present in the output line.
+
+        Parameters
+        ----------
+        ta_output : bytes
+            Output line from `subprocess.PIPE`.
+
+        Returns
+        -------
+        None
+        """
+        if_solved = \
+            self.wrapper.check_if_solved(ta_output, self.nnr, self.proc)
+
+        if if_solved is not None:
+            res, self.time, self.rtac_data.event = if_solved
+            self.rtac_data.ta_res[self.core] = res
+            self.rtac_data.ta_res_time[self.core] = self.time
+            self.rtac_data.status[self.core] = 2  # TARunStatus.finished
+
+    def parses_runtime_output(self) -> bool:
+        """
+        Whether output lines are parsed for more than the completion marker.
+
+        Returns
+        -------
+        bool
+            True if runtime features are recorded.
+        """
+        return self.scenario.gray_box
+
+    def check_runtime_output(self, ta_outputs: list[bytes]) -> None:
+        """
+        Records runtime features from the newest parseable output line, if
+        gray-box RAC is enabled.
+
+        Parameters
+        ----------
+        ta_outputs : list[bytes]
+            Output lines from `subprocess.PIPE`, oldest first.
+
+        Returns
+        -------
+        None
+        """
+        if self.scenario.gray_box:
+            self.gb_record(ta_outputs)
+
+    def latest_output(self, ta_outputs: list[bytes]) -> Any:
+        """
+        Parses output lines from newest to oldest via the wrapper and returns
+        the first result that is not None.
+
+        Parameters
+        ----------
+        ta_outputs : list[bytes]
+            Output lines from `subprocess.PIPE`, oldest first.
 
-            if if_solved is not None:
-                res, self.time, self.rtac_data.event = if_solved
-                self.rtac_data.ta_res[self.core] = res
-                self.rtac_data.ta_res_time[self.core] = self.time
-                self.rtac_data.status[self.core] = 2  # TARunStatus.finished
+        Returns
+        -------
+        Any
+            Parsed output of the newest parseable line or None.
+        """
+        for ta_output in reversed(ta_outputs):
+            parsed = self.wrapper.check_output(ta_output)
+            if parsed is not None:
+                return parsed
 
-            if self.scenario.gray_box:
-                self.gb_record(ta_output)
+        return None
 
     def check_result(self) -> None:
         """
@@ -306,50 +751,260 @@ class BaseTARunner(AbstractTARunner):
             round(
                 (time.process_time_ns() - self.proc_cpu_time) * 10**(-9)
                 + self.time, 2)
-        self.rtac_data.ev.set()
-        self.rtac_data.event = 1
         if not self.scenario.objective_min:
-            self.rtac_data.winner.value = self.config_id
-        elif self.rtac_data.ta_res[self.core] <= min(self.rtac_data.ta_res[:]):
-            self.rtac_data.winner.value = self.config_id
+            self.rtac_data.cap_time.value = time.monotonic()
+        if self.channel is None:
+            # Nobody listens for the solved message, cap the other runs
+            self.rtac_data.ev.set()
+        self.rtac_data.event = 1
+        self.rtac_data.claim_winner(self.core)
         self.rtac_data.newtime = self.rtac_data.ta_res_time[self.core]
         self.running = False
         self.rtac_data.status[self.core] = 2  # TARunStatus.finished
+        self.send(MessageType.solved,
+                  (self.rtac_data.ta_res[self.core],
+                   self.rtac_data.ta_res_time[self.core]))
 
     def kill_run(self) -> None:
         """
-        Terminates this process/ target algorithm run, as well as the other
-        contenders. Several layers of termination are included to ensure
-        termination on different platforms.
+        Terminates the target algorithm run of this runner together with all
+        processes it started. SIGTERM is sent first, SIGKILL follows if the
+        target algorithm did not exit within `scenario.kill_grace` seconds.
+        The time from the cap signal to the exit of the target algorithm is
+        recorded in `rtac_data.kill_latency`.
 
         Returns
         -------
         None
         """
-        if self.rtac_data.status[self.core] != 2:
+        kill_start = time.monotonic()
+        if self.rtac_data.status[self.core] == 1:  # TARunStatus.running
             self.rtac_data.status[self.core] = 3  # TARunStatus.capped
         self.running = False
-        self.proc.terminate()
-        time.sleep(0.1)
-        if self.proc.poll() is None:
-            self.proc.kill()
-            time.sleep(0.1)
-            if not self.scenario.objective_min:
-                for ii in range(self.scenario.number_cores):
-                    if (self.rtac_data.substart[ii]
-                        - time.process_time_ns()) * 1e-9 >= \
-                            self.rtac_data.newtime.value and \
-                            ii != self.core:
-                        os.kill(self.rtac_data.pids[ii], signal.SIGKILL)
-            time.sleep(0.1)
+        # Descendants are reparented once the target algorithm exits, the
+        # PID of a reaped target algorithm may belong to another process
+        running = not self.reap_run(0)
+        members = tree_members(self.pid) if running else []
+        if running:
+            self.terminate_tree(members)
+            self.record_kill_latency(kill_start)
+            if self.rtac_data.status[self.core] != 2:  # TARunStatus.finished
+                self.send(MessageType.capped,
+                          self.rtac_data.status[self.core])
+        self.clear_tree(members)
+
+    def terminate_tree(self, members: list) -> None:
+        """
+        Sends SIGTERM to the target algorithm run, SIGKILL follows if the
+        target algorithm did not exit within `scenario.kill_grace` seconds.
+        Blocks until the target algorithm is reaped.
+
+        Parameters
+        ----------
+        members : list
+            Descendants of the target algorithm collected before the signal.
+
+        Returns
+        -------
+        None
+        """
+        self.signal_tree(signal.SIGTERM, members)
+        if not self.reap_run(self.scenario.kill_grace):
+            self.signal_tree(signal.SIGKILL, members)
+            self.reap_run()
+
+    def finish_run(self) -> None:
+        """
+        Reaps the target algorithm after the run ended without being capped.
+        A target algorithm that does not exit within `scenario.kill_grace`
+        seconds is terminated with all processes it started, so it does not
+        keep running on the core. Runs reaped by `kill_run` are left as they
+        are.
+
+        Returns
+        -------
+        None
+        """
+        if self.reaped:
+            return
+        self.running = False
+        members = []
+        if not self.reap_run(self.scenario.kill_grace):
+            members = tree_members(self.pid)
+            self.logs.general_log(
+                f'Target algorithm run {self.pid} on core {self.core} did '
+                f'not exit within {self.scenario.kill_grace} s after its '
+                'run ended, terminating it.')
+            self.terminate_tree(members)
+        self.clear_tree(members)
+
+    def reap_run(self, timeout: float | None = None) -> bool:
+        """
+        Reaps the target algorithm process with `os.wait4` and records its
+        resource usage. `subprocess.Popen` is never asked to wait for the
+        process, since it would reap it without the resource usage.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum time to wait in seconds. None blocks until the process
+            exits. Defaults to None.
+
+        Returns
+        -------
+        bool
+            True if the process was reaped.
+        """
+        if self.reaped:
+            return True
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        while True:
             try:
-                os.kill(self.pid, signal.SIGKILL)
-            except Exception as e:
-                self.logs.general_log(e)
-                pass
+                pid, status, rusage = os.wait4(
+                    self.pid, 0 if timeout is None else os.WNOHANG)
+            except ChildProcessError:  # Reaped by the wrapper
+                self.reaped = True
+                self.record_usage(None)
+                return True
+            if pid:
+                self.proc.returncode = os.waitstatus_to_exitcode(status)
+                self.record_usage(rusage)
+                self.reaped = True
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+
+    def record_usage(self, rusage: Any) -> None:
+        """
+        Records the CPU time, maximum resident set size and wall-clock time
+        of the reaped target algorithm process. Unlike `ta_rtac_time`, these
+        do not contain the overhead of the runner. If the process was reaped
+        by someone else, its resource usage is lost: The CPU times are NaN
+        and the maximum resident set size is -1, so the run is not taken for
+        one without cost.
+
+        Parameters
+        ----------
+        rusage : resource.struct_rusage | None
+            Resource usage returned by `os.wait4`, None if it is not
+            available.
+
+        Returns
+        -------
+        None
+        """
+        if rusage is None:
+            self.rtac_data.ta_cpu_user[self.core] = math.nan
+            self.rtac_data.ta_cpu_sys[self.core] = math.nan
+            self.rtac_data.ta_maxrss[self.core] = -1
+            self.rtac_data.ta_wall[self.core] = \
+                round(time.monotonic() - self.wall_start, 4)
+            self.logs.general_log(
+                f'Target algorithm run {self.pid} on core {self.core} was '
+                'reaped by the wrapper, its resource usage is not available.')
+            return
+        self.rtac_data.ta_cpu_user[self.core] = round(rusage.ru_utime, 4)
+        self.rtac_data.ta_cpu_sys[self.core] = round(rusage.ru_stime, 4)
+        self.rtac_data.ta_maxrss[self.core] = rusage.ru_maxrss
+        self.rtac_data.ta_wall[self.core] = \
+            round(time.monotonic() - self.wall_start, 4)
+
+    def track_tree(self) -> None:
+        """
+        Notes how the processes of the target algorithm run can be found at
+        termination. Wrappers start the target algorithm in its own process
+        group via `AbstractWrapper.launch`. With `scenario.ta_cgroup` the
+        target algorithm is additionally moved into a cgroup v2 leaf, if
+        cgroup v2 is available and writable.
+
+        Returns
+        -------
+        None
+        """
+        self.group = is_group_leader(self.pid)
+        self.cgroup = None
+        if self.scenario.ta_cgroup:
+            self.cgroup = CgroupLeaf.create(f'rtac_core_{self.core}')
+            if self.cgroup is not None and not self.cgroup.add(self.pid):
+                self.cgroup.remove()
+                self.cgroup = None
+
+    def signal_tree(self, sig: int, members: list) -> None:
+        """
+        Sends a signal to the process group of the target algorithm run and
+        to all its descendants. SIGKILL is also sent to the cgroup leaf.
+
+        Parameters
+        ----------
+        sig : int
+            Signal to send.
+        members : list
+            Descendants of the target algorithm collected before the signal.
+
+        Returns
+        -------
+        None
+        """
+        signal_tree(self.proc, sig, members, self.group)
+        if sig == signal.SIGKILL and self.cgroup is not None:
+            self.cgroup.kill()
+
+    def clear_tree(self, members: list) -> None:
+        """
+        Kills processes of the target algorithm run that are left after the
+        target algorithm exited and confirms that all are gone before the
+        core is used by the next contender. The number of surviving processes
+        is recorded in `rtac_data.survivors`.
+
+        Parameters
+        ----------
+        members : list
+            Descendants of the target algorithm collected before it was
+            signalled.
+
+        Returns
+        -------
+        None
+        """
+        self.signal_tree(signal.SIGKILL, members)
+        alive = survivors(self.pid, members, self.group,
+                          timeout=self.scenario.kill_grace)
+        if self.cgroup is not None:
+            alive = sorted(set(alive) | set(self.cgroup.pids()))
+            if not alive:
+                self.cgroup.remove()
+        self.rtac_data.survivors[self.core] = len(alive)
+        if alive:
+            self.logs.general_log(
+                f'Core {self.core} is still occupied by processes {alive} of '
+                f'the target algorithm run {self.pid}.')
+
+    def record_kill_latency(self, kill_start: float) -> None:
+        """
+        Records the time from the cap signal, or from the start of the kill if
+        the tournament did not cap the run, to the exit of the target
+        algorithm.
+
+        Parameters
+        ----------
+        kill_start : float
+            `time.monotonic()` when the kill was started.
+
+        Returns
+        -------
+        None
+        """
+        cap_time = self.rtac_data.cap_time.value
+        if cap_time <= 0:
+            cap_time = kill_start
+        self.rtac_data.kill_latency[self.core] = \
+            round(time.monotonic() - cap_time, 4)
 
     def run(self, instance: str, config: Configuration,
-            rtac_data: RTACData | RTACDatapp, sync_event: Event) -> None:
+            rtac_data: RTACData | RTACDatapp,
+            sync_event: Event = None) -> None:
         """
         Manages the target algorithm runner functions depending on the state
         of the run.
@@ -363,37 +1018,313 @@ class BaseTARunner(AbstractTARunner):
         rtac_data : RTACData | RTACDatapp
             Object containing data and objects necessary throughout the RTAC 
             modules.
+        sync_event : Event
+            Event to wait for before starting the run. Defaults to None.
+
+        Returns
+        -------
+        None
+        """
+        if self.cpu is not None:
+            os.sched_setaffinity(0, [self.cpu])
+        if sync_event is not None:
+            sync_event.wait()
+        returncode = None
+        try:
+            self.start_run(instance, config, rtac_data)
+            if self.scenario.event_read:
+                self.watch_output_events()
+            else:
+                self.watch_output_polling()
+            # The target algorithm exits after reporting its result
+            self.finish_run()
+            returncode = self.proc.returncode
+        finally:
+            self.send(MessageType.exited, returncode)
+
+    def watch_output_polling(self) -> None:
+        """
+        Observes the target algorithm output by polling the pipe every 5 ms.
+        Everything available in the pipe is drained per poll, so that the
+        target algorithm never blocks on a full pipe.
+
+        Returns
+        -------
+        None
+        """
+        self.reader = TAOutputReader(self.proc, self.logs)
+        self.nnr = self.reader.readline
+        try:
+            while self.running:
+                # Avoid checking output excessively often (causes too much
+                # overhead)
+                time.sleep(0.005)  # time.sleep(5e-6)
+
+                self.reader.read_available()
+
+                self.check_outputs()
+                self.check_state()
+        finally:
+            self.reader.close()
+
+    def watch_output_events(self) -> None:
+        """
+        Observes the target algorithm output event-driven. Blocks until the
+        output pipe is readable, the target algorithm exits, the objective
+        minimization deadline is reached or it is time to check for
+        cancellation of the tournament.
+
+        Returns
+        -------
+        None
+        """
+        self.reader = TAOutputReader(self.proc, self.logs)
+        self.nnr = self.reader.readline
+        if self.channel is not None:
+            # Wake up as soon as the tournament caps the run
+            self.reader.watch(self.channel)
+        try:
+            while self.running:
+                self.reader.wait(self.wait_timeout())
+
+                self.check_outputs()
+                self.check_state()
+
+                # TA exited and all output is processed without a result
+                if self.running and self.reader.finished() \
+                        and self.reader.exited:
+                    self.running = False
+        finally:
+            self.reader.close()
+
+    def wait_timeout(self) -> float:
+        """
+        Computes how long to block on the target algorithm output at most.
+
+        Returns
+        -------
+        float
+            Time in seconds until the next deadline or cancellation check.
+        """
+        if self.scenario.objective_min:
+            deadline = self.om_start + self.scenario.timeout + 1
+            return min(max(deadline - time.time(), 0),
+                       self.ev_check_interval)
+        return self.ev_check_interval
+
+    def check_state(self) -> None:
+        """
+        Populates the results if the run finished and kills the run if it
+        timed out or was capped.
+
+        Returns
+        -------
+        None
+        """
+        # If result entry is different to default, populate result lists
+        if self.rtac_data.ta_res[self.core] != self.max_float:
+            self.check_result()
+        # If objective minimization scenario
+        if self.scenario.objective_min:
+            # and if time limit is reached, kill this target algorithm run
+            # + 1 sec extra time for the TA to shut down, wrap up and print
+            # the result, since it is important to know it
+            if time.time() - self.om_start >= self.scenario.timeout + 1:
+                self.rtac_data.status[self.core] = 5  # TARunStatus.timeout
+                self.kill_run()
+        # The run that solved the instance is not capped, its target
+        # algorithm exits after reporting and is only reaped
+        elif self.rtac_data.status[self.core] == 2:  # TARunStatus.finished
+            self.finish_run()
+        # If runtime minimization and one TA run solved instance, cap all
+        # target algorithm runs at once
+        elif self.rtac_data.event == 1 or self.rtac_data.ev.is_set() \
+                or self.cap_received():
+            self.kill_run()
+
+    async def start_run_async(self, instance: str, config: Any,
+                              rtac_data: RTACData | RTACDatapp) -> None:
+        """
+        Asyncio counterpart of `start_run`. Starts the target algorithm with
+        `asyncio.create_subprocess_exec`, using the command line provided by
+        the wrapper.
+
+        Parameters
+        ----------
+        instance : str
+            Path to the problem instance to solve.
+        config : Any
+            Representation of the configuration.
+        rtac_data : RTACData | RTACDatapp
+            Object containing data and objects necessary throughout the RTAC 
+            modules.
+
+        Returns
+        -------
+        None
+        """
+        self.config = config
+        self.instance = instance
+        self.rtac_data = rtac_data
+
+        self.rtac_data.substart[self.core] = time.process_time_ns()
+        self.rtac_data.substart_wall[self.core] = time.time()
+        if self.scenario.objective_min:
+            self.om_start = time.time()
+
+        command = self.wrapper.command(self.config, self.scenario.timeout,
+                                       self.instance)
+        read_fd, write_fd = os.pipe()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *command, stdout=write_fd, start_new_session=True,
+                preexec_fn=self.placement())
+        except Exception:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        self.proc = AsyncTAProcess(proc, read_fd)
+        self.proc_cpu_time = time.process_time_ns()
+
+        self.pid = self.proc.pid
+        self.wall_start = time.monotonic()
+        self.reaped = False
+        self.rtac_data.pids[self.core] = self.pid
+        self.track_tree()
+        self.running = True
+        self.rtac_data.status[self.core] = 1  # TARunStatus.running
+
+    async def run_async(self) -> None:
+        """
+        Asyncio counterpart of `run` for a target algorithm run started by
+        `start_run_async`. Output is read when the event loop reports the
+        pipe readable. The target algorithm process is reaped before
+        returning, also if the task is cancelled.
 
         Returns
         -------
         None
         """
-        sync_event.wait()
-        self.start_run(instance, config, rtac_data)
-        while self.running:
-            # Avoid checking output excessively often (causes too much
-            # overhead)
-            time.sleep(0.005)  # time.sleep(5e-6)
+        loop = asyncio.get_running_loop()
+        readable = asyncio.Event()
+        self.reader = TAOutputReader(self.proc, self.logs)
+        self.nnr = self.reader.readline
+        cpu_mark = time.process_time_ns()
+        loop.add_reader(self.reader.fd, readable.set)
+        try:
+            while self.running:
+                try:
+                    await asyncio.wait_for(readable.wait(),
+                                           self.wait_timeout())
+                except asyncio.TimeoutError:
+                    pass
+                readable.clear()
+                # CPU time the event loop spent on other runs is not part of
+                # this run's overhead
+                self.proc_cpu_time += time.process_time_ns() - cpu_mark
+                self.reader.read_available()
+                if self.reader.eof:
+                    loop.remove_reader(self.reader.fd)
+
+                self.check_outputs()
+                self.sample_usage()
+                cpu_mark = time.process_time_ns()
+                await self.check_state_async()
+
+                # TA exited and all output is processed without a result
+                if self.running and self.reader.finished():
+                    await self.proc.aproc.wait()
+                    self.running = False
+        finally:
+            if not self.reader.eof:
+                loop.remove_reader(self.reader.fd)
+            self.reader.close()
+            # Kill before closing the pipe, a TA writing to the closed pipe
+            # would fail with a broken pipe while shutting down
+            await self.kill_run_async()
+            os.close(self.reader.fd)
+
+    async def check_state_async(self) -> None:
+        """
+        Asyncio counterpart of `check_state`.
 
-            ta_output = non_block_read(self.proc.stdout, self.logs)
+        Returns
+        -------
+        None
+        """
+        if self.rtac_data.ta_res[self.core] != self.max_float:
+            self.check_result()
+        if self.scenario.objective_min:
+            if time.time() - self.om_start >= self.scenario.timeout + 1:
+                self.rtac_data.status[self.core] = 5  # TARunStatus.timeout
+                await self.kill_run_async()
+        elif self.rtac_data.event == 1 or self.rtac_data.ev.is_set():
+            await self.kill_run_async()
+
+    async def kill_run_async(self) -> None:
+        """
+        Asyncio counterpart of `kill_run`. Terminates the target algorithm
+        run of this runner and all processes it started, escalating to
+        SIGKILL after `scenario.kill_grace` seconds, and reaps it.
+
+        Returns
+        -------
+        None
+        """
+        kill_start = time.monotonic()
+        self.running = False
+        if self.rtac_data.status[self.core] == 2:  # TARunStatus.finished
+            # The run that solved the instance is given the time to exit
+            # on its own first
+            try:
+                await asyncio.wait_for(self.proc.aproc.wait(),
+                                       self.scenario.kill_grace)
+            except asyncio.TimeoutError:
+                pass
+        members = tree_members(self.pid) \
+            if self.proc.returncode is None else []
+        if self.proc.returncode is None:
+            if self.rtac_data.status[self.core] == 1:  # TARunStatus.running
+                self.rtac_data.status[self.core] = 3  # TARunStatus.capped
+            self.signal_tree(signal.SIGTERM, members)
+            try:
+                await asyncio.wait_for(self.proc.aproc.wait(),
+                                       self.scenario.kill_grace)
+            except asyncio.TimeoutError:
+                self.signal_tree(signal.SIGKILL, members)
+                await self.proc.aproc.wait()
+            if self.rtac_data.status[self.core] != 2:  # TARunStatus.finished
+                self.record_kill_latency(kill_start)
+        if not self.reaped:
+            self.reaped = True
+            self.rtac_data.ta_wall[self.core] = \
+                round(time.monotonic() - self.wall_start, 4)
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.clear_tree, members)
+
+    def sample_usage(self) -> None:
+        """
+        Samples the CPU time and resident set size of the target algorithm
+        process. The asyncio child watcher reaps the target algorithm without
+        its resource usage, so with the asyncio tournament engine the last
+        sample before the exit is recorded instead.
 
-            self.check_output(ta_output)
-            # If result entry is different to default, populate result lists
-            if self.rtac_data.ta_res[self.core] != self.max_float:
-                self.check_result()
-            # If objective minimization scenario
-            if self.scenario.objective_min:
-                # and if time limit is reached, kill this target algorithm run
-                # + 1 sec extra time for the TA to shut down, wrap up and print
-                # the result, since it is important to know it
-                if time.time() - self.om_start >= self.scenario.timeout + 1:
-                    self.rtac_data.status[self.core] = 5  # TARunStatus.timeout
-                    self.kill_run()
-            # If runtime minimization and one TA run solved instance, kill all
-            # target algorithm runs
-            elif self.rtac_data.event == 1 or self.rtac_data.ev.is_set():
-                time.sleep(2)
-                self.kill_run()      
+        Returns
+        -------
+        None
+        """
+        try:
+            ps_proc = psutil.Process(self.pid)
+            with ps_proc.oneshot():
+                cpu_times = ps_proc.cpu_times()
+                rss = ps_proc.memory_info().rss
+        except psutil.Error:
+            return
+        self.rtac_data.ta_cpu_user[self.core] = round(cpu_times.user, 4)
+        self.rtac_data.ta_cpu_sys[self.core] = round(cpu_times.system, 4)
+        self.rtac_data.ta_maxrss[self.core] = \
+            max(self.rtac_data.ta_maxrss[self.core], rss // 1024)
 
 
 class TARunnerpp(BaseTARunner):
@@ -416,54 +1347,54 @@ class TARunnerpp(BaseTARunner):
         self.interim_check_increment = scenario.timeout / 150
         self.interim_check_time = time.time()
 
-    def check_output(self, ta_output: bytes) -> None:
+    def parses_runtime_output(self) -> bool:
         """
-        Checks the output, if there was any, and either declares the instance 
-        as solved by the contender (if the corresponding marker is present) or 
-        outputs intermediate target algorithm output.
+        Whether output lines are parsed for more than the completion marker.
+
+        Returns
+        -------
+        bool
+            True, since interim output is recorded.
+        """
+        return True
+
+    def check_runtime_output(self, ta_outputs: list[bytes]) -> None:
+        """
+        Outputs intermediate target algorithm output of the newest parseable
+        output line and records runtime features, if gray-box RAC is enabled.
 
         Parameters
         ----------
-        ta_output : bytes
-            Output from `subprocess.PIPE`.
+        ta_outputs : list[bytes]
+            Output lines from `subprocess.PIPE`, oldest first.
 
         Returns
         -------
         None
         """
-        if ta_output != b'':
-            if_solved = \
-                self.wrapper.check_if_solved(ta_output, non_block_read,
-                                             self.proc)
+        if time.time() - self.interim_check_time \
+                >= self.interim_check_increment:  # reduce frequency
 
-            if if_solved is not None:
-                res, self.time, self.rtac_data.event = if_solved
-                self.rtac_data.ta_res[self.core] = res
-                self.rtac_data.ta_res_time[self.core] = self.time
-                self.rtac_data.status[self.core] = 2  # TARunStatus.finished
+            self.interim_check_time = time.time()
 
-            if time.time() - self.interim_check_time \
-                    >= self.interim_check_increment:  # reduce frequency
+            interim = self.latest_output(ta_outputs)
 
-                self.interim_check_time = time.time()
+            if interim is not None:
+                self.rtac_data.interim[self.core] = interim
+                self.send(MessageType.interim, interim)
 
-                interim = self.wrapper.check_output(ta_output)
-
-                if interim is not None:
-                    self.rtac_data.interim[self.core] = interim
-
-            if self.scenario.gray_box:
-                self.gb_record(ta_output)
+        if self.scenario.gray_box:
+            self.gb_record(ta_outputs)
 
 
-def gb_record(self, ta_output: bytes) -> None:
+def gb_record(self, ta_outputs: list[bytes]) -> None:
     """
     Records runtime output of the target algorithm if there was any new.
 
     Parameters
     ----------
-    ta_output : bytes
-        Output from `subprocess.PIPE`.
+    ta_outputs : list[bytes]
+        Output lines from `subprocess.PIPE`, oldest first.
 
     Returns
     ------
@@ -472,25 +1403,23 @@ def gb_record(self, ta_output: bytes) -> None:
     now = time.time()
     elapsed_time = now - self.last_check
     if elapsed_time >= self.scenario.gb_read_time:
-        rt_feats = self.wrapper.check_output(ta_output)
+        rt_feats = self.latest_output(ta_outputs)
         if rt_feats is not None and \
                 rt_feats != self.rtac_data.RuntimeFeatures[self.core]:
 
             self.rtac_data.RuntimeFeatures[self.core] = rt_feats
+            self.send(MessageType.runtime_features, rt_feats)
             CPUTimeExpended = \
                 (
                     time.process_time_ns() - self.rtac_data.substart[self.core]
                 ) * 1e-9
             ClockTimeExpended = time.time() - self.clock_start
 
-            rt_record = {'core': self.core,
-                         'CPUTimeExpended': CPUTimeExpended,
-                         'ClockTimeExpended': ClockTimeExpended,
-                         'rt_feats': rt_feats}
-
-            if rt_record not in self.rtac_data.rec_data[self.core].values():
-                self.rtac_data.rec_data[self.core][int(ClockTimeExpended)] = \
-                    rt_record
+            # Row layout as in GBRecord
+            self.rtac_data.rec_data.append(
+                self.core,
+                [time.time(), CPUTimeExpended, ClockTimeExpended,
+                 len(rt_feats), *rt_feats])
 
         self.last_check = now
 
@@ -3,13 +3,18 @@ tournaments by differently configured target algorithms according to the RTAC
 method utilized."""
 
 from abc import ABC, abstractmethod
+from typing import Any
 import multiprocessing as mp
+from multiprocessing.connection import wait
 import subprocess
+import asyncio
+import warnings
 import os
 import uuid
 import time
 import signal
-from rtac.utils.process_affinity import set_affinity_recursive
+from rtac.utils.process_tree import is_group_leader, group_members
+from rtac.utils.core_map import CoreMap
 from rtac.ac_functionalities.config_gens import DefaultConfigGen
 from rtac.ac_functionalities.rtac_data import (
     TournamentStats,
@@ -17,6 +22,11 @@ from rtac.ac_functionalities.rtac_data import (
     TARunStatus
 )
 from rtac.ac_functionalities.ta_runner import BaseTARunner
+from rtac.ac_functionalities.messages import (
+    Message,
+    MessageType,
+    open_channel
+)
 from rtac.ac_functionalities.rtac_data import (
     Configuration,
     RTACData,
@@ -63,6 +73,16 @@ class AbstractTournament(ABC):
 
         if self.scenario.gray_box:
             self.gb_model = None
+
+        # Set by the tournament manager if persistent runner workers are used
+        self.runner_pool = None
+
+        # Logical core slots are pinned to the CPUs of the core map
+        self.core_map = CoreMap(self.scenario)
+
+        # Tournament ends of the message pipes to the runners by core
+        self.channels = {}
+        self.capped = False
     
     @abstractmethod
     def start_tournament(self, instance: str,
@@ -107,22 +127,133 @@ class AbstractTournament(ABC):
         -------
         None
         """
+        for core in range(self.scenario.number_cores):
+            if self.rtac_data.status[core] not in (2, 3):
+                self.rtac_data.status[core] = 5
+        # Signal all runs at once, the runners kill their target algorithms
+        self.rtac_data.cap_time.value = time.monotonic()
         self.rtac_data.ev.set()
         self.rtac_data.event = 1
+        self.broadcast_cap()
         print(f'\nClosing tournament Nr. {self.tourn_nr}',
               f'(Tournament ID: {self.tourn_id})',
               f'due to timeout ({self.scenario.timeout}s) at ',
               f'{self.currenttime}s.\n')
         if self.scenario.objective_min:
-            time.sleep(1)  # extra time for TAs to shut down and print results
+            # extra time for TAs to shut down and print results
+            self.wait_for_runs(1)
+        else:
+            self.wait_for_runs(self.scenario.kill_grace + 0.5)
+        # Enforce termination of runs that did not shut down in time
         for core in range(self.scenario.number_cores):
-            if self.rtac_data.status[core] not in (2, 3):
-                self.rtac_data.status[core] = 5
             self.terminate_run(core, self.rtac_data.process[core])
 
+    def wait_for_runs(self, timeout: float) -> None:
+        """
+        Waits until all processes of the tournament exited or the timeout
+        expired.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum time to wait in seconds.
+
+        Returns
+        -------
+        None
+        """
+        deadline = time.time() + timeout
+        running = self.running_processes()
+        while running and time.time() < deadline:
+            self.wait_runs(running, deadline - time.time())
+            running = self.running_processes()
+
+    def wait_runs(self, running: list[mp.Process], timeout: float) -> None:
+        """
+        Blocks until a run finishes, a runner sends a message or the timeout
+        expires, and handles the messages received.
+
+        Parameters
+        ----------
+        running : list[mp.Process]
+            Running processes (or runner jobs) of the tournament.
+        timeout : float
+            Maximum time to wait in seconds.
+
+        Returns
+        -------
+        None
+        """
+        # Runner jobs of the pool use the message pipe as sentinel
+        waitables = {proc.sentinel if isinstance(proc.sentinel, int)
+                     else proc.sentinel.fileno(): proc.sentinel
+                     for proc in running}
+        for channel in self.channels.values():
+            if not channel.exited:
+                waitables.setdefault(channel.fileno(), channel)
+        wait(list(waitables.values()), timeout=max(timeout, 0))
+        self.handle_messages()
+
+    def handle_messages(self) -> None:
+        """
+        Receives and handles the messages of all runners.
+
+        Returns
+        -------
+        None
+        """
+        for channel in self.channels.values():
+            channel.poll(0)
+            for message in channel.messages():
+                self.handle_message(message)
+
+    def handle_message(self, message: Message) -> None:
+        """
+        Records the latency of a runner message and caps all other runs on
+        the first solved message in runtime minimization.
+
+        Parameters
+        ----------
+        message : Message
+            Message received from a runner.
+
+        Returns
+        -------
+        None
+        """
+        latency = self.tournamentstats.message_latency
+        latency[message.type.name] = \
+            round(max(latency.get(message.type.name, 0), message.latency), 6)
+        if message.type is MessageType.solved \
+                and not self.scenario.objective_min and not self.capped:
+            self.capped = True
+            if self.rtac_data.cap_time.value <= 0:
+                self.rtac_data.cap_time.value = time.monotonic()
+            self.rtac_data.ev.set()
+            self.broadcast_cap(skip=message.core)
+
+    def broadcast_cap(self, skip: int | None = None) -> None:
+        """
+        Sends the cap message to the runners.
+
+        Parameters
+        ----------
+        skip : int | None
+            Core not to send the message to. Defaults to None.
+
+        Returns
+        -------
+        None
+        """
+        for core, channel in self.channels.items():
+            if core != skip:
+                channel.cap(self.tourn_id)
+
     def terminate_run(self, core: int, process: subprocess.Popen) -> None:
         """
-        Enforces termination of a target algorithm run.
+        Enforces termination of a target algorithm run and its process
+        group. Processes of the group left alive are recorded in
+        `rtac_data.survivors`.
 
         Parameters
         ----------
@@ -140,9 +271,14 @@ class AbstractTournament(ABC):
                 print('Terminating configuration', self.conf_id_list[core],
                       'running on core', core, 'in tournament', self.tourn_id,
                       '( tournament Nr.', self.tourn_nr, ').')
-            if self.pid_alive(self.rtac_data.pids[core]):
+            pid = self.rtac_data.pids[core]
+            if self.pid_alive(pid):
                 try:
-                    os.kill(self.rtac_data.pids[core], signal.SIGKILL)
+                    # Target algorithms lead their own process group
+                    if is_group_leader(pid):
+                        os.killpg(pid, signal.SIGKILL)
+                    else:
+                        os.kill(pid, signal.SIGKILL)
                 except Exception as e:
                     message = \
                         f'Tried killing pid {self.rtac_data.pids[core]} - ' \
@@ -152,10 +288,32 @@ class AbstractTournament(ABC):
                     self.logs.general_log(message)
             if process.is_alive():
                 process.terminate()
-                process.join()
+                process.join(self.scenario.kill_grace + 0.5)
+                if process.is_alive():
+                    process.kill()
+                    process.join()
+            if pid:
+                left = group_members(pid)
+                if left:
+                    self.rtac_data.survivors[core] = len(left)
+                    self.logs.general_log(
+                        f'Core {core} is still occupied by processes {left} '
+                        f'of the target algorithm run {pid}.')
 
             self.terminated_configs.append(core)
 
+    def running_processes(self) -> list[mp.Process]:
+        """
+        Returns the processes of the tournament that are still running.
+
+        Returns
+        -------
+        list[mp.Process]
+            Running processes (or runner jobs) of the tournament.
+        """
+        return [proc for proc in self.rtac_data.process
+                if not isinstance(proc, str) and proc.is_alive()]
+
     def pid_alive(self, pid) -> None:
         """Checks if process is till alive using PID.
 
@@ -188,6 +346,112 @@ class Tournament(AbstractTournament):
         `scenario.number_cores` configured target algorithms running in 
         parallel according to the ReACTR method.
 
+        Parameters
+        ----------
+        instance : str
+            Path to the problem instance to solve.
+        contender_dict : dict[str, Configuration]
+            Dictionary containing configurations to run in the tournament, with
+            configuration IDs as keys and Configuration objects as values.
+        tourn_nr : int
+            Number of the tournament during this RTAC run.
+        cores_start : list[int]
+            List of cores which to start the contenders on.
+
+        Returns
+        -------
+        None
+        """
+        self.prepare_tournament(instance, contender_dict, tourn_nr,
+                                cores_start)
+
+        if self.runner_pool is not None:
+            self.submit_to_pool(cores_start)
+            return
+
+        self.sync_event = mp.Event()
+
+        runner_ends = self.create_runners(cores_start)
+
+        # Starting processes
+        for core in cores_start:  # range(self.scenario.number_cores):
+            self.rtac_data.process[core].start()
+        for runner_end in runner_ends:
+            runner_end.conn.close()
+
+        self.sync_event.set()
+
+    def create_runners(self, cores_start: list[int]) -> list:
+        """
+        Creates the runner processes of the contenders together with the
+        message pipes to their runners.
+
+        Parameters
+        ----------
+        cores_start : list[int]
+            List of cores which to start the contenders on.
+
+        Returns
+        -------
+        list[RunnerChannel]
+            Runner ends of the message pipes, to be closed in this process
+            once the runner processes are started.
+        """
+        runner_ends = []
+        for core in cores_start:
+            self.ta_runner = \
+                self.ta_runner_class(self.scenario, self.logs, core)
+            self.ta_runner.cpu = self.core_map.cpu(core)
+            self.channels[core], self.ta_runner.channel = \
+                open_channel(core, self.tourn_id)
+            runner_ends.append(self.ta_runner.channel)
+            contender = self.config_list[core]
+            self.tournamentstats.TARuns[contender.id] = \
+                TARun(contender.id, contender.conf, 0, 0, TARunStatus.running)
+
+            translated_config = self.ta_runner.translate_config(contender)
+
+            self.rtac_data.process[core] = \
+                mp.Process(target=self.ta_runner.run,
+                           args=[self.instance, translated_config,
+                                 self.rtac_data, self.sync_event])
+
+        return runner_ends
+
+    def submit_to_pool(self, cores_start: list[int]) -> None:
+        """
+        Starts the contenders on the persistent runner workers of the cores.
+        The workers are pinned to their cores already.
+
+        Parameters
+        ----------
+        cores_start : list[int]
+            List of cores which to start the contenders on.
+
+        Returns
+        -------
+        None
+        """
+        for core in cores_start:
+            contender = self.config_list[core]
+            self.tournamentstats.TARuns[contender.id] = \
+                TARun(contender.id, contender.conf, 0, 0, TARunStatus.running)
+
+            translated_config = self.runner_pool.translate_config(contender)
+
+            self.rtac_data.process[core] = \
+                self.runner_pool.submit(core, self.instance,
+                                        translated_config, contender.id,
+                                        self.tourn_id)
+            self.channels[core] = self.runner_pool.channel(core)
+
+    def prepare_tournament(self, instance: str,
+                           contender_dict: dict[str: Configuration],
+                           tourn_nr: int, cores_start: list[int]) -> None:
+        """
+        Sets up the tournament data and stats before the contenders are
+        started.
+
         Parameters
         ----------
         instance : str
@@ -207,6 +471,12 @@ class Tournament(AbstractTournament):
         self.terminated_configs = []
         self.instance = instance
         self.tourn_nr = tourn_nr
+        if self.runner_pool is None:
+            # The pipes of the pool workers are kept
+            for channel in self.channels.values():
+                channel.close()
+        self.channels = {}
+        self.capped = False
         if self.scenario.baselineperf:
             def_conf = self.dcg.generate()
             contender_dict = {def_conf.id: def_conf}
@@ -227,38 +497,79 @@ class Tournament(AbstractTournament):
             TournamentStats(self.tourn_id, tourn_nr, self.conf_id_list, None,
                             [], [], [], [], {})
 
-        self.sync_event = mp.Event()
+    def fill_tournament(self, cores_start: list[int]) -> None:
+        """
+        Fills up the remaining cores to be used in an early started tournament.
 
-        for core in cores_start:
-            self.ta_runner = \
-                self.ta_runner_class(self.scenario, self.logs, core)
-            contender = self.config_list[core]
-            self.tournamentstats.TARuns[contender.id] = \
-                TARun(contender.id, contender.conf, 0, 0, TARunStatus.running)
+        Parameters
+        ----------
+        cores_start : list[int]
+            List of cores which to start the contenders on.
 
-            translated_config = self.ta_runner.translate_config(contender)
+        Returns
+        -------
+        None
+        """
+        runner_ends = self.create_runners(cores_start)
 
-            self.rtac_data.process[core] = \
-                mp.Process(target=self.ta_runner.run,
-                           args=[self.instance, translated_config,
-                                 self.rtac_data, self.sync_event])
+        self.rtac_data.start = time.time()
 
         # Starting processes
-        for core in cores_start:  # range(self.scenario.number_cores):
+        for core in cores_start:
             self.rtac_data.process[core].start()
+        for runner_end in runner_ends:
+            runner_end.conn.close()
 
-        self.sync_event.set()
-        time.sleep(0.01)
+    def watch_tournament(self) -> None:
+        """
+        Function to observe the tournament and enforce the timelimit
+        scenario.timeout if reached.
 
-        for core in cores_start:
-            set_affinity_recursive(self.rtac_data.process[core], core)
+        Returns
+        -------
+        None
+        """
 
-    def fill_tournament(self, cores_start: list[int]) -> None:
+        running = self.running_processes()
+        while running:
+            # Block until a run finishes, a runner reports or the time limit
+            # is reached
+            remaining = \
+                self.scenario.timeout - (time.time() - self.rtac_data.start)
+            self.wait_runs(running, remaining)
+            currenttime = time.time() - self.rtac_data.start
+
+            if currenttime >= self.scenario.timeout:
+                self.currenttime = currenttime
+                self.close_tournament()
+
+            running = self.running_processes()
+
+
+class AsyncTournament(Tournament):
+    """
+    Tournament class that starts, reads, caps and reaps all target algorithm
+    runs of a tournament from a single asyncio event loop in this process,
+    instead of starting one `multiprocessing.Process` per core. Results are
+    reported through the same `RTACData` fields.
+    """
+
+    def start_tournament(self, instance: str,
+                         contender_dict: dict[str: Configuration],
+                         tourn_nr: int, cores_start: list[int]) -> None:
         """
-        Fills up the remaining cores to be used in an early started tournament.
+        Sets up tournament data and starts the target algorithm runs of the
+        tournament via `asyncio.create_subprocess_exec`.
 
         Parameters
         ----------
+        instance : str
+            Path to the problem instance to solve.
+        contender_dict : dict[str, Configuration]
+            Dictionary containing configurations to run in the tournament, with
+            configuration IDs as keys and Configuration objects as values.
+        tourn_nr : int
+            Number of the tournament during this RTAC run.
         cores_start : list[int]
             List of cores which to start the contenders on.
 
@@ -266,46 +577,117 @@ class Tournament(AbstractTournament):
         -------
         None
         """
+        self.prepare_tournament(instance, contender_dict, tourn_nr,
+                                cores_start)
+
+        self.ta_runners = {}
+        translated_configs = {}
         for core in cores_start:
-            self.ta_runner = \
-                self.ta_runner_class(self.scenario, self.logs, core)
+            ta_runner = self.ta_runner_class(self.scenario, self.logs, core)
+            ta_runner.cpu = self.core_map.cpu(core)
             contender = self.config_list[core]
             self.tournamentstats.TARuns[contender.id] = \
                 TARun(contender.id, contender.conf, 0, 0, TARunStatus.running)
 
-            translated_config = self.ta_runner.translate_config(contender)
+            translated_configs[core] = ta_runner.translate_config(contender)
+            self.ta_runners[core] = ta_runner
 
-            self.rtac_data.process[core] = \
-                mp.Process(target=self.ta_runner.run,
-                           args=[self.instance, translated_config,
-                                 self.rtac_data, self.sync_event])
+        self.loop = asyncio.new_event_loop()
+        self.loop.run_until_complete(self.start_runs(translated_configs))
 
-        self.rtac_data.start = time.time()
+    async def start_runs(self, translated_configs: dict[int, Any]) -> None:
+        """
+        Starts the target algorithm runs, bound to their cores before exec.
 
-        # Starting processes
-        for core in cores_start:
-            self.rtac_data.process[core].start()
+        Parameters
+        ----------
+        translated_configs : dict[int, Any]
+            Configurations in the format of the wrapper by core.
 
-        for core in cores_start:
-            set_affinity_recursive(self.rtac_data.process[core], core)
+        Returns
+        -------
+        None
+        """
+        await asyncio.gather(
+            *(ta_runner.start_run_async(self.instance,
+                                        translated_configs[core],
+                                        self.rtac_data)
+              for core, ta_runner in self.ta_runners.items()))
 
     def watch_tournament(self) -> None:
         """
-        Function to observe the tournament and enforce the timelimit
-        scenario.timeout if reached.
+        Runs the event loop supervising the target algorithm runs until all
+        of them are finished or the timelimit scenario.timeout is reached.
 
         Returns
         -------
         None
         """
+        try:
+            self.loop.run_until_complete(self.supervise())
+        finally:
+            self.loop.close()
 
-        while any(proc.is_alive() for proc in self.rtac_data.process):
-            time.sleep(1)  # Timeout is int, so checking every second is enough
-            currenttime = time.time() - self.rtac_data.start
+    async def supervise(self) -> None:
+        """
+        Waits for all target algorithm runs and closes the tournament if the
+        timelimit scenario.timeout is reached.
 
-            if currenttime >= self.scenario.timeout:
-                self.currenttime = currenttime
-                self.close_tournament()
+        Returns
+        -------
+        None
+        """
+        tasks = [asyncio.create_task(ta_runner.run_async())
+                 for ta_runner in self.ta_runners.values()]
+        remaining = \
+            self.scenario.timeout - (time.time() - self.rtac_data.start)
+        done, pending = await asyncio.wait(tasks, timeout=max(remaining, 0))
+
+        if pending:
+            self.currenttime = time.time() - self.rtac_data.start
+            await self.close_tournament_async(pending)
+
+        for task in done:
+            task.result()
+
+    async def close_tournament_async(self, pending: set[asyncio.Task]) \
+            -> None:
+        """
+        Asyncio counterpart of `close_tournament`. Cancels the supervision of
+        all target algorithm runs still going, which kills and reaps them.
+
+        Parameters
+        ----------
+        pending : set[asyncio.Task]
+            Tasks of the target algorithm runs that are not finished.
+
+        Returns
+        -------
+        None
+        """
+        for core in self.ta_runners:
+            if self.rtac_data.status[core] not in (2, 3):
+                self.rtac_data.status[core] = 5
+        self.rtac_data.cap_time.value = time.monotonic()
+        self.rtac_data.ev.set()
+        self.rtac_data.event = 1
+        print(f'\nClosing tournament Nr. {self.tourn_nr}',
+              f'(Tournament ID: {self.tourn_id})',
+              f'due to timeout ({self.scenario.timeout}s) at ',
+              f'{self.currenttime}s.\n')
+        if self.scenario.objective_min:
+            # extra time for TAs to shut down and print results
+            _, pending = await asyncio.wait(pending, timeout=1)
+        for core in self.ta_runners:
+            if self.scenario.verbosity == 2:
+                print('Terminating configuration', self.conf_id_list[core],
+                      'running on core', core, 'in tournament', self.tourn_id,
+                      '( tournament Nr.', self.tourn_nr, ').')
+            self.terminated_configs.append(core)
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
 
 class Tournament_GB:
@@ -335,17 +717,30 @@ class Tournament_GB:
         self.mtp = {}
         self.s_instances = []
         self.term_list = []
-
-        while any(isinstance(p, mp.Process) and p.is_alive()
-                  for p in self.rtac_data.process):
-            time.sleep(self.scenario.gb_read_time)
+        # Gray-box records read so far and latest record per core
+        rec_seen = [0] * self.scenario.number_cores
+        rec_latest = {}
+
+        running = self.running_processes()
+        while running:
+            # Block until a run finishes, the next gray-box check is due or
+            # the time limit is reached
+            remaining = \
+                self.scenario.timeout - (time.time() - self.rtac_data.start)
+            self.wait_runs(running, min(self.scenario.gb_read_time, remaining))
             currenttime = time.time() - self.rtac_data.start
 
             if not early_tournament and not self.terminated_configs:
 
+                for core in range(self.scenario.number_cores):
+                    records, rec_seen[core] = \
+                        self.rtac_data.rec_data.since(core, rec_seen[core])
+                    if len(records):
+                        rec_latest[core] = records[-1].copy()
+
                 X_pw, cores, self.s_instances, self.gb_pw_inst_archive, \
                     self.mtp, self.pw_cores = \
-                    self.gray_box.prepare_predict_data(self.rtac_data.rec_data, 
+                    self.gray_box.prepare_predict_data(rec_latest,
                                                        self.s_instances,
                                                        self.gb_pw_inst_archive,
                                                        self.mtp, self.pw_cores)
@@ -371,6 +766,8 @@ class Tournament_GB:
                 self.currenttime = currenttime
                 self.close_tournament()
 
+            running = self.running_processes()
+
 
 class Tournamentpp(Tournament):
     """
@@ -380,7 +777,7 @@ class Tournamentpp(Tournament):
 
 def tournament_factory(scenario: argparse.Namespace, ta_runner: BaseTARunner,
                        rtac_data: RTACData | RTACDatapp, logs: RTACLogs
-                       ) -> Tournament | Tournamentpp:
+                       ) -> Tournament | Tournamentpp | AsyncTournament:
     """
     Class factory to return the initialized TournamentManager class
     appropriate to the RTAC method `scenario.ac`.
@@ -399,7 +796,7 @@ def tournament_factory(scenario: argparse.Namespace, ta_runner: BaseTARunner,
 
     Returns
     -------
-    Tournament or Tournamentpp
+    Tournament or Tournamentpp or AsyncTournament
         Initialized Tournament object matching the RTAC method of the scenario.
     """
     if scenario.ac in (ACMethod.ReACTR, ACMethod.CPPL):
@@ -407,6 +804,13 @@ def tournament_factory(scenario: argparse.Namespace, ta_runner: BaseTARunner,
     elif scenario.ac is ACMethod.ReACTRpp:
         tournament = Tournamentpp
 
+    if scenario.async_engine:
+        if scenario.gray_box:
+            warnings.warn('\nThe asyncio tournament engine does not support '
+                          'gray-box RAC. Using multiprocessing instead.\n')
+        else:
+            tournament = AsyncTournament
+
     if scenario.gray_box:
         tournament.watch_tournament = Tournament_GB.watch_tournament_gray_box
 
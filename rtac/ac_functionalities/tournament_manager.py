@@ -8,6 +8,8 @@ import time
 import copy
 import gc
 import sys
+import atexit
+import warnings
 from rtac.utils.clean_logs import remove_fuse_hidden_files as rfhf
 from collections import OrderedDict
 from multiprocessing.sharedctypes import Synchronized
@@ -21,6 +23,7 @@ from rtac.ac_functionalities.rtac_data import (
     TournamentStats
 )
 from rtac.ac_functionalities.ta_runner import BaseTARunner
+from rtac.ac_functionalities.runner_pool import RunnerPool
 from rtac.ac_functionalities.tournament import Tournament, Tournamentpp
 from rtac.ac_functionalities.logs import RTACLogs
 from rtac.ac_functionalities.ranking.gray_box import Gray_Box
@@ -68,6 +71,19 @@ class AbstractTournamentManager(ABC):
 
         self.res_process = processing_factory(self.scenario, self.logs)
 
+        self.runner_pool = None
+        if self.scenario.runner_pool:
+            if self.scenario.gray_box or self.scenario.async_engine:
+                warnings.warn('\nPersistent runner workers are not used with '
+                              'gray-box RAC or the asyncio tournament '
+                              'engine.\n')
+            else:
+                self.runner_pool = RunnerPool(self.scenario, self.ta_runner,
+                                              self.logs, self.rtac_data,
+                                              self.tournament.core_map)
+                self.tournament.runner_pool = self.runner_pool
+                atexit.register(self.runner_pool.shutdown)
+
         if self.scenario.resume:
             print('\n')
             print('Resuming from previous run.')
@@ -108,6 +124,7 @@ class AbstractTournamentManager(ABC):
 
         self.logs.init_rtac_logs()
         self.logs.init_ranking_logs()
+        self.logs.general_log(str(self.tournament.core_map))
 
     def set_tourn_status(
             self, tournamentstats: TournamentStats,
@@ -136,6 +153,8 @@ class AbstractTournamentManager(ABC):
         tournamentstats.results = rtac_data.ta_res[:]
         tournamentstats.times = rtac_data.ta_res_time[:]
         tournamentstats.rtac_times = rtac_data.ta_rtac_time[:]
+        tournamentstats.kill_latencies = rtac_data.kill_latency[:]
+        tournamentstats.survivors = rtac_data.survivors[:]
         if self.scenario.verbosity == 2:
             print('* Tournament:', tournament.tourn_id, 'consisted of',
                   len(tournamentstats.TARuns), 'contenders.')
@@ -145,6 +164,14 @@ class AbstractTournamentManager(ABC):
                 rtac_data.ta_res_time[tr]
             tournamentstats.TARuns[tarun].status = \
                 TARunStatus(rtac_data.status[tr])
+            tournamentstats.TARuns[tarun].coalesced = \
+                rtac_data.ta_coalesced[tr]
+            tournamentstats.TARuns[tarun].cpu_user = \
+                rtac_data.ta_cpu_user[tr]
+            tournamentstats.TARuns[tarun].cpu_sys = \
+                rtac_data.ta_cpu_sys[tr]
+            tournamentstats.TARuns[tarun].maxrss = rtac_data.ta_maxrss[tr]
+            tournamentstats.TARuns[tarun].wall = rtac_data.ta_wall[tr]
 
         return tournamentstats
 
@@ -210,7 +237,8 @@ class AbstractTournamentManager(ABC):
 
         # Update tournament status
         self.tournamentstats = self.tournament.tournamentstats
-        self.tournamentstats.winner = self.rtac_data.winner.value
+        self.tournamentstats.winner = \
+            self.rtac_data.resolve_winner(self.tournament.conf_id_list)
         self.res_process.process_tourn(self.rtac_data, self.instance)
 
         self.general_logging(scenario=self.scenario,
@@ -231,6 +259,17 @@ class AbstractTournamentManager(ABC):
         self.res_process.tourn_nr = self.tourn_nr
         self.tournament.tourn_nr = self.tourn_nr
 
+    def shutdown(self) -> None:
+        """
+        Shuts down the persistent runner workers, if they are used.
+
+        Returns
+        -------
+        None
+        """
+        if self.runner_pool is not None:
+            self.runner_pool.shutdown()
+
     def general_logging(self, scenario: argparse.Namespace = None, 
                         rtac_data: RTACData | RTACDatapp = None,
                         tournamentstats: TournamentStats = None,
@@ -550,7 +589,8 @@ class GrayBox:
                                                  self.tourn_nr, cores_start)
                 self.tournament.watch_tournament()
                 self.tournamentstats = self.tournament.tournamentstats
-                self.tournamentstats.winner = self.rtac_data.winner.value
+                self.tournamentstats.winner = \
+                    self.rtac_data.resolve_winner(self.tournament.conf_id_list)
 
                 # Only process tournament if it was a regular one
                 self.res_process.process_tourn(self.rtac_data, self.instance,
@@ -609,7 +649,9 @@ class GrayBox:
                 
                 self.es_tournament.watch_tournament(early_tournament=True)
                 self.es_tournamentstats = self.es_tournament.tournamentstats
-                self.es_tournamentstats.winner = self.es_rtac_data.winner.value
+                self.es_tournamentstats.winner = \
+                    self.es_rtac_data.resolve_winner(
+                        self.es_tournament.conf_id_list)
                 self.general_logging(scenario=self.es_scenario,
                                      rtac_data=self.es_rtac_data,
                                      tournamentstats=self.es_tournamentstats,
@@ -49,6 +49,8 @@ def main(scenario: argparse.Namespace, instance_file: str) -> None:
         for instance in instances:
             rtac.solve_instance(instance)
 
+    rtac.shutdown()
+
 
 def run_example() -> None:
     """
@@ -44,7 +44,7 @@ class AbstractRTAC(ABC):
         self.ta_runner = ta_runner
         self.init_tournament_manager()
         self.es = False
-        self.early_instance = mp.Manager().list([None])
+        self.early_instance = [None]
 
     def init_tournament_manager(self) -> None:
         """
@@ -60,14 +60,26 @@ class AbstractRTAC(ABC):
 
     def init_rtac_data(self) -> None:
         """
-        Initialize new RTAC data.
+        Reset the RTAC data for the next tournament.
 
         Returns
         -------
         None
         """
         if self.tournament_manager.tourn_nr > 0:
-            self.rtac_data = rtacdata(self.scenario)
+            # Reused across tournaments, runner workers inherited this object
+            self.rtac_data.reset()
+
+    def shutdown(self) -> None:
+        """
+        Releases resources held across instances, such as the persistent
+        runner workers. Call it at the end of the problem instance stream.
+
+        Returns
+        -------
+        None
+        """
+        self.tournament_manager.shutdown()
 
     @abstractmethod
     def solve_instance(self, instance: str) -> None:
@@ -223,7 +235,7 @@ class RTAC(AbstractRTAC):
                 rtac_thread.join()
         self.rtac_data = self.tournament_manager.rtac_data
         self.result_output(self.instance)
-        self.early_instance = mp.Manager().list([None])
+        self.early_instance = [None]
 
     def result_output(self, instance: str) -> None:
         """
@@ -310,18 +322,6 @@ class RTACpp(RTAC):
         self.tournament_manager = TM(self.scenario, self.ta_runner, self.logs,
                                      self.rtac_data)
 
-    def init_rtac_data(self) -> None:
-        """
-        Initialize new RTAC data for ReACTR++.
-
-        Returns
-        -------
-        None
-        """
-        if self.tournament_manager.tourn_nr > 0:
-            self.rtac_data = \
-                rtacdata(self.scenario, interim_meaning=self.interim_meaning)
-
 
 def rtac_factory(scenario: argparse.Namespace) -> AbstractRTAC:
     """
@@ -0,0 +1,98 @@
+import unittest
+import sys
+import copy
+import pickle
+sys.path.append('rtac')
+from rtac.ac_functionalities.rtac_data import (
+    Configuration,
+    ConfigPool,
+    Generator,
+    FINGERPRINT_DIGITS,
+    fingerprint
+)
+from rtac.wrapper.tsp import TSP_RT
+
+
+def config(conf_id, conf):
+    return Configuration(conf_id, conf, [], Generator.random, 0)
+
+
+class TestFingerprint(unittest.TestCase):
+
+    def test_key_order(self):
+        self.assertEqual(fingerprint({'-a': 0.5, '-c': 3}),
+                         fingerprint({'-c': 3, '-a': 0.5}))
+
+    def test_float_noise(self):
+        self.assertEqual(fingerprint({'-a': 0.1 + 0.2}),
+                         fingerprint({'-a': 0.3}))
+        # A change within FINGERPRINT_DIGITS significant digits counts
+        change = 10.0 ** -(FINGERPRINT_DIGITS - 2)
+        self.assertNotEqual(fingerprint({'-a': 0.3 + change}),
+                            fingerprint({'-a': 0.3}))
+
+
+class TestConfigPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ConfigPool({'x': config('x', {'-a': 0.5, '-c': 3}),
+                                'y': config('y', {'-a': 0.7, '-c': 1})})
+
+    def test_duplicates(self):
+        self.assertTrue(self.pool.has_config({'-c': 3, '-a': 0.2 + 0.3}))
+        self.assertTrue(self.pool.has_config(
+            config('z', {'-a': 0.7, '-c': 1})))
+        self.assertFalse(self.pool.has_config({'-a': 0.7, '-c': 3}))
+
+    def test_replace_under_existing_id(self):
+        self.pool['x'] = config('x', {'-a': 0.1, '-c': 2})
+        self.assertEqual(list(self.pool), ['x', 'y'])
+        self.assertFalse(self.pool.has_config({'-a': 0.5, '-c': 3}))
+        self.assertTrue(self.pool.has_config({'-a': 0.1, '-c': 2}))
+
+    def test_delete_shared_fingerprint(self):
+        self.pool['z'] = config('z', {'-a': 0.5, '-c': 3})
+        del self.pool['x']
+        self.assertTrue(self.pool.has_config({'-a': 0.5, '-c': 3}))
+        del self.pool['z']
+        self.assertFalse(self.pool.has_config({'-a': 0.5, '-c': 3}))
+
+    def test_pop(self):
+        self.assertIsNone(self.pool.pop('missing', None))
+        with self.assertRaises(KeyError):
+            self.pool.pop('missing')
+        self.assertEqual(self.pool.pop('y').id, 'y')
+        self.assertFalse(self.pool.has_config({'-a': 0.7, '-c': 1}))
+        self.assertEqual(list(self.pool), ['x'])
+
+    def test_update_and_clear(self):
+        self.pool.update(z=config('z', {'-a': 0.9, '-c': 4}))
+        self.assertTrue(self.pool.has_config({'-a': 0.9, '-c': 4}))
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+        self.assertFalse(self.pool.has_config({'-a': 0.5, '-c': 3}))
+        self.assertEqual(self.pool.ids, {})
+
+    def test_copy_and_pickle_rebuild_index(self):
+        for pool in (copy.deepcopy(self.pool),
+                     pickle.loads(pickle.dumps(self.pool))):
+            self.assertIsInstance(pool, ConfigPool)
+            self.assertEqual(list(pool), ['x', 'y'])
+            self.assertEqual(pool.fingerprints, self.pool.fingerprints)
+            self.assertTrue(pool.has_config({'-a': 0.5, '-c': 3}))
+            pool['z'] = config('z', {'-a': 0.9, '-c': 4})
+            self.assertFalse(self.pool.has_config({'-a': 0.9, '-c': 4}))
+
+    def test_translation_keeps_pool_configs(self):
+        # The wrapper fixes -a for the target algorithm call only
+        config_list = TSP_RT().translate_config(self.pool['x'])
+        self.assertEqual(config_list[config_list.index('-a') + 1], '0.9')
+        self.assertEqual(self.pool['x'].conf, {'-a': 0.5, '-c': 3})
+        self.assertEqual(self.pool.fingerprints['x'],
+                         self.pool['x'].fingerprint)
+        self.assertTrue(self.pool.has_config({'-a': 0.5, '-c': 3}))
+        self.assertFalse(self.pool.has_config({'-a': 0.9, '-c': 3}))
+
+
+if __name__ == '__main__':
+    unittest.main()
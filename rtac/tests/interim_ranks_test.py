@@ -0,0 +1,35 @@
+import unittest
+import sys
+import numpy as np
+sys.path.append('rtac')
+from rtac.ac_functionalities.result_processing import interim_ranks
+from rtac.ac_functionalities.rtac_data import InterimMeaning
+
+
+class TestInterimRanks(unittest.TestCase):
+    meaning = [InterimMeaning.decrease, InterimMeaning.increase]
+
+    def test_metric_rank_sum(self):
+        # Metrics x cores, second metric is better when higher
+        interim = np.array([[3.0, 1.0, 2.0, 1.0],
+                            [5.0, 7.0, 7.0, 4.0]])
+        ranks = interim_ranks(interim, self.meaning)
+        # Metric ranks [3, 1, 2, 1] and [2, 1, 1, 3] sum to [5, 2, 3, 4]
+        self.assertEqual(ranks.tolist(), [4, 1, 2, 3])
+
+    def test_missing_values_rank_last(self):
+        interim = np.array([[np.nan, 1.0, 2.0],
+                            [1.0, np.nan, np.nan]])
+        ranks = interim_ranks(interim, self.meaning)
+        # Metric ranks [3, 1, 2] and [1, 2, 2]
+        self.assertEqual(ranks.tolist(), [2, 1, 2])
+
+    def test_interim_breaks_result_ties(self):
+        interim = np.array([[3.0, 1.0, 2.0, 0.0, 2.0]])
+        res = [2.0, 2.0, 1.0, 3.0, 2.0]
+        ranks = interim_ranks(interim, self.meaning[:1], res)
+        self.assertEqual(ranks.tolist(), [4, 2, 1, 5, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
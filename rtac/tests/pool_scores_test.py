@@ -0,0 +1,58 @@
+import unittest
+import sys
+sys.path.append('rtac')
+from rtac.ac_functionalities.ranking.pool_scores import PoolScores
+
+
+class TestPoolScores(unittest.TestCase):
+
+    def setUp(self):
+        # More configurations than the initial capacity of 16 rows
+        self.scores = PoolScores()
+        for i in range(40):
+            self.scores[f'c{i}'] = (float(i), 8.0 + i)
+
+    def check_index(self, expected):
+        self.assertEqual(list(self.scores), expected)
+        self.assertEqual(len(self.scores), len(expected))
+        for conf_id, row in self.scores.rows.items():
+            self.assertEqual(self.scores.ids[row], conf_id)
+        live = self.scores.live_rows().tolist()
+        self.assertEqual([self.scores.ids[row] for row in live], expected)
+
+    def test_resize_keeps_scores(self):
+        self.assertGreaterEqual(len(self.scores.mu), 40)
+        for i in range(40):
+            self.assertEqual(self.scores[f'c{i}'], (float(i), 8.0 + i))
+        self.check_index([f'c{i}' for i in range(40)])
+
+    def test_compact_after_deletes(self):
+        for i in range(40):
+            if i % 4:
+                del self.scores[f'c{i}']
+        # The arrays were compacted, so the rows were renumbered
+        self.assertLess(len(self.scores.ids), 40)
+        expected = [f'c{i}' for i in range(0, 40, 4)]
+        self.check_index(expected)
+        for i in range(0, 40, 4):
+            self.assertEqual(self.scores[f'c{i}'], (float(i), 8.0 + i))
+
+        # New configurations are appended after the remaining ones
+        self.scores['new'] = (1.5, 2.5)
+        self.check_index(expected + ['new'])
+        self.assertEqual(self.scores['new'], (1.5, 2.5))
+
+    def test_ranking_keeps_ties_in_order(self):
+        scores = PoolScores({'a': (2.0, 1.0), 'b': (1.0, 1.0),
+                             'c': (2.0, 1.0), 'd': (1.0, 1.0),
+                             'e': (3.0, 1.0)})
+        del scores['b']
+        scores['f'] = (2.0, 1.0)
+        ranked = [scores.ids[row] for row in scores.ranking().tolist()]
+        self.assertEqual(ranked, ['d', 'a', 'c', 'f', 'e'])
+        self.assertEqual(scores.rows_of(['f', 'a']).tolist(),
+                         [scores.rows['f'], scores.rows['a']])
+
+
+if __name__ == '__main__':
+    unittest.main()
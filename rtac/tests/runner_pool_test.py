@@ -0,0 +1,138 @@
+import unittest
+import sys
+import os
+import signal
+import shutil
+import tempfile
+import time
+sys.path.append('rtac')
+from rtac.utils.read_io import read_args
+from rtac.utils.core_map import CoreMap
+from rtac.wrapper.abstract_wrapper import AbstractWrapper
+from rtac.ac_functionalities.rtac_data import rtacdata_factory
+from rtac.ac_functionalities.logs import RTACLogs
+from rtac.ac_functionalities.messages import MessageType
+from rtac.ac_functionalities.ta_runner import ta_runner_factory
+from rtac.ac_functionalities.runner_pool import RunnerPool
+
+
+class SleepWrapper(AbstractWrapper):
+    """Target algorithm that sleeps for the value of -s seconds."""
+
+    def translate_config(self, config):
+        return [str(config.conf['-s'])]
+
+    def start(self, params, timelimit, instance):
+        script = f'import time; time.sleep({params[0]}); ' \
+            f'print("Time: {params[0]},"); print("Distance: 1.0,")'
+        proc = self.launch([sys.executable, '-u', '-c', script])
+
+        return proc, time.process_time_ns()
+
+    def check_if_solved(self, ta_output, nnr, proc):
+        line = ta_output.decode().strip()
+        if not line.startswith('Time:'):
+            return None
+        time = float(line.split(' ')[1][:-1])
+        while True:
+            line = nnr(proc.stdout).decode().strip()
+            if line.startswith('Distance:'):
+                res = float(line.split(' ')[1][:-1])
+                break
+        proc.stdout.close()
+
+        return res, time, 1
+
+
+class Config:
+
+    def __init__(self, conf_id, sleep):
+        self.id = conf_id
+        self.conf = {'-s': sleep}
+
+
+class TestRunnerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.log_folder = tempfile.mkdtemp()
+        scenario = read_args()
+        scenario.number_cores = 2
+        scenario.cpus = None
+        scenario.timeout = 10
+        scenario.wrapper = __name__
+        scenario.wrapper_name = 'SleepWrapper'
+        scenario.log_folder = self.log_folder
+        self.scenario = scenario
+        self.rtac_data = rtacdata_factory(scenario)
+        logs = RTACLogs(scenario)
+        logs.init_rtac_logs()
+        self.pool = RunnerPool(scenario, ta_runner_factory, logs,
+                               self.rtac_data,
+                               CoreMap(scenario))
+
+    def tearDown(self):
+        self.pool.shutdown()
+        shutil.rmtree(self.log_folder)
+
+    def submit(self, core, sleep, tourn_id):
+        config = Config(f'c{core}', sleep)
+        return self.pool.submit(core, 'instance',
+                                self.pool.translate_config(config),
+                                config.id, tourn_id)
+
+    def tournament(self, tourn_id, sleeps):
+        self.rtac_data.reset()
+        jobs = [self.submit(core, sleep, tourn_id)
+                for core, sleep in enumerate(sleeps)]
+        for job in jobs:
+            self.assertTrue(job.is_alive())
+        for job in jobs:
+            job.join(5)
+            self.assertFalse(job.is_alive())
+
+        return jobs
+
+    def test_two_tournaments(self):
+        self.tournament('t1', [0.2, 0.4])
+        # Messages of the first tournament are left unread
+        for core in range(2):
+            self.assertTrue(self.pool.channel(core).inbox)
+        self.tournament('t2', [0.3, 0.1])
+        for core in range(2):
+            messages = self.pool.channel(core).messages()
+            types = [message.type for message in messages]
+            self.assertEqual(types.count(MessageType.started), 1)
+            self.assertEqual(types[-1], MessageType.exited)
+            # Only messages of the run in the second tournament are left
+            self.assertEqual(messages[0].data, self.rtac_data.pids[core])
+            self.assertEqual(self.rtac_data.status[core], 2)
+            self.assertEqual(self.rtac_data.ta_res[core], 1.0)
+
+    def test_restart(self):
+        self.rtac_data.reset()
+        worker = self.pool.workers[0]
+        old_pid = worker.process.pid
+        job = self.submit(0, 30, 't1')
+        self.pool.channel(0).poll(5)
+        pid = self.rtac_data.pids[0]
+        job.terminate()
+        job.join(5)
+        self.assertFalse(job.is_alive())
+        self.assertFalse(worker.process.is_alive())
+        # The target algorithm leads its own process group
+        os.killpg(pid, signal.SIGKILL)
+
+        self.tournament('t2', [0.1, 0.1])
+        self.assertNotEqual(worker.process.pid, old_pid)
+        self.assertEqual(self.rtac_data.status[0], 2)
+
+    def test_shutdown(self):
+        self.tournament('t1', [0.1, 0.1])
+        self.pool.shutdown()
+        for worker in self.pool.workers:
+            self.assertFalse(worker.process.is_alive())
+            self.assertIsNotNone(worker.process.exitcode)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import sys
+import numpy as np
+sys.path.append('rtac')
+from rtac.ac_functionalities.ranking import trueskill
+from rtac.ac_functionalities.ranking.vectorized_trueskill import adjust_skills
+
+
+class Player:
+    pass
+
+
+class TestVectorizedTrueSkill(unittest.TestCase):
+
+    def adjust_players(self, mu, sigma, rank):
+        players = []
+        for m, s, r in zip(mu, sigma, rank):
+            player = Player()
+            player.skill = (m, s)
+            player.rank = r
+            players.append(player)
+        trueskill.AdjustPlayers(players)
+
+        return np.array([p.skill for p in players]).T
+
+    def test_matches_factor_graph(self):
+        rng = np.random.default_rng(1)
+        for n in (2, 3, 8, 30):
+            mu = rng.uniform(10, 40, n)
+            sigma = rng.uniform(0.5, trueskill.INITIAL_SIGMA, n)
+            # One winner as in ReACTR, a full ranking and random draws
+            one_winner = np.full(n, 2)
+            one_winner[rng.integers(n)] = 1
+            for rank in (one_winner, rng.permutation(n),
+                         rng.integers(1, 4, n)):
+                expected_mu, expected_sigma = \
+                    self.adjust_players(mu.tolist(), sigma.tolist(),
+                                        rank.tolist())
+                new_mu, new_sigma = adjust_skills(mu, sigma, rank)
+                np.testing.assert_allclose(new_mu, expected_mu, rtol=1e-9)
+                np.testing.assert_allclose(new_sigma, expected_sigma,
+                                           rtol=1e-9)
+
+    def test_single_player(self):
+        new_mu, new_sigma = adjust_skills([trueskill.INITIAL_MU],
+                                          [trueskill.INITIAL_SIGMA], [1])
+        self.assertEqual(new_mu.tolist(), [trueskill.INITIAL_MU])
+        self.assertEqual(new_sigma.tolist(), [trueskill.INITIAL_SIGMA])
+
+
+if __name__ == '__main__':
+    unittest.main()
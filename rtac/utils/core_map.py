@@ -0,0 +1,221 @@
+"""Mapping of the logical core slots of the tournaments to CPUs, based on the
+CPU topology in sysfs."""
+
+import os
+import argparse
+import warnings
+
+
+SYSFS_CPU = '/sys/devices/system/cpu'
+
+
+def parse_cpu_list(cpu_list: str) -> list[int]:
+    """
+    Parses a CPU list in the kernel format, e.g. '0-3,8,10-11'.
+
+    Parameters
+    ----------
+    cpu_list : str
+        Comma separated CPU numbers and ranges.
+
+    Returns
+    -------
+    list[int]
+        CPU numbers in the given order.
+    """
+    cpus = []
+    for part in cpu_list.strip().split(','):
+        if not part:
+            continue
+        if '-' in part:
+            first, last = part.split('-')
+            cpus.extend(range(int(first), int(last) + 1))
+        else:
+            cpus.append(int(part))
+
+    return cpus
+
+
+def parse_cpu_mask(cpu_mask: str) -> list[int]:
+    """
+    Parses a hexadecimal CPU mask, e.g. '0xf0' or 'ff,ffffffff' as in
+    `/proc/<pid>/status`.
+
+    Parameters
+    ----------
+    cpu_mask : str
+        Hexadecimal mask, bit i set means CPU i is used.
+
+    Returns
+    -------
+    list[int]
+        CPU numbers in ascending order.
+    """
+    mask = int(cpu_mask.strip().lower().removeprefix('0x').replace(',', ''),
+               16)
+
+    return [cpu for cpu in range(mask.bit_length()) if mask >> cpu & 1]
+
+
+def parse_cpus(cpus: str) -> list[int]:
+    """
+    Parses a CPU list or, if prefixed with '0x', a CPU mask.
+
+    Parameters
+    ----------
+    cpus : str
+        CPU list or mask.
+
+    Returns
+    -------
+    list[int]
+        CPU numbers.
+    """
+    if cpus.strip().lower().startswith('0x'):
+        return parse_cpu_mask(cpus)
+
+    return parse_cpu_list(cpus)
+
+
+def read_sysfs(path: str) -> str | None:
+    """
+    Reads a sysfs attribute.
+
+    Parameters
+    ----------
+    path : str
+        Path of the attribute.
+
+    Returns
+    -------
+    str | None
+        Content of the attribute or None if it is not available.
+    """
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def cpu_topology(sysfs: str = SYSFS_CPU) -> dict[int, tuple[int, int, int]]:
+    """
+    Reads NUMA node, package and core ID of all online CPUs. Missing entries
+    default to 0, and to the CPU number for the core ID.
+
+    Parameters
+    ----------
+    sysfs : str
+        Path of the CPU directory in sysfs.
+
+    Returns
+    -------
+    dict[int, tuple[int, int, int]]
+        (node, package, core) of each online CPU.
+    """
+    online = read_sysfs(f'{sysfs}/online')
+    if online is None:
+        cpus = range(os.cpu_count() or 1)
+    else:
+        cpus = parse_cpu_list(online)
+    topology = {}
+    for cpu in cpus:
+        path = f'{sysfs}/cpu{cpu}'
+        package = read_sysfs(f'{path}/topology/physical_package_id')
+        core = read_sysfs(f'{path}/topology/core_id')
+        node = 0
+        try:
+            for entry in os.listdir(path):
+                if entry.startswith('node') and entry[4:].isdigit():
+                    node = int(entry[4:])
+                    break
+        except OSError:
+            pass
+        topology[cpu] = (node,
+                         int(package) if package is not None else 0,
+                         int(core) if core is not None else cpu)
+
+    return topology
+
+
+class CoreMap:
+    """
+    Maps the logical core slots used by the tournaments to CPUs. By default
+    one slot is placed per physical core, so that hyperthread siblings stay
+    idle unless there are more slots than physical cores, and slots fill
+    one NUMA node before the next. The usable CPUs are
+    restricted to `scenario.cpus` if given, else to the CPU affinity of the
+    RTAC process.
+
+    Parameters
+    ----------
+    scenario : argparse.Namespace
+        Namespace containing all settings for the RTAC.
+    sysfs : str
+        Path of the CPU directory in sysfs. Defaults to
+        '/sys/devices/system/cpu'.
+    """
+
+    def __init__(self, scenario: argparse.Namespace,
+                 sysfs: str = SYSFS_CPU) -> None:
+        """Computes the CPU of each logical core slot."""
+        topology = cpu_topology(sysfs)
+        if scenario.cpus:
+            allowed = parse_cpus(scenario.cpus)
+            unknown = [cpu for cpu in allowed if cpu not in topology]
+            if unknown:
+                warnings.warn(f'\nCPUs {unknown} are not online and are not '
+                              'used.\n')
+        else:
+            allowed = sorted(os.sched_getaffinity(0))
+        allowed = [cpu for cpu in allowed if cpu in topology]
+        if not allowed:
+            allowed = sorted(topology)
+
+        # First CPU of each physical core, then the siblings
+        seen = set()
+        primary, siblings = [], []
+        for cpu in sorted(allowed, key=lambda cpu: (topology[cpu], cpu)):
+            if topology[cpu] in seen:
+                siblings.append(cpu)
+            else:
+                seen.add(topology[cpu])
+                primary.append(cpu)
+        slots = scenario.number_cores
+        if scenario.smt:
+            self.cpus = primary + siblings
+        elif slots > len(primary) and siblings:
+            warnings.warn(f'\n{slots} cores requested, but only '
+                          f'{len(primary)} physical cores are available. '
+                          'Hyperthread siblings are used.\n')
+            self.cpus = primary + siblings
+        else:
+            self.cpus = primary
+
+        if slots > len(self.cpus):
+            warnings.warn(f'\n{slots} cores requested, but only '
+                          f'{len(self.cpus)} CPUs {self.cpus} are available. '
+                          'Several contenders share a CPU.\n')
+        self.slots = [self.cpus[slot % len(self.cpus)]
+                      for slot in range(slots)]
+
+    def cpu(self, slot: int) -> int:
+        """
+        Returns the CPU of a logical core slot.
+
+        Parameters
+        ----------
+        slot : int
+            Logical core slot, i.e. the core index used by the tournaments.
+
+        Returns
+        -------
+        int
+            CPU number.
+        """
+        return self.slots[slot]
+
+    def __str__(self) -> str:
+        """Mapping of the logical core slots to CPUs."""
+        return 'Core map (slot: CPU): ' + ', '.join(
+            f'{slot}: {cpu}' for slot, cpu in enumerate(self.slots))
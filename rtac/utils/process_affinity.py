@@ -1,3 +1,5 @@
+from typing import Callable
+import os
 import psutil
 import subprocess
 
@@ -24,3 +26,77 @@ def set_affinity_recursive(proc: subprocess.Popen, core: int) -> None:
             child.cpu_affinity([core])
     except psutil.NoSuchProcess:
         pass
+
+
+IONICE_CLASSES = {'rt': psutil.IOPRIO_CLASS_RT,
+                  'be': psutil.IOPRIO_CLASS_BE,
+                  'idle': psutil.IOPRIO_CLASS_IDLE}
+
+
+def parse_ionice(ionice: str | None) -> tuple[int, int | None] | None:
+    """
+    Parses an I/O scheduling setting of the form 'class[:level]', with class
+    one of 'rt', 'be' and 'idle' and level from 0 (highest) to 7.
+
+    Parameters
+    ----------
+    ionice : str | None
+        I/O scheduling setting or None.
+
+    Returns
+    -------
+    tuple[int, int | None] | None
+        psutil I/O priority class and level, or None if not set.
+
+    Raises
+    ------
+    ValueError
+        If the class is unknown.
+    """
+    if not ionice:
+        return None
+    ioclass, _, level = ionice.partition(':')
+    if ioclass not in IONICE_CLASSES:
+        raise ValueError(f'Unknown I/O scheduling class {ioclass}, use one '
+                         f'of {list(IONICE_CLASSES)}.')
+    if ioclass == 'idle':
+        return IONICE_CLASSES[ioclass], None
+
+    return IONICE_CLASSES[ioclass], int(level) if level else 4
+
+
+def placement_preexec(cpu: int | None, nice: int = 0,
+                      ionice: str | None = None) -> Callable | None:
+    """
+    Creates a function to be run in the child process between fork and exec
+    (`preexec_fn` of subprocess.Popen). It binds the child to the CPU and
+    sets its scheduling and I/O priority, so that the target algorithm and
+    all processes it starts are placed from their first instruction on.
+
+    Parameters
+    ----------
+    cpu : int | None
+        CPU to bind to. None keeps the inherited affinity.
+    nice : int
+        Niceness increment. Defaults to 0.
+    ionice : str | None
+        I/O scheduling setting of the form 'class[:level]'. Defaults to None.
+
+    Returns
+    -------
+    Callable | None
+        Function to run before exec or None if there is nothing to set.
+    """
+    ioprio = parse_ionice(ionice)
+    if cpu is None and not nice and ioprio is None:
+        return None
+
+    def preexec() -> None:
+        if cpu is not None:
+            os.sched_setaffinity(0, [cpu])
+        if nice:
+            os.nice(nice)
+        if ioprio is not None:
+            psutil.Process().ionice(*ioprio)
+
+    return preexec
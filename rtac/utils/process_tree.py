@@ -0,0 +1,314 @@
+"""Functions to terminate target algorithm runs including every process they
+started, via their process group, a cgroup v2 leaf or their process tree."""
+
+import os
+import time
+import signal
+import subprocess
+import psutil
+
+
+def is_group_leader(pid: int) -> bool:
+    """
+    Checks if the process leads its own process group, i.e. was started in
+    a new session.
+
+    Parameters
+    ----------
+    pid : int
+        Process ID.
+
+    Returns
+    -------
+    bool
+        True if the process group ID equals the process ID.
+    """
+    try:
+        return os.getpgid(pid) == pid
+    except (ProcessLookupError, PermissionError):
+        return False
+
+
+def tree_members(pid: int) -> list[psutil.Process]:
+    """
+    Collects all descendants of a process. Needs to be called before the
+    process is signalled, since descendants are reparented once it exits.
+
+    Parameters
+    ----------
+    pid : int
+        Process ID of the root of the tree.
+
+    Returns
+    -------
+    list[psutil.Process]
+        Descendants of the process.
+    """
+    try:
+        return psutil.Process(pid).children(recursive=True)
+    except psutil.NoSuchProcess:
+        return []
+
+
+def signal_tree(proc: subprocess.Popen, sig: int,
+                members: list[psutil.Process], group: bool) -> None:
+    """
+    Sends a signal to the process group of the process, if it leads one, to
+    the process and to all descendants collected before. Once the process is
+    reaped its PID may be reused, so only the remaining group members are
+    signalled individually.
+
+    Parameters
+    ----------
+    proc : subprocess.Popen
+        Root of the tree.
+    sig : int
+        Signal to send.
+    members : list[psutil.Process]
+        Descendants of the process as returned by `tree_members`.
+    group : bool
+        True if the process leads its own process group.
+
+    Returns
+    -------
+    None
+    """
+    # Not polled, polling would reap the process
+    if proc.returncode is None:
+        if group:
+            try:
+                os.killpg(proc.pid, sig)
+            except (ProcessLookupError, PermissionError):
+                pass
+        proc.send_signal(sig)
+    elif group:
+        for pid in group_members(proc.pid):
+            try:
+                os.kill(pid, sig)
+            except (ProcessLookupError, PermissionError):
+                pass
+    # Descendants that left the process group
+    for member in members:
+        try:
+            member.send_signal(sig)
+        except psutil.NoSuchProcess:
+            pass
+
+
+def group_members(pgid: int) -> list[int]:
+    """
+    Lists the processes of a process group that did not exit yet, apart from
+    the group leader. Zombies are not counted.
+
+    Parameters
+    ----------
+    pgid : int
+        Process group ID, i.e. PID of the group leader.
+
+    Returns
+    -------
+    list[int]
+        Process IDs of the living group members.
+    """
+    try:
+        os.killpg(pgid, 0)
+    except (ProcessLookupError, PermissionError):
+        return []
+    pids = []
+    for proc in psutil.process_iter(['status']):
+        # A process with the PID of the group leader is the leader or, if
+        # the leader was reaped, an unrelated process reusing the PID
+        if proc.pid == pgid:
+            continue
+        try:
+            if os.getpgid(proc.pid) == pgid and \
+                    proc.info['status'] != psutil.STATUS_ZOMBIE:
+                pids.append(proc.pid)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    return pids
+
+
+def survivors(pgid: int, members: list[psutil.Process], group: bool,
+              timeout: float = 0.0) -> list[int]:
+    """
+    Waits until the process group and all collected descendants of a reaped
+    process are gone or the timeout expired.
+
+    Parameters
+    ----------
+    pgid : int
+        Process ID of the reaped root of the tree.
+    members : list[psutil.Process]
+        Descendants of the process as returned by `tree_members`.
+    group : bool
+        True if the process led its own process group.
+    timeout : float
+        Maximum time to wait in seconds. Defaults to 0.
+
+    Returns
+    -------
+    list[int]
+        Process IDs of processes that are still alive.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        # Orphaned zombies may never be reaped, but they occupy no core
+        pids = set()
+        for proc in members:
+            try:
+                if proc.status() != psutil.STATUS_ZOMBIE:
+                    pids.add(proc.pid)
+            except psutil.NoSuchProcess:
+                pass
+        if group:
+            pids.update(group_members(pgid))
+        if not pids or time.monotonic() >= deadline:
+            return sorted(pids)
+        time.sleep(0.01)
+
+
+class CgroupLeaf:
+    """
+    Leaf of the cgroup v2 hierarchy holding one target algorithm run. All
+    processes of the run can be killed at once and it can be confirmed that
+    none is left, independent of sessions and process groups.
+
+    Parameters
+    ----------
+    path : str
+        Path of the cgroup directory.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Wraps an existing cgroup directory."""
+        self.path = path
+
+    @staticmethod
+    def root() -> str | None:
+        """
+        Returns the cgroup v2 directory this process belongs to.
+
+        Returns
+        -------
+        str | None
+            Path of the directory or None if cgroup v2 is not mounted.
+        """
+        mount = None
+        try:
+            with open('/proc/self/mounts', 'r') as f:
+                for line in f:
+                    fields = line.split()
+                    if fields[2] == 'cgroup2':
+                        mount = fields[1]
+                        break
+            with open('/proc/self/cgroup', 'r') as f:
+                for line in f:
+                    if line.startswith('0::'):
+                        own = line.strip()[3:]
+                        break
+                else:
+                    return None
+        except OSError:
+            return None
+        if mount is None:
+            return None
+
+        return os.path.join(mount, own.lstrip('/'))
+
+    @classmethod
+    def create(cls, name: str) -> 'CgroupLeaf | None':
+        """
+        Creates a leaf below the cgroup of this process.
+
+        Parameters
+        ----------
+        name : str
+            Name of the leaf.
+
+        Returns
+        -------
+        CgroupLeaf | None
+            The leaf or None if cgroup v2 is not available or not writable.
+        """
+        root = cls.root()
+        if root is None:
+            return None
+        path = os.path.join(root, name)
+        try:
+            os.makedirs(path, exist_ok=True)
+        except OSError:
+            return None
+
+        return cls(path)
+
+    def add(self, pid: int) -> bool:
+        """
+        Moves a process into the leaf.
+
+        Parameters
+        ----------
+        pid : int
+            Process ID.
+
+        Returns
+        -------
+        bool
+            True if the process was moved.
+        """
+        try:
+            with open(os.path.join(self.path, 'cgroup.procs'), 'w') as f:
+                f.write(str(pid))
+            return True
+        except OSError:
+            return False
+
+    def pids(self) -> list[int]:
+        """
+        Lists the processes in the leaf.
+
+        Returns
+        -------
+        list[int]
+            Process IDs.
+        """
+        try:
+            with open(os.path.join(self.path, 'cgroup.procs'), 'r') as f:
+                return [int(line) for line in f if line.strip()]
+        except OSError:
+            return []
+
+    def kill(self) -> None:
+        """
+        Kills all processes in the leaf, via `cgroup.kill` if the kernel
+        supports it.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            with open(os.path.join(self.path, 'cgroup.kill'), 'w') as f:
+                f.write('1')
+            return
+        except OSError:
+            pass
+        for pid in self.pids():
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    def remove(self) -> None:
+        """
+        Removes the leaf. Only possible once it is empty.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            os.rmdir(self.path)
+        except OSError:
+            pass
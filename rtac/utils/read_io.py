@@ -257,6 +257,53 @@ def read_args(scenario: str = None,
                         output in seconds.''')
     parser.add_argument('-ngbf', '--nr_gb_feats', type=int, default=2, 
                         help='''Number of gray-box features used.''')
+    parser.add_argument('-gbrs', '--gb_ring_size', type=int, default=128,
+                        help='''Number of gray-box records kept per core in
+                        the shared ring buffer. Older records are
+                        overwritten.''')
+    parser.add_argument('-er', '--event_read',
+                        action=argparse.BooleanOptionalAction,
+                        default=False,
+                        help='''Block on target algorithm output via
+                        selectors instead of polling it every 5 ms.''')
+    parser.add_argument('-ae', '--async_engine',
+                        action=argparse.BooleanOptionalAction,
+                        default=False,
+                        help='''Supervise all target algorithm runs of a
+                        tournament with one asyncio event loop instead of one
+                        process per core. The wrapper needs to implement
+                        command().''')
+    parser.add_argument('-rpl', '--runner_pool',
+                        action=argparse.BooleanOptionalAction,
+                        default=False,
+                        help='''Run target algorithms from persistent,
+                        core-pinned runner workers that are reused across
+                        tournaments.''')
+    parser.add_argument('-kg', '--kill_grace', type=float, default=0.1,
+                        help='''Seconds a capped target algorithm run gets to
+                        exit after SIGTERM before it is killed with
+                        SIGKILL.''')
+    parser.add_argument('-tcg', '--ta_cgroup', default=False,
+                        action=argparse.BooleanOptionalAction,
+                        help='''Additionally place each target algorithm run
+                        in its own cgroup v2 leaf, if cgroup v2 is available
+                        and writable. Target algorithm runs are always
+                        started in their own process group.''')
+    parser.add_argument('-cpus', '--cpus', type=str, default=None,
+                        help='''CPUs to run contenders on, as list (e.g.
+                        0-3,8) or hexadecimal mask (e.g. 0xf0). Defaults to
+                        the CPU affinity of the RTAC process.''')
+    parser.add_argument('-smt', '--smt', default=False,
+                        action=argparse.BooleanOptionalAction,
+                        help='''Place contenders also on hyperthread siblings.
+                        By default one contender runs per physical core.''')
+    parser.add_argument('-nice', '--nice', type=int, default=0,
+                        help='''Niceness increment applied to the target
+                        algorithm runs before exec.''')
+    parser.add_argument('-ionice', '--ionice', type=str, default=None,
+                        help='''I/O scheduling class and level applied to the
+                        target algorithm runs before exec, as class[:level]
+                        with class rt, be or idle, e.g. be:7.''')
 
     # Read arguments from scenario file if provided and override them
     if scenario is not None:
@@ -16,6 +16,9 @@ class AbstractWrapper(ABC):
     Abstract target algorithm wrapper class.
     """
 
+    # Set by the target algorithm runner, run by `launch` before exec
+    preexec_fn = None
+
     def __init__(self):
         """
         Make sure target algorithm is executble by using absolute path to
@@ -67,13 +70,67 @@ class AbstractWrapper(ABC):
             - **proc_cpu_time** : int,
               CPU time of the subprocess.
         """
-        proc = Popen(['echo', 'Hello World!'],
-                     stdout=PIPE)
+        proc = self.launch(['echo', 'Hello World!'])
 
         proc_cpu_time = time.process_time()
 
         return proc, proc_cpu_time
 
+    def launch(self, command: list[str], **kwargs: Any) -> subprocess.Popen:
+        """
+        Starts the target algorithm in its own session, so that it leads a
+        new process group. Terminating the run signals the whole group and
+        thereby every process the target algorithm started. CPU affinity and
+        priority set by the target algorithm runner are applied in the child
+        before exec via `preexec_fn`.
+
+        Parameters
+        ----------
+        command : list of str
+            Program and arguments to execute.
+        **kwargs : Any
+            Further keyword arguments passed to subprocess.Popen.
+
+        Returns
+        -------
+        subprocess.Popen
+            The process started with the target algorithm.
+        """
+        kwargs.setdefault('stdout', PIPE)
+        kwargs.setdefault('preexec_fn', self.preexec_fn)
+
+        return Popen(command, start_new_session=True, **kwargs)
+
+    def command(self, params: Any, timelimit: int,
+                instance: str) -> list[str]:
+        """
+        Returns the command line that starts the target algorithm. Needed by
+        the asyncio tournament engine (`scenario.async_engine`), which starts
+        the target algorithm itself instead of calling `start`.
+
+        Parameters
+        ----------
+        params : Any
+            Parameters in a format as needed for target algorithm.
+        timelimit : int
+            Maximum runtime allowed for target algorithm run in seconds.
+        instance : str
+            Path to problem instance.
+
+        Returns
+        -------
+        list of str
+            Program and arguments to execute.
+
+        Raises
+        ------
+        NotImplementedError
+            If the wrapper does not support the asyncio tournament engine.
+        """
+        raise NotImplementedError(
+            f'{type(self).__name__} does not implement command(), which is '
+            'needed for the asyncio tournament engine.')
+
     @abstractmethod
     def check_if_solved(self, ta_output: bytes, nnr: non_block_read,
                         proc: subprocess.Popen) -> tuple[
@@ -1,6 +1,5 @@
 """This module implements the target algorithm wrapper for CaDiCaL 1.2.1.""" 
 
-from subprocess import Popen, PIPE
 import subprocess
 from typing import Any
 import time
@@ -36,19 +35,21 @@ class TSP_RT(AbstractWrapper):
             List of strings representation of the configuration.
         """
         config_list = []
-        config.conf['-a'] = 0.9  # runtime scenario: fixed annealing factor
-        for name, param in config.conf.items():
+        # Runtime scenario: fixed annealing factor. Set on a copy, the
+        # Configuration stays unchanged in the pool.
+        conf = dict(config.conf)
+        conf['-a'] = 0.9
+        for name, param in conf.items():
             config_list.append(name)
             config_list.append(str(param))
 
         return config_list
 
-    def start(self, config: Any, timeout: int,
-              instance: str) -> tuple[subprocess.Popen, int]:
+    def command(self, config: Any, timeout: int,
+                instance: str) -> list[str]:
         """
-        Start CaDiCaL via subprocess.Popen with stdout set to subprocess.PIPE,
-        using the given configuration on the specified instance with a time 
-        limit.
+        Command line to start Python-TSP with the given configuration on the
+        specified instance with a time limit.
 
         Parameters
         ----------
@@ -61,9 +62,8 @@ class TSP_RT(AbstractWrapper):
 
         Returns
         -------
-        tuple of (subprocess.Popen, int)
-            Target algorithm subprocess.Popen process and the start time of 
-            the process.
+        list of str
+            Program and arguments to execute.
         """
         # Absolute path to the current file
         file_path = os.path.abspath(__file__)
@@ -72,14 +72,37 @@ class TSP_RT(AbstractWrapper):
         file_dir = os.path.dirname(file_path)
         file_dir = file_dir.split('wrapper')[0]
 
-        proc = Popen(['python3',
-                      f'{file_dir}data/solvers/python-tsp.py',
-                      *config, '-t', str(timeout), '-i',
-                      f'{file_dir}{instance}'],
-                     stdout=PIPE)
-
         self.timeout = timeout
 
+        return ['python3',
+                f'{file_dir}data/solvers/python-tsp.py',
+                *config, '-t', str(timeout), '-i',
+                f'{file_dir}{instance}']
+
+    def start(self, config: Any, timeout: int,
+              instance: str) -> tuple[subprocess.Popen, int]:
+        """
+        Start CaDiCaL via subprocess.Popen with stdout set to subprocess.PIPE,
+        using the given configuration on the specified instance with a time 
+        limit.
+
+        Parameters
+        ----------
+        config : Any
+            Parameters in the format required by the target algorithm.
+        timeout : int
+            Maximum runtime allowed for the target algorithm run in seconds.
+        instance : str
+            Path to the problem instance.
+
+        Returns
+        -------
+        tuple of (subprocess.Popen, int)
+            Target algorithm subprocess.Popen process and the start time of 
+            the process.
+        """
+        proc = self.launch(self.command(config, timeout, instance))
+
         proc_cpu_time = time.process_time_ns()
 
         return proc, proc_cpu_time